@@ -0,0 +1,139 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class BatchedLogHandler_class(logging.Handler):
+    """
+    Log file handler that writes from a background thread, in batches, with a bounded flush interval.
+
+    Purpose:
+    --------
+    A logging.FileHandler formats, writes and flushes every record on the thread that
+    logged it, under the handler's lock, so every copy worker waits on the log file
+    for each of its lines. Here emit() only queues the record: a writer thread formats
+    whatever has queued up (up to C.COPY_LOG_BATCH_LINES records), writes it with one
+    write, and flushes the file once lines have been waiting
+    C.COPY_LOG_FLUSH_INTERVAL_SECONDS, so lines reach the file at most that long after
+    being logged however busy or idle the copy is. Records keep the order they were
+    logged in. flush() waits until everything logged so far is on the file, and
+    close() writes out the rest before closing it.
+    baseFilename is the log file's path, as for logging.FileHandler.
+
+    Usage:
+    ------
+    handler = BatchedLogHandler_class("foldercomparesync_copy_20250101_120000_abcd1234.log")
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    operation_logger.addHandler(handler)
+    ...
+    handler.close()                # writes the remaining lines and stops the writer thread
+    """
+
+    _STOP = object()   # queued by close()
+
+    def __init__(self, filename: str, mode: str = 'w', encoding: str = 'utf-8',
+                 batch_lines: Optional[int] = None, flush_interval_seconds: Optional[float] = None):
+        """
+        Open the log file and start the writer thread.
+
+        Args:
+        -----
+        filename: Log file path
+        mode: File open mode ('w' or 'a')
+        encoding: File encoding
+        batch_lines: Most records per write, defaults to C.COPY_LOG_BATCH_LINES
+        flush_interval_seconds: Longest a written line waits to be flushed, defaults to C.COPY_LOG_FLUSH_INTERVAL_SECONDS
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.batch_lines = max(1, int(batch_lines if batch_lines is not None else C.COPY_LOG_BATCH_LINES))
+        self.flush_interval_seconds = max(0.0, float(flush_interval_seconds if flush_interval_seconds is not None
+                                                     else C.COPY_LOG_FLUSH_INTERVAL_SECONDS))
+        self.records_written = 0
+        self.write_count = 0
+        self.flush_count = 0
+        self._stream = open(self.baseFilename, mode, encoding=encoding)
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._writer, name=f"log_writer_{os.path.basename(filename)}", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue the record for the writer thread (formatted there)."""
+        self._queue.put(record)
+
+    def flush(self) -> None:
+        """Wait until every record logged so far has been written and flushed."""
+        if self._thread is None or threading.current_thread() is self._thread:
+            return
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        flushed.wait()
+
+    def close(self) -> None:
+        """Write out the queued records, stop the writer thread and close the file."""
+        with self.lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(BatchedLogHandler_class._STOP)
+            thread.join()
+            self._stream.close()
+        super().close()
+
+    def _writer(self) -> None:
+        """Writer thread: format and write queued records in batches, flushing within the flush interval."""
+        dirty_since = None   # time of the oldest written line not yet flushed
+        while True:
+            timeout = None if dirty_since is None else max(0.0, dirty_since + self.flush_interval_seconds - time.monotonic())
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self.batch_lines:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            waiters = []
+            stop = False
+            for item in batch:
+                if item is BatchedLogHandler_class._STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    try:
+                        lines.append(self.format(item))
+                    except Exception:
+                        self.handleError(item)
+            try:
+                if lines:
+                    self._stream.write("\n".join(lines) + "\n")
+                    self.records_written += len(lines)
+                    self.write_count += 1
+                    if dirty_since is None:
+                        dirty_since = time.monotonic()
+                if dirty_since is not None and (waiters or stop or time.monotonic() - dirty_since >= self.flush_interval_seconds):
+                    self._stream.flush()
+                    self.flush_count += 1
+                    dirty_since = None
+            except Exception:
+                dirty_since = None
+                record = next((item for item in batch if isinstance(item, logging.LogRecord)), None)
+                if record is not None:
+                    self.handleError(record)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
@@ -0,0 +1,431 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+from FileCopyManager_class import FileCopyManager_class
+from DriveClassifier_class import DriveClassifier_class # v002.0019 added
+from DisplayFormatter_class import DisplayFormatter_class # v002.0026 added
+
+class CopyPlan_class:
+    """
+    Copy plan compiled once from comparison results, executed by CopyScheduler_class.
+
+    Purpose:
+    --------
+    Previously every selected path was checked with exists/is_file/stat before copying,
+    copy_file repeated those checks, and each strategy method stat'ed the source again
+    and looked up both drive types. On network shares every one of those is a round-trip.
+    The plan is built from the metadata the comparison already gathered:
+    - directory operations, ordered shallowest first, with whether the target exists
+    - file operations, in selection order, with size, modification time, whether the
+      target exists and the copy strategy (drive types are looked up once per plan)
+    - selected items missing on the source side, which are skipped
+    check_free_space() prechecks the disk space the whole plan needs per target volume. # v002.0019 added
+    With C.COPY_PRESERVE_HARDLINKS, selected files which are hardlinks of each other on # v002.0021 added
+    the source are grouped by inode: the first is copied, the others are planned as
+    hardlinks to its copy (link_source) when their targets are on the same volume.
+    The plan is not modified after it is built (operations are frozen dataclasses held in
+    tuples). The executor makes one freshness stat per file and only re-plans a file whose
+    size or modification time changed since the comparison.
+    A cancelled copy saves the rest of its plan (remaining() then to_dict()) in its # v002.0025 added
+    checkpoint; from_dict() rebuilds it, so a later run continues without a comparison.
+    A dry run in "plan" mode (C.COPY_DRY_RUN_MODE) only summarizes the plan: summarize(), # v002.0026 added
+    estimate_seconds() and report_lines(), and optionally write_plan_file() - no file is
+    stat'ed, opened or logged per file.
+
+    Usage:
+    ------
+    plan = CopyPlan_class.from_comparison(comparison_results, selected_paths, 'left', source_folder, dest_folder)
+    print(plan.total_bytes, plan.strategy_counts())
+    summary = CopyScheduler_class(copy_manager, source_folder, dest_folder).run_plan(plan)
+    rest = CopyPlan_class.from_dict(plan.remaining(summary.done_paths).to_dict())   # via a checkpoint # v002.0025 added
+    """
+
+    @dataclass(frozen=True)
+    class DirectoryOp:
+        """Create (or update the timestamps of) one target directory."""
+        rel_path: str
+        source_path: str
+        dest_path: str
+        dest_exists: bool
+
+    @dataclass(frozen=True)
+    class FileOp:
+        """Copy one file."""
+        rel_path: str
+        source_path: str
+        dest_path: str
+        size: int
+        mtime: Optional[float]                          # source modification time (epoch seconds) when planned, None if unknown
+        strategy: FileCopyManager_class.CopyStrategy
+        dest_exists: bool
+        dest_size: int = 0                              # size of the existing target (0 if none) # v002.0019 added
+        link_source: Optional[str] = None               # target of the copied member of this file's source hardlink group, to link to # v002.0021 added
+        delta_journal_exists: bool = False              # an interrupted DELTA update left its undo journal beside the target, replayed before copying # v002.0014 added
+
+    @dataclass
+    class PlanSummary: # v002.0026 added
+        """Counts and bytes of a plan, for a dry run report (see summarize)."""
+        directories_to_create: int = 0
+        directories_existing: int = 0                                   # only their timestamps are updated
+        files: int = 0
+        files_new: int = 0
+        files_overwrite: int = 0                                        # targets which exist and are replaced (or delta updated)
+        bytes_to_copy: int = 0
+        bytes_overwritten: int = 0                                      # size of the existing targets replaced
+        bytes_linked: int = 0                                           # not copied: recreated as hardlinks
+        missing: int = 0
+        strategy_files: dict[str, int] = field(default_factory=dict)    # CopyStrategy.value -> files
+        strategy_bytes: dict[str, int] = field(default_factory=dict)    # CopyStrategy.value -> bytes
+
+    @dataclass(frozen=True)
+    class SpaceShortfall: # v002.0019 added
+        """A target volume without enough free space for the plan."""
+        volume: str
+        required_bytes: int
+        free_bytes: int
+
+    def __init__(self, directories: list[CopyPlan_class.DirectoryOp], files: list[CopyPlan_class.FileOp], missing: list[str]):
+        """
+        Hold the planned operations (use from_comparison or from_paths to build a plan).
+
+        Args:
+        -----
+        directories: Directory operations, in any order (stored shallowest first)
+        files: File operations, in execution order
+        missing: Selected rel_paths which do not exist on the source side
+        """
+        self.directories: tuple[CopyPlan_class.DirectoryOp, ...] = tuple(
+            sorted(directories, key=lambda op: (op.rel_path.count('/'), op.rel_path)))
+        self.files: tuple[CopyPlan_class.FileOp, ...] = tuple(files)
+        self.missing: tuple[str, ...] = tuple(missing)
+        self.total_bytes = sum(op.size for op in self.files if op.link_source is None)    # bytes to copy # v002.0021 changed
+        self.linked_bytes = sum(op.size for op in self.files if op.link_source is not None)  # bytes not copied, as hardlinks # v002.0021 added
+        self.item_count = len(self.directories) + len(self.files) + len(self.missing)
+
+    def strategy_counts(self) -> dict[str, int]:
+        """Planned CopyStrategy.value -> number of files."""
+        counts = {}
+        for op in self.files:
+            strategy = FileCopyManager_class.CopyStrategy.HARDLINK if op.link_source is not None else op.strategy # v002.0021 changed
+            counts[strategy.value] = counts.get(strategy.value, 0) + 1
+        return counts
+
+    def check_free_space(self) -> list[CopyPlan_class.SpaceShortfall]: # v002.0019 added
+        """
+        Disk space precheck over the whole plan, one shutil.disk_usage call per target volume.
+
+        Purpose:
+        --------
+        A copy which runs out of space part way wastes everything copied so far. For each
+        target volume the plan needs the net growth of every file (source size less the
+        size of the target it replaces), plus room for the largest replaced file to exist
+        twice while it is staged (temp copy, or backup, alongside the original).
+
+        Returns:
+        --------
+        list[SpaceShortfall]: Volumes without enough free space (empty if all fit, or
+        where free space cannot be determined)
+        """
+        classifier = DriveClassifier_class.shared()
+        required = {}       # volume -> (net growth bytes, staging bytes)
+        probe_paths = {}    # volume -> a target path on it
+        for op in self.files:
+            if op.link_source is not None:
+                continue  # hardlinks take no data space # v002.0021 added
+            volume = classifier.volume(op.dest_path)
+            growth, staging = required.get(volume, (0, 0))
+            growth += max(op.size - op.dest_size, 0)
+            if op.dest_exists and op.strategy != FileCopyManager_class.CopyStrategy.DELTA:  # DELTA updates in place
+                staging = max(staging, min(op.size, op.dest_size))
+            required[volume] = (growth, staging)
+            probe_paths.setdefault(volume, op.dest_path)
+
+        shortfalls = []
+        for volume, (growth, staging) in required.items():
+            required_bytes = growth + staging
+            if required_bytes == 0:
+                continue
+            # Nearest existing folder on the volume (target folders may not exist yet)
+            probe = os.path.dirname(probe_paths[volume])
+            while probe and not os.path.isdir(probe):
+                parent = os.path.dirname(probe)
+                if parent == probe:
+                    break
+                probe = parent
+            try:
+                free_bytes = shutil.disk_usage(probe).free
+            except OSError as e:
+                log_and_flush(logging.WARNING, f"CopyPlan_class: could not determine free space on {volume or probe}: {e}")
+                continue
+            if free_bytes < required_bytes:
+                shortfalls.append(CopyPlan_class.SpaceShortfall(volume or probe, required_bytes, free_bytes))
+        return shortfalls
+
+    def remaining(self, done_paths: set[str]) -> CopyPlan_class: # v002.0025 added
+        """The plan less the items in done_paths (rel_paths completed by an earlier run), in the same order."""
+        return CopyPlan_class([op for op in self.directories if op.rel_path not in done_paths],
+                              [op for op in self.files if op.rel_path not in done_paths],
+                              [rel_path for rel_path in self.missing if rel_path not in done_paths])
+
+    def rel_paths(self) -> list[str]: # v002.0025 added
+        """Relative paths of every item in the plan (directories, files, then missing items)."""
+        return [op.rel_path for op in self.directories] + [op.rel_path for op in self.files] + list(self.missing)
+
+    def to_dict(self) -> dict[str, Any]: # v002.0025 added
+        """The plan as JSON serializable data (for a checkpoint), rebuilt by from_dict."""
+        return {
+            "directories": [dataclasses.asdict(op) for op in self.directories],
+            "files": [{**dataclasses.asdict(op), "strategy": op.strategy.value} for op in self.files],
+            "missing": list(self.missing),
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> CopyPlan_class: # v002.0025 added
+        """Rebuild a plan saved by to_dict (eg from a checkpoint of a cancelled copy)."""
+        return CopyPlan_class(
+            [CopyPlan_class.DirectoryOp(**op) for op in data.get("directories", [])],
+            [CopyPlan_class.FileOp(**{**op, "strategy": FileCopyManager_class.CopyStrategy(op["strategy"])}) for op in data.get("files", [])],
+            data.get("missing", []))
+
+    def summarize(self) -> CopyPlan_class.PlanSummary: # v002.0026 added
+        """Counts and bytes per category and strategy, from the plan alone."""
+        summary = CopyPlan_class.PlanSummary(missing=len(self.missing), files=len(self.files),
+                                             bytes_to_copy=self.total_bytes, bytes_linked=self.linked_bytes)
+        for op in self.directories:
+            if op.dest_exists:
+                summary.directories_existing += 1
+            else:
+                summary.directories_to_create += 1
+        for op in self.files:
+            if op.dest_exists:
+                summary.files_overwrite += 1
+                summary.bytes_overwritten += op.dest_size
+            else:
+                summary.files_new += 1
+            strategy = FileCopyManager_class.CopyStrategy.HARDLINK if op.link_source is not None else op.strategy
+            summary.strategy_files[strategy.value] = summary.strategy_files.get(strategy.value, 0) + 1
+            summary.strategy_bytes[strategy.value] = summary.strategy_bytes.get(strategy.value, 0) + op.size
+        return summary
+
+    def estimate_seconds(self, bytes_per_second: float, seconds_per_file: float, workers: int,
+                         bytes_per_second_limit: float = 0, files_per_second_limit: float = 0) -> float: # v002.0026 added
+        """
+        Estimated copy time: the bytes at the (possibly rate limited) bandwidth, plus the per-item overhead spread over the workers.
+
+        Args:
+        -----
+        bytes_per_second: Expected copy bandwidth (eg observed in the last copy, else C.COPY_PLAN_ESTIMATE_BYTES_PER_SECOND)
+        seconds_per_file: Expected per-file (and per-directory) overhead on one worker
+        workers: Copy workers (C.COPY_WORKER_COUNT)
+        bytes_per_second_limit: Bandwidth limit, 0 = unlimited
+        files_per_second_limit: Files per second limit, 0 = unlimited
+
+        Returns:
+        --------
+        float: Estimated seconds
+        """
+        if bytes_per_second_limit:
+            bytes_per_second = min(bytes_per_second, bytes_per_second_limit)
+        seconds = self.total_bytes / max(bytes_per_second, 1.0)
+        seconds += (len(self.files) + len(self.directories)) * seconds_per_file / max(1, workers)
+        if files_per_second_limit:
+            seconds = max(seconds, len(self.files) / files_per_second_limit)
+        return seconds
+
+    def report_lines(self, estimate_seconds: Optional[float] = None, estimate_basis: str = "") -> list[str]: # v002.0026 added
+        """The plan summary as report lines (counts, bytes per strategy, overwrites and the estimated duration)."""
+        summary = self.summarize()
+        size = DisplayFormatter_class.format_size
+        lines = [
+            f"Directories: {summary.directories_to_create:,} to create, {summary.directories_existing:,} existing (timestamps updated)",
+            f"Files: {summary.files:,} ({summary.files_new:,} new, {summary.files_overwrite:,} overwritten), {size(summary.bytes_to_copy)} to copy",
+        ]
+        if summary.files_overwrite:
+            lines.append(f"Overwrites: {summary.files_overwrite:,} existing files ({size(summary.bytes_overwritten)}) replaced")
+        for strategy in FileCopyManager_class.CopyStrategy:
+            if summary.strategy_files.get(strategy.value):
+                not_copied = " not copied" if strategy == FileCopyManager_class.CopyStrategy.HARDLINK else ""
+                lines.append(f"  {strategy.value}: {summary.strategy_files[strategy.value]:,} files, "
+                             f"{size(summary.strategy_bytes[strategy.value])}{not_copied}")
+        if summary.missing:
+            lines.append(f"Missing on the source (skipped): {summary.missing:,}")
+        if estimate_seconds is not None:
+            minutes, seconds = divmod(int(round(estimate_seconds)), 60)
+            hours, minutes = divmod(minutes, 60)
+            duration = f"{hours}h {minutes:02d}m {seconds:02d}s" if hours else f"{minutes}m {seconds:02d}s"
+            lines.append(f"Estimated duration: {duration}" + (f" ({estimate_basis})" if estimate_basis else ""))
+        return lines
+
+    def write_plan_file(self, path: str, metadata: dict[str, Any]) -> str: # v002.0026 added
+        """
+        Write the plan as JSON: metadata, the summary and every operation (to_dict), returning the path.
+
+        Args:
+        -----
+        path: Plan file to write (replaced if it exists)
+        metadata: JSON serializable details of the operation (folders, direction, estimate, ...)
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({**metadata, "summary": dataclasses.asdict(self.summarize()), "plan": self.to_dict()}, f, indent=1)
+        return path
+
+    @staticmethod
+    def _link_hardlink_groups(files: list[CopyPlan_class.FileOp], link_keys: list[Optional[tuple]]) -> list[CopyPlan_class.FileOp]: # v002.0021 added
+        """
+        Plan the later members of each source hardlink group as links to the first member's target.
+        
+        Args:
+        -----
+        files: File operations, in execution order
+        link_keys: Source (st_dev, st_ino) of each file op, None for files with a single link
+        
+        Returns:
+        --------
+        list[FileOp]: The file operations, with link_source set where a link can replace a copy
+        """
+        if not C.COPY_PRESERVE_HARDLINKS:
+            return files
+        classifier = DriveClassifier_class.shared()
+        first_members = {}  # link key -> first file op of the group
+        linked_files = []
+        for op, link_key in zip(files, link_keys):
+            first = first_members.setdefault(link_key, op) if link_key is not None else op
+            if first is not op and first.size == op.size and classifier.volume(first.dest_path) == classifier.volume(op.dest_path):
+                op = dataclasses.replace(op, link_source=first.dest_path)
+            linked_files.append(op)
+        return linked_files
+    
+    @staticmethod
+    def _partial_rel_path(rel_path: str) -> str:
+        """Relative path of the journal of an unfinished RESUMABLE copy of rel_path."""
+        return rel_path + C.COPY_RESUMABLE_PARTIAL_SUFFIX + C.COPY_RESUMABLE_JOURNAL_SUFFIX
+
+    @staticmethod
+    def _delta_journal_rel_path(rel_path: str) -> str: # v002.0014 added
+        """Relative path of the undo journal of an interrupted DELTA update of rel_path."""
+        return rel_path + C.COPY_DELTA_JOURNAL_SUFFIX
+
+    @staticmethod
+    def from_comparison(comparison_results: dict, selected_paths: list[str], source_side: str,
+                        source_folder: str, dest_folder: str) -> CopyPlan_class:
+        """
+        Build a plan from comparison results, without touching the file system (bar two drive type lookups).
+
+        Args:
+        -----
+        comparison_results: rel_path -> FolderCompareSync_class.ComparisonResult_class
+        selected_paths: Relative paths (files and folders) to copy
+        source_side: Side being copied from (LEFT_SIDE_LOWERCASE or RIGHT_SIDE_LOWERCASE)
+        source_folder: Root folder items are copied from
+        dest_folder: Root folder items are copied to
+
+        Returns:
+        --------
+        CopyPlan_class: The compiled plan
+        """
+        start_time = time.time()
+        from_left = source_side.lower() == C.LEFT_SIDE_LOWERCASE
+        source_drive_type = FileCopyManager_class.get_drive_type(source_folder)
+        target_drive_type = FileCopyManager_class.get_drive_type(dest_folder)
+
+        def sides(rel_path):
+            result = comparison_results.get(rel_path)
+            if result is None:
+                return None, None
+            return (result.left_item, result.right_item) if from_left else (result.right_item, result.left_item)
+
+        directories = []
+        files = []
+        link_keys = [] # v002.0021 added
+        missing = []
+        for rel_path in selected_paths:
+            source_item, dest_item = sides(rel_path)
+            source_path = str(Path(source_folder) / rel_path)
+            dest_path = str(Path(dest_folder) / rel_path)
+            dest_exists = bool(dest_item and dest_item.exists)
+            dest_size = (dest_item.size or 0) if dest_exists and not dest_item.is_folder else 0 # v002.0019 added
+            if not source_item or not source_item.exists:
+                missing.append(rel_path)
+            elif source_item.is_folder:
+                directories.append(CopyPlan_class.DirectoryOp(rel_path, source_path, dest_path, dest_exists))
+            else:
+                size = source_item.size or 0
+                _, partial_item = sides(CopyPlan_class._partial_rel_path(rel_path))
+                strategy = FileCopyManager_class.choose_copy_strategy(
+                    size, source_drive_type, target_drive_type, dest_exists, bool(partial_item and partial_item.exists),
+                    dest_exists and dest_item.link_key is not None) # v002.0014 changed [no in-place DELTA update of a hardlinked target]
+                mtime = source_item.date_modified.timestamp() if source_item.date_modified else None
+                _, delta_journal_item = sides(CopyPlan_class._delta_journal_rel_path(rel_path)) # v002.0014 added
+                files.append(CopyPlan_class.FileOp(rel_path, source_path, dest_path, size, mtime, strategy, dest_exists, dest_size,
+                                                   delta_journal_exists=bool(delta_journal_item and delta_journal_item.exists)))
+                link_keys.append(source_item.link_key) # v002.0021 added
+
+        plan = CopyPlan_class(directories, CopyPlan_class._link_hardlink_groups(files, link_keys), missing) # v002.0021 changed
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"CopyPlan_class: planned {len(plan.directories):,} directories, {len(plan.files):,} files "
+                                         f"({plan.total_bytes:,} bytes, {plan.linked_bytes:,} bytes as hardlinks), {len(plan.missing):,} missing, " # v002.0021 changed
+                                         f"in {(time.time() - start_time) * 1000:.1f} ms")
+        return plan
+
+    @staticmethod
+    def from_paths(selected_paths: list[str], source_folder: str, dest_folder: str) -> CopyPlan_class:
+        """
+        Build a plan by stat'ing the selected paths, for callers without comparison results.
+
+        Args:
+        -----
+        selected_paths: Relative paths (files and folders) to copy
+        source_folder: Root folder items are copied from
+        dest_folder: Root folder items are copied to
+
+        Returns:
+        --------
+        CopyPlan_class: The compiled plan
+        """
+        source_drive_type = FileCopyManager_class.get_drive_type(source_folder)
+        target_drive_type = FileCopyManager_class.get_drive_type(dest_folder)
+        directories = []
+        files = []
+        link_keys = [] # v002.0021 added
+        missing = []
+        for rel_path in selected_paths:
+            source_path = str(Path(source_folder) / rel_path)
+            dest_path = str(Path(dest_folder) / rel_path)
+            try:
+                source_stat = os.stat(source_path)
+            except OSError:
+                missing.append(rel_path)
+                continue
+            try: # v002.0019 changed [stat for the existing target size]
+                dest_stat = os.stat(dest_path)
+                dest_exists = True
+                dest_size = 0 if stat.S_ISDIR(dest_stat.st_mode) else dest_stat.st_size
+                dest_hardlinked = not stat.S_ISDIR(dest_stat.st_mode) and dest_stat.st_nlink > 1 # v002.0014 added
+            except OSError:
+                dest_exists = False
+                dest_size = 0
+                dest_hardlinked = False
+            if stat.S_ISDIR(source_stat.st_mode):
+                directories.append(CopyPlan_class.DirectoryOp(rel_path, source_path, dest_path, dest_exists))
+            else:
+                partial_exists = os.path.exists(str(Path(dest_folder) / CopyPlan_class._partial_rel_path(rel_path)))
+                strategy = FileCopyManager_class.choose_copy_strategy(
+                    source_stat.st_size, source_drive_type, target_drive_type, dest_exists, partial_exists,
+                    dest_hardlinked) # v002.0014 changed [no in-place DELTA update of a hardlinked target]
+                delta_journal_exists = os.path.exists(str(Path(dest_folder) / CopyPlan_class._delta_journal_rel_path(rel_path))) # v002.0014 added
+                files.append(CopyPlan_class.FileOp(rel_path, source_path, dest_path, source_stat.st_size,
+                                                   source_stat.st_mtime, strategy, dest_exists, dest_size,
+                                                   delta_journal_exists=delta_journal_exists))
+                link_keys.append((source_stat.st_dev, source_stat.st_ino) if source_stat.st_nlink > 1 and source_stat.st_ino else None) # v002.0021 added
+        return CopyPlan_class(directories, CopyPlan_class._link_hardlink_groups(files, link_keys), missing) # v002.0021 changed
@@ -0,0 +1,216 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class CopyRateLimiter_class:
+    """
+    Token bucket limits on copy bandwidth (bytes/s) and IOPS (files/s), shared by all copy workers.
+
+    Purpose:
+    --------
+    On shared storage (a NAS, a file server in use) a full speed copy can starve
+    everyone else. The limiter holds two token buckets, one in bytes and one in files,
+    each refilled at its limit per second and holding at most
+    COPY_RATE_LIMIT_BURST_SECONDS worth of tokens. Every copy worker charges the bytes
+    it moves and the files it starts against the same limiter, so the limits apply to
+    the copy as a whole however many workers run.
+
+    A worker takes tokens once the bucket is not in debt, which may put the bucket into
+    debt by up to one chunk; the next worker then waits for the debt to be repaid. The
+    average rate is therefore exact whatever the chunk size, and max_chunk_size() keeps
+    the chunks (and so the bursts) to a tenth of a second's worth while limited. Waits
+    are taken in short slices, so a limit changed while copying (set_limits, eg from the
+    progress dialog) applies within COPY_RATE_LIMIT_RECHECK_SECONDS.
+
+    A limit of 0 means unlimited; with both limits 0 the limiter only counts.
+
+    Usage:
+    ------
+    limiter = CopyRateLimiter_class(bytes_per_second=50 * 1024 * 1024, files_per_second=200)
+    limiter.acquire_files()                              # before each file
+    callback = limiter.wrap_progress(progress_callback)  # charges each chunk's bytes
+    limiter.set_limits(bytes_per_second=0)               # live change: remove the bandwidth limit
+    stats = limiter.statistics()                         # effective rates and time spent waiting
+    """
+
+    @dataclass
+    class Statistics:
+        """Traffic through the limiter since reset()."""
+        bytes_charged: int = 0
+        files_charged: int = 0
+        elapsed_seconds: float = 0.0
+        throttled_seconds: float = 0.0       # summed over workers (several may wait at once)
+        bytes_per_second_limit: float = 0    # current limits (0 = unlimited)
+        files_per_second_limit: float = 0
+        limit_changes: int = 0
+
+        @property
+        def bytes_per_second(self) -> float:
+            return self.bytes_charged / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+        @property
+        def files_per_second(self) -> float:
+            return self.files_charged / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    class _Bucket:
+        """One token bucket (caller holds the limiter's lock)."""
+
+        def __init__(self):
+            self.rate = 0.0      # tokens per second, 0 = unlimited
+            self.tokens = 0.0    # may go negative (debt)
+            self.time = time.perf_counter()
+
+        def set_rate(self, rate: float) -> None:
+            self.refill()
+            self.rate = max(0.0, float(rate))
+            self.tokens = min(self.tokens, self.capacity())
+
+        def capacity(self) -> float:
+            return self.rate * C.COPY_RATE_LIMIT_BURST_SECONDS
+
+        def refill(self) -> None:
+            now = time.perf_counter()
+            if self.rate:
+                self.tokens = min(self.capacity(), self.tokens + (now - self.time) * self.rate)
+            self.time = now
+
+        def take(self, amount: float) -> float:
+            """Take amount tokens if the bucket is not in debt, returning 0, else the seconds until it is not."""
+            if not self.rate:
+                return 0.0
+            self.refill()
+            if self.tokens >= 0:
+                self.tokens -= amount
+                return 0.0
+            return -self.tokens / self.rate
+
+    def __init__(self, bytes_per_second: float = 0, files_per_second: float = 0):
+        """
+        Initialize the limiter.
+
+        Args:
+        -----
+        bytes_per_second: Bandwidth limit, 0 for unlimited
+        files_per_second: Files started per second limit, 0 for unlimited
+        """
+        self._lock = threading.Lock()
+        self._bytes = CopyRateLimiter_class._Bucket()
+        self._files = CopyRateLimiter_class._Bucket()
+        self._bytes.set_rate(bytes_per_second)
+        self._files.set_rate(files_per_second)
+        self._statistics = CopyRateLimiter_class.Statistics()
+        self._start_time = time.perf_counter()
+
+    def set_limits(self, bytes_per_second: Optional[float] = None, files_per_second: Optional[float] = None) -> None:
+        """Change either limit (None leaves it unchanged, 0 removes it); safe while copying, from any thread."""
+        with self._lock:
+            changed = False
+            if bytes_per_second is not None and max(0.0, float(bytes_per_second)) != self._bytes.rate:
+                self._bytes.set_rate(bytes_per_second)
+                changed = True
+            if files_per_second is not None and max(0.0, float(files_per_second)) != self._files.rate:
+                self._files.set_rate(files_per_second)
+                changed = True
+            if changed:
+                self._statistics.limit_changes += 1
+        if changed:
+            log_and_flush(logging.INFO, f"Copy rate limit set to {CopyRateLimiter_class.format_limits(*self.limits)}")
+
+    @property
+    def limits(self) -> tuple[float, float]:
+        """Current (bytes_per_second, files_per_second) limits, 0 = unlimited."""
+        return self._bytes.rate, self._files.rate
+
+    @property
+    def is_limited(self) -> bool:
+        return bool(self._bytes.rate or self._files.rate)
+
+    def max_chunk_size(self) -> Optional[int]:
+        """Largest chunk to copy at once while bandwidth is limited (a tenth of a second's worth), else None."""
+        rate = self._bytes.rate
+        if not rate:
+            return None
+        return max(C.COPY_RATE_LIMIT_MIN_CHUNK_SIZE, int(rate / 10))
+
+    def _acquire(self, bucket: CopyRateLimiter_class._Bucket, amount: float) -> None:
+        """Wait until bucket can give amount tokens, then take them, counting the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = bucket.take(amount)
+                if not wait:
+                    self._statistics.throttled_seconds += waited
+                    return
+            wait = min(wait, C.COPY_RATE_LIMIT_RECHECK_SECONDS)
+            time.sleep(wait)
+            waited += wait
+
+    def acquire_bytes(self, byte_count: int) -> None:
+        """Charge byte_count bytes, waiting first while the bandwidth limit is exceeded."""
+        if byte_count <= 0:
+            return
+        if self._bytes.rate:
+            self._acquire(self._bytes, byte_count)
+        with self._lock:
+            self._statistics.bytes_charged += byte_count
+
+    def acquire_files(self, file_count: int = 1) -> None:
+        """Charge file_count files, waiting first while the files/s limit is exceeded."""
+        if self._files.rate:
+            self._acquire(self._files, file_count)
+        with self._lock:
+            self._statistics.files_charged += file_count
+
+    def wrap_progress(self, progress_callback=None):
+        """
+        Wrap a copy engine progress callback so each chunk's bytes are charged before the copy continues.
+
+        Args:
+        -----
+        progress_callback: Optional callable(bytes_copied_so_far) for one file
+
+        Returns:
+        --------
+        callable(bytes_copied_so_far): Charges the bytes since the previous call, then calls progress_callback
+        """
+        last = [0]
+
+        def throttled_progress(bytes_done: int):
+            self.acquire_bytes(bytes_done - last[0])
+            last[0] = max(last[0], bytes_done)
+            if progress_callback:
+                progress_callback(bytes_done)
+        return throttled_progress
+
+    def reset(self) -> None:
+        """Start counting afresh (at the start of each copy operation); the limits are kept."""
+        with self._lock:
+            self._statistics = CopyRateLimiter_class.Statistics()
+            self._start_time = time.perf_counter()
+
+    def statistics(self) -> CopyRateLimiter_class.Statistics:
+        """Snapshot of the traffic since reset(), with the current limits."""
+        with self._lock:
+            return dataclasses.replace(self._statistics,
+                                       elapsed_seconds=time.perf_counter() - self._start_time,
+                                       bytes_per_second_limit=self._bytes.rate,
+                                       files_per_second_limit=self._files.rate)
+
+    @staticmethod
+    def format_limits(bytes_per_second: float, files_per_second: float) -> str:
+        """Limits as text, eg "50.0 MB/s, unlimited files/s"."""
+        bytes_text = f"{bytes_per_second / (1024 * 1024):.1f} MB/s" if bytes_per_second else "unlimited MB/s"
+        files_text = f"{files_per_second:g} files/s" if files_per_second else "unlimited files/s"
+        return f"{bytes_text}, {files_text}"
@@ -0,0 +1,666 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+from FileCopyManager_class import FileCopyManager_class
+from CopyPlan_class import CopyPlan_class # v002.0017 added
+from DriveClassifier_class import DriveClassifier_class # v002.0018 added
+from DisplayFormatter_class import DisplayFormatter_class
+from OperationControl_class import OperationControl_class # v002.0025 added
+
+class CopyScheduler_class:
+    """
+    Copy scheduler which dispatches FileCopyManager_class.copy_file calls to a worker pool.
+
+    Purpose:
+    --------
+    Copying selected items one at a time leaves SSDs and high-latency network shares
+    mostly idle when there are many small files. The scheduler:
+    - executes a CopyPlan_class (directories, files and missing items, planned once) # v002.0017 changed
+    - creates directories first, shallowest first, so their contents always have a parent
+    - stats each file once just before copying, re-planning only files changed since planning # v002.0017 added
+    - then recreates planned hardlinks to the copied members of their inode group, # v002.0021 added
+      copying any whose link cannot be made
+    - copies small DIRECT files in batches per target folder, folders in path order # v002.0022 added
+      (C.COPY_SMALL_FILE_THRESHOLD, C.COPY_SMALL_FILE_BATCH_FILES), reporting progress once per batch
+    - starts the copies in the order of a schedule policy (C.COPY_SCHEDULE_POLICY), eg # v002.0023 added
+      largest first so a huge file does not start last and hold up the end of the copy
+    - estimates the time remaining from the sizes still to copy and the per-file and
+      per-byte copy times observed so far (estimate_remaining_seconds)
+    - copies files on a ThreadPoolExecutor of C.COPY_WORKER_COUNT workers
+    - caps concurrency per (source volume, target volume) pair at # v002.0018 changed
+      C.COPY_MAX_WORKERS_PER_DEVICE_PAIR, so one slow drive cannot be flooded
+      (volumes resolved once by the shared DriveClassifier_class)
+    - aggregates summary counters under a lock, and wraps each file in
+      copy_manager.buffered_log() so the operation log is not interleaved
+    - honours an OperationControl_class: while paused no item starts (and copies wait # v002.0025 added
+      between chunks); once cancelled no further item starts, items in progress finish,
+      and the summary lists the items done (done_paths) for the operation's checkpoint
+
+    Usage:
+    ------
+    scheduler = CopyScheduler_class(copy_manager, source_folder, dest_folder, overwrite=True, dry_run=False,
+                                    progress_callback=on_progress, status_callback=ui.post_status)
+    summary = scheduler.run_plan(CopyPlan_class.from_comparison(comparison_results, selected_paths, 'left', source_folder, dest_folder))
+    summary = scheduler.run(selected_paths)   # or plan from the file system
+    print(summary.copied_count, summary.error_count, summary.total_bytes_copied)
+    """
+
+    class SchedulePolicy(Enum): # v002.0023 added
+        """
+        Order in which the copy tasks (files and small-file batches) are started.
+        
+        Purpose:
+        --------
+        With parallel workers the start order decides the tail: a 10 GB file which starts
+        last leaves every other worker idle while it copies.
+        """
+        PLAN_ORDER = "plan_order"           # selection order (as before v002.0023)
+        LARGEST_FIRST = "largest_first"     # longest tasks first: shortest total time, slow visible progress at first
+        SMALLEST_FIRST = "smallest_first"   # shortest tasks first: fast visible progress, a long tail if large files end up last
+        BALANCED = "balanced"               # largest and smallest alternately: about half the workers on each, large files still start early
+
+    @dataclass
+    class CopySummary:
+        """Counters for a scheduled copy operation (updated under the scheduler lock)."""
+        copied_count: int = 0
+        error_count: int = 0
+        skipped_count: int = 0
+        total_bytes_copied: int = 0
+        total_allocated_bytes: int = 0                                  # target disk space actually allocated (sparse files use less) # v002.0013 added
+        completed_count: int = 0                                        # items finished, whatever the outcome
+        strategy_counts: dict[str, int] = field(default_factory=dict)   # CopyStrategy.value -> files
+        method_counts: dict[str, int] = field(default_factory=dict)     # CopyMethod.value -> files # v002.0010 added
+        critical_errors: list[tuple[str, str]] = field(default_factory=list)  # (rel_path, error_message)
+        linked_count: int = 0                                           # files recreated as hardlinks instead of copied # v002.0021 added
+        bytes_saved: int = 0                                            # bytes those hardlinks did not copy # v002.0021 added
+        cancelled_count: int = 0                                        # items not started because the operation was cancelled # v002.0025 added
+        done_paths: set[str] = field(default_factory=set)               # rel_paths copied, linked or skipped (not failed or cancelled) # v002.0025 added
+
+        @property
+        def cancelled(self) -> bool: # v002.0025 added
+            return self.cancelled_count > 0
+
+    def __init__(self, copy_manager: FileCopyManager_class, source_folder: str, dest_folder: str,
+                 overwrite: bool = True, dry_run: bool = False,
+                 progress_callback=None, status_callback=None,
+                 worker_count: Optional[int] = None, max_workers_per_device_pair: Optional[int] = None,
+                 schedule_policy: Optional[str] = None,
+                 operation_control: Optional[OperationControl_class] = None): # v002.0023 changed [schedule_policy], v002.0025 changed [operation_control]
+        """
+        Initialize the copy scheduler.
+
+        Args:
+        -----
+        copy_manager: FileCopyManager_class with an operation already started
+        source_folder: Root folder items are copied from
+        dest_folder: Root folder items are copied to
+        overwrite: Whether to overwrite existing files
+        dry_run: Simulate only (passed through to directory handling; copy_manager has its own flag)
+        progress_callback: Callable(completed_count, message, bytes_done), called from any thread
+        status_callback: Callable(message) for status window lines, called from any thread
+        worker_count: Worker pool size override, defaults to C.COPY_WORKER_COUNT
+        max_workers_per_device_pair: Per device pair cap override, defaults to C.COPY_MAX_WORKERS_PER_DEVICE_PAIR
+        schedule_policy: SchedulePolicy value override, defaults to C.COPY_SCHEDULE_POLICY # v002.0023 added
+        operation_control: Optional OperationControl_class to pause or cancel the copy # v002.0025 added
+        """
+        self.copy_manager = copy_manager
+        self.source_folder = source_folder
+        self.dest_folder = dest_folder
+        self.overwrite = overwrite
+        self.dry_run = dry_run
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.worker_count = max(1, int(worker_count if worker_count is not None else C.COPY_WORKER_COUNT))
+        self.max_workers_per_device_pair = max(1, int(max_workers_per_device_pair if max_workers_per_device_pair is not None
+                                                      else C.COPY_MAX_WORKERS_PER_DEVICE_PAIR))
+        self.schedule_policy = CopyScheduler_class.SchedulePolicy(schedule_policy if schedule_policy is not None else C.COPY_SCHEDULE_POLICY) # v002.0023 added
+        self.operation_control = operation_control # v002.0025 added
+
+        self.summary = CopyScheduler_class.CopySummary()
+        self._lock = threading.Lock()                                  # guards summary and the maps below
+        self._device_semaphores: dict[tuple, threading.Semaphore] = {}  # (source volume, target volume) -> semaphore # v002.0018 changed
+        self._in_flight_bytes: dict[str, int] = {}                     # rel_path -> bytes copied so far, for files being copied # v002.0011 added
+        self._copied_targets: set[str] = set()                         # dest paths copied successfully, which hardlinks may link to # v002.0021 added
+        self._total_count = 0
+        self._status_interval = 1
+        # Time remaining estimate: tasks, files and bytes not yet copied, the sums for a least squares fit of each # v002.0023 added
+        # task's time to per_task + per_file * files + per_mb * MB (X'X and X'y for x = (1, files, MB)),
+        # and the total task time and the start, for the parallelism achieved
+        self._remaining_tasks = 0
+        self._remaining_files = 0
+        self._remaining_bytes = 0
+        self._task_fit_xx = [[0.0] * 3 for _ in range(3)]
+        self._task_fit_xy = [0.0] * 3
+        self._tasks_done = 0
+        self._busy_seconds = 0.0
+        self._start_time = time.perf_counter()
+
+    def run(self, selected_paths: list[str]) -> CopyScheduler_class.CopySummary:
+        """
+        Copy the selected items and return the summary (plans them by stat'ing each path, see run_plan).
+
+        Args:
+        -----
+        selected_paths: Relative paths (files and folders) to copy
+
+        Returns:
+        --------
+        CopySummary: Aggregated counters for the whole operation
+        """
+        return self.run_plan(CopyPlan_class.from_paths(selected_paths, self.source_folder, self.dest_folder)) # v002.0017 changed
+
+    def run_plan(self, plan: CopyPlan_class) -> CopyScheduler_class.CopySummary: # v002.0017 added [replaces the stat/partition loop in run]
+        """
+        Execute a copy plan and return the summary.
+
+        Args:
+        -----
+        plan: CopyPlan_class built from comparison results (or by run from paths)
+
+        Returns:
+        --------
+        CopySummary: Aggregated counters for the whole operation
+        """
+        self._total_count = plan.item_count
+        self._status_interval = max(1, self._total_count // 20)
+
+        # Items missing on the source side when planned
+        for rel_path in plan.missing:
+            self.copy_manager._log_status(f"Source file not found, skipping: {str(Path(self.source_folder) / rel_path)}")
+            self._record(rel_path, skipped=True)
+
+        # Phase 1: directories, parents before children (the plan holds them shallowest first)
+        for op in plan.directories:
+            self._process_directory(op)
+
+        # Phase 2: files on the worker pool, small files in batches per target folder # v002.0022 changed
+        copy_ops = [op for op in plan.files if op.link_source is None] # v002.0021 changed
+        link_ops = [op for op in plan.files if op.link_source is not None]
+        # Link sources not copied by this plan were copied by the earlier run a resumed plan continues # v002.0025 added
+        planned_targets = {op.dest_path for op in copy_ops}
+        self._copied_targets.update(op.link_source for op in link_ops if op.link_source not in planned_targets)
+        small_batches = CopyScheduler_class.batch_small_files(copy_ops)
+        batched_paths = {op.rel_path for batch in small_batches for op in batch}
+        sized_tasks = [(op.size, functools.partial(self._process_file, op)) for op in copy_ops if op.rel_path not in batched_paths]
+        sized_tasks += [(sum(op.size for op in batch), functools.partial(self._process_small_batch, batch)) for batch in small_batches]
+        tasks = CopyScheduler_class.order_tasks(sized_tasks, self.schedule_policy) # v002.0023 added
+        with self._lock:
+            self._remaining_tasks = len(tasks)
+            self._remaining_files = len(copy_ops)
+            self._remaining_bytes = sum(op.size for op in copy_ops)
+            self._start_time = time.perf_counter()
+        worker_count = min(self.worker_count, len(tasks))
+        log_and_flush(logging.INFO, f"CopyScheduler_class: {len(plan.directories)} directories, {len(copy_ops)} files "
+                                    f"({len(batched_paths)} small files in {len(small_batches)} batches), {len(link_ops)} hardlinks, "
+                                    f"{worker_count} workers (max {self.max_workers_per_device_pair} per device pair), "
+                                    f"{self.schedule_policy.value} schedule") # v002.0023 changed
+        self._run_on_pool(tasks)
+
+        # Phase 3: hardlinks, once the files they link to are copied # v002.0021 added
+        self._run_on_pool([functools.partial(self._process_link, op) for op in link_ops])
+
+        if self.summary.cancelled: # v002.0025 added
+            log_and_flush(logging.INFO, f"CopyScheduler_class: cancelled, {self.summary.completed_count} items done, "
+                                        f"{self.summary.cancelled_count} not started")
+        return self.summary
+
+    def _run_on_pool(self, tasks: list): # v002.0021 added [was inline in run_plan], v002.0022 changed [callables]
+        """Run each task (a callable taking no arguments) on the worker pool, or inline when there is at most one worker's worth."""
+        worker_count = min(self.worker_count, len(tasks))
+        if worker_count <= 1:
+            for task in tasks:
+                task()
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="FCS_copy") as executor:
+                futures = [executor.submit(task) for task in tasks]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()  # tasks handle their own errors; surface anything unexpected
+
+    @staticmethod
+    def order_tasks(sized_tasks: list[tuple[int, Any]], policy: CopyScheduler_class.SchedulePolicy) -> list: # v002.0023 added
+        """
+        Order copy tasks for a schedule policy (the pool starts them in list order).
+        
+        Args:
+        -----
+        sized_tasks: (bytes, task) for each task, in plan order
+        policy: SchedulePolicy to order by (sorts are stable, so equal sizes keep plan order)
+        
+        Returns:
+        --------
+        list: The tasks, in start order
+        """
+        if policy == CopyScheduler_class.SchedulePolicy.PLAN_ORDER:
+            return [task for _, task in sized_tasks]
+        if policy == CopyScheduler_class.SchedulePolicy.SMALLEST_FIRST:
+            return [task for _, task in sorted(sized_tasks, key=lambda sized: sized[0])]
+        largest_first = [task for _, task in sorted(sized_tasks, key=lambda sized: sized[0], reverse=True)]
+        if policy == CopyScheduler_class.SchedulePolicy.LARGEST_FIRST:
+            return largest_first
+        # BALANCED: alternate the largest and smallest tasks left, meeting in the middle
+        ordered = []
+        low, high = 0, len(largest_first) - 1
+        while low <= high:
+            ordered.append(largest_first[low])
+            low += 1
+            if low <= high:
+                ordered.append(largest_first[high])
+                high -= 1
+        return ordered
+
+    def estimate_remaining_seconds(self) -> Optional[float]: # v002.0023 added
+        """
+        Estimated seconds until the copy completes, from the work left and the throughput observed.
+        
+        The wall time of each finished task (a file, or a small-file batch) is fitted by least
+        squares to per_task + per_file * files + per_mb * MB, so the fixed cost of a
+        task, the overhead of each file and the time per byte are all learned: a bytes-only
+        rate underestimates the time left for many small files, a files-only rate that for a
+        few large ones, and a batched file costs much less than one copied on its own. The
+        estimate is the fitted time for the tasks not yet finished (less the bytes already
+        copied of files in flight), divided by the parallelism achieved so far (total task
+        time / elapsed time, which reflects the per device pair limits), never more than
+        the tasks left. Until the fit is possible the average task time is used.
+        Until C.COPY_TELEMETRY_MIN_FIT_TASKS tasks have finished, the copy manager's telemetry
+        (rolling throughput of this device pair from earlier copies) is used instead where it
+        has any history, so an ETA is shown from the start. # v002.0027 added
+        
+        Returns:
+        --------
+        Optional[float]: Seconds remaining, or None until a task has finished (and without telemetry)
+        """
+        with self._lock:
+            tasks_done = self._tasks_done
+            remaining_bytes = max(0, self._remaining_bytes - sum(self._in_flight_bytes.values()))
+            remaining_tasks, remaining_files = self._remaining_tasks, self._remaining_files
+        if remaining_tasks and tasks_done < C.COPY_TELEMETRY_MIN_FIT_TASKS and C.COPY_TELEMETRY_ENABLED: # v002.0027 added
+            work_seconds = self.copy_manager.telemetry.estimate_seconds(
+                self.copy_manager.device_pair_key(self.source_folder, self.dest_folder), remaining_files, remaining_bytes)
+            if work_seconds is not None:
+                return work_seconds / min(self.worker_count, self.max_workers_per_device_pair, max(1, remaining_tasks))
+        with self._lock:
+            if self._tasks_done == 0:
+                return None
+            normal = [row[:] for row in self._task_fit_xx]
+            rhs = self._task_fit_xy[:]
+            remaining = (self._remaining_tasks, self._remaining_files,
+                         max(0, self._remaining_bytes - sum(self._in_flight_bytes.values())) / (1024 * 1024))
+            tasks_done = self._tasks_done
+            busy_seconds = self._busy_seconds
+        coefficients = CopyScheduler_class._solve_3x3(normal, rhs)
+        if coefficients is not None and min(coefficients) >= 0:
+            work_seconds = sum(coefficient * amount for coefficient, amount in zip(coefficients, remaining))
+        else:
+            work_seconds = busy_seconds / tasks_done * remaining[0]
+        elapsed = time.perf_counter() - self._start_time
+        parallel = min(max(1.0, busy_seconds / elapsed if elapsed > 0 else 1.0), self.worker_count, max(1, remaining[0]))
+        return work_seconds / parallel
+
+    @staticmethod
+    def _solve_3x3(matrix: list[list[float]], rhs: list[float]) -> Optional[list[float]]: # v002.0023 added
+        """Solve matrix * x = rhs by Gaussian elimination with partial pivoting (None if singular); matrix and rhs are modified."""
+        scale = max(abs(value) for row in matrix for value in row) or 1.0
+        for column in range(3):
+            pivot = max(range(column, 3), key=lambda row: abs(matrix[row][column]))
+            if abs(matrix[pivot][column]) <= 1e-12 * scale:
+                return None
+            matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+            rhs[column], rhs[pivot] = rhs[pivot], rhs[column]
+            for row in range(column + 1, 3):
+                factor = matrix[row][column] / matrix[column][column]
+                for k in range(column, 3):
+                    matrix[row][k] -= factor * matrix[column][k]
+                rhs[row] -= factor * rhs[column]
+        solution = [0.0] * 3
+        for row in (2, 1, 0):
+            solution[row] = (rhs[row] - sum(matrix[row][k] * solution[k] for k in range(row + 1, 3))) / matrix[row][row]
+        return solution
+
+    def _observe(self, ops: list[CopyPlan_class.FileOp], seconds: Optional[float] = None, bytes_copied: int = 0): # v002.0023 added
+        """Account for a finished task's files in the time remaining estimate, with its wall time if it copied them (caller holds the lock)."""
+        self._remaining_tasks = max(0, self._remaining_tasks - 1)
+        self._remaining_files = max(0, self._remaining_files - len(ops))
+        self._remaining_bytes = max(0, self._remaining_bytes - sum(op.size for op in ops))
+        if seconds is not None:
+            features = (1.0, float(len(ops)), bytes_copied / (1024 * 1024))  # bytes in MB, so the fit is well conditioned
+            for row in range(3):
+                for column in range(3):
+                    self._task_fit_xx[row][column] += features[row] * features[column]
+                self._task_fit_xy[row] += features[row] * seconds
+            self._tasks_done += 1
+            self._busy_seconds += seconds
+
+    @staticmethod
+    def _is_small_file(op: CopyPlan_class.FileOp) -> bool: # v002.0022 added
+        """Whether a planned file is copied on the small-file batch path (not one whose target needs a DELTA rollback first)."""
+        return (op.size <= C.COPY_SMALL_FILE_THRESHOLD and op.strategy == FileCopyManager_class.CopyStrategy.DIRECT
+                and not op.delta_journal_exists) # v002.0014 changed
+
+    @staticmethod
+    def batch_small_files(ops: list[CopyPlan_class.FileOp]) -> list[list[CopyPlan_class.FileOp]]: # v002.0022 added
+        """
+        Group the small DIRECT files among ops into batches for copy_small_file_batch.
+
+        Files are grouped by target folder, folders in path order and files by name
+        within a folder, so each batch works within one folder (created once, and its
+        directory entries likely cached) and consecutive batches move through the tree.
+
+        Args:
+        -----
+        ops: File operations (without hardlinks)
+
+        Returns:
+        --------
+        list[list[FileOp]]: Batches of at most C.COPY_SMALL_FILE_BATCH_FILES files, each
+        in one target folder (empty when batching is disabled)
+        """
+        if C.COPY_SMALL_FILE_BATCH_FILES <= 1:
+            return []
+        folders = {}
+        for op in ops:
+            if CopyScheduler_class._is_small_file(op):
+                folders.setdefault(os.path.dirname(op.dest_path), []).append(op)
+        batches = []
+        for folder in sorted(folders):
+            folder_ops = sorted(folders[folder], key=lambda op: op.dest_path)
+            for start in range(0, len(folder_ops), C.COPY_SMALL_FILE_BATCH_FILES):
+                batches.append(folder_ops[start:start + C.COPY_SMALL_FILE_BATCH_FILES])
+        return batches
+
+    def _may_start(self, ops: list) -> bool: # v002.0025 added
+        """Wait while paused; False (recording ops as cancelled) once the operation is cancelled."""
+        if self.operation_control is None or self.operation_control.wait_while_paused():
+            return True
+        with self._lock:
+            self.summary.cancelled_count += len(ops)
+            self._observe([op for op in ops if isinstance(op, CopyPlan_class.FileOp)])
+        return False
+
+    def _process_directory(self, op: CopyPlan_class.DirectoryOp):
+        """Create a destination directory (or update its timestamps) on the scheduler thread."""
+        if not self._may_start([op]): # v002.0025 added
+            return
+        rel_path = op.rel_path
+        source_path = op.source_path
+        dest_path = op.dest_path
+        self._report_start(rel_path)
+        try:
+            if not op.dest_exists: # v002.0017 changed [target existence from the plan]
+                if not self.dry_run:
+                    Path(dest_path).mkdir(parents=True, exist_ok=True)
+                    self.copy_manager._log_status(f"Created directory: {dest_path}")
+                    try:
+                        self.copy_manager.timestamp_manager.copy_timestamps(source_path, dest_path)
+                        self.copy_manager._log_status(f"Copied directory timestamps: {dest_path}")
+                    except Exception as e:
+                        # Non-critical error - directory was created successfully
+                        self.copy_manager._log_status(f"Warning: Could not copy directory timestamps for {dest_path}: {e}")
+                else:
+                    self.copy_manager._log_status(f"DRY RUN: Would create directory: {dest_path}")
+                    self.copy_manager._log_status(f"DRY RUN: Would copy directory timestamps: {dest_path}")
+                self._record(rel_path, copied=True)
+            else:
+                # Directory already exists - still copy timestamps to sync metadata
+                if not self.dry_run:
+                    try:
+                        self.copy_manager.timestamp_manager.copy_timestamps(source_path, dest_path)
+                        self.copy_manager._log_status(f"Updated directory timestamps: {dest_path}")
+                        self._record(rel_path, copied=True)
+                    except Exception as e:
+                        # Non-critical error - directory exists
+                        self.copy_manager._log_status(f"Warning: Could not update directory timestamps for {dest_path}: {e}")
+                        self._record(rel_path, skipped=True)
+                else:
+                    self.copy_manager._log_status(f"DRY RUN: Would update directory timestamps: {dest_path}")
+                    self._record(rel_path, copied=True)
+        except Exception as e:
+            self._record_exception(rel_path, e)
+
+    def _process_file(self, op: CopyPlan_class.FileOp):
+        """Copy one file (runs on a pool worker), holding the semaphore for its device pair."""
+        if not self._may_start([op]): # v002.0025 added
+            return
+        rel_path = op.rel_path
+        source_path = op.source_path
+        dest_path = op.dest_path
+        try:
+            # The one freshness check per file: re-plan only if the source changed since it was planned # v002.0017 added
+            try:
+                source_stat = os.stat(source_path)
+            except OSError:
+                self.copy_manager._log_status(f"Source file not found, skipping: {source_path}")
+                with self._lock:
+                    self._observe([op]) # v002.0023 added
+                self._record(rel_path, skipped=True)
+                return
+            planned_strategy = op.strategy
+            if source_stat.st_size != op.size or (op.mtime is not None and abs(source_stat.st_mtime - op.mtime) >= 0.001):
+                self.copy_manager._log_status(f"Source changed since it was compared, re-planning: {rel_path}")
+                planned_strategy = None
+
+            semaphore = self._get_device_semaphore(source_path, dest_path)
+            with semaphore:
+                task_start = time.perf_counter() # v002.0023 added
+                self._report_start(rel_path, source_stat.st_size, planned_strategy)
+                # Per-chunk progress, so large copies visibly advance # v002.0011 added
+                chunk_progress = (lambda bytes_copied: self._report_bytes(rel_path, bytes_copied)) if self.progress_callback else None
+                if self.operation_control is not None: # v002.0025 added [pause between chunks]
+                    chunk_progress = functools.partial(self._pause_between_chunks, chunk_progress)
+                with self.copy_manager.buffered_log():
+                    result = self.copy_manager.copy_file(source_path, dest_path, self.overwrite, chunk_progress,
+                                                         planned_size=source_stat.st_size, planned_strategy=planned_strategy, # v002.0017 changed
+                                                         delta_journal_exists=op.delta_journal_exists) # v002.0014 changed
+                    if result.success:
+                        with self._lock:
+                            self._copied_targets.add(dest_path) # v002.0021 added
+                        self.copy_manager._log_status(f"Successfully {'simulated' if self.dry_run else 'copied'}: {rel_path} ({result.strategy_used.value} strategy)")
+                    else:
+                        self.copy_manager._log_status(f"Failed to {'simulate' if self.dry_run else 'copy'} {rel_path}: {result.error_message}")
+            with self._lock:
+                self._observe([op], time.perf_counter() - task_start, result.bytes_copied) # v002.0023 added
+            self._record_result(rel_path, result)
+        except Exception as e:
+            with self._lock:
+                self._observe([op]) # v002.0023 added
+            self._record_exception(rel_path, e)
+
+    def _process_link(self, op: CopyPlan_class.FileOp): # v002.0021 added
+        """Recreate one source hardlink on the target (runs on a pool worker), copying the file instead where it cannot be linked."""
+        if not self._may_start([op]): # v002.0025 added
+            return
+        rel_path = op.rel_path
+        try:
+            with self._lock:
+                link_source_copied = op.link_source in self._copied_targets
+            if not link_source_copied or op.delta_journal_exists: # v002.0014 changed [copy_file rolls back an interrupted DELTA update first]
+                reason = "has an interrupted DELTA update to roll back" if op.delta_journal_exists else f"link target {op.link_source} was not copied"
+                self.copy_manager._log_status(f"Hardlink not used ({reason}), copying instead: {rel_path}")
+                self._process_file(op)
+                return
+            self._report_start(rel_path)
+            with self.copy_manager.buffered_log():
+                result = self.copy_manager.link_file(op.source_path, op.link_source, op.dest_path, self.overwrite, op.size)
+                if result is not None:
+                    self.copy_manager._log_status(f"Successfully {'simulated' if self.dry_run else 'linked'}: {rel_path} (hardlink to {op.link_source})")
+            if result is None:
+                self._process_file(op)
+                return
+            self._record(rel_path, linked=True, bytes_saved=op.size, strategy=result.strategy_used)
+        except Exception as e:
+            self._record_exception(rel_path, e)
+
+    def _process_small_batch(self, ops: list[CopyPlan_class.FileOp]): # v002.0022 added
+        """Copy a batch of small files into one target folder (runs on a pool worker), reporting progress once for the batch."""
+        if not self._may_start(ops): # v002.0025 added
+            return
+        try:
+            semaphore = self._get_device_semaphore(ops[0].source_path, ops[0].dest_path)
+            with semaphore:
+                task_start = time.perf_counter() # v002.0023 added
+                self._report_start(os.path.dirname(ops[0].rel_path) or ".", batch_count=len(ops))
+                with self.copy_manager.buffered_log():
+                    results = self.copy_manager.copy_small_file_batch([(op.source_path, op.dest_path, op.size) for op in ops],
+                                                                      self.overwrite) # v002.0022 changed [overwrite]
+            self._record_batch(ops, results, time.perf_counter() - task_start)
+        except Exception as e:
+            with self._lock:
+                self._observe(ops) # v002.0023 added
+            for op in ops:
+                self._record_exception(op.rel_path, e)
+
+    def _get_device_semaphore(self, source_path: str, dest_path: str) -> threading.Semaphore: # v002.0018 changed [volumes from DriveClassifier_class, no stat probing]
+        """Semaphore limiting concurrent copies between the source's volume and the target's volume."""
+        classifier = DriveClassifier_class.shared()
+        key = (classifier.volume(source_path), classifier.volume(dest_path))
+        with self._lock:
+            semaphore = self._device_semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.max_workers_per_device_pair)
+                self._device_semaphores[key] = semaphore
+        return semaphore
+
+    def _report_start(self, rel_path: str, file_size: Optional[int] = None,
+                      strategy: Optional[FileCopyManager_class.CopyStrategy] = None, batch_count: int = 1): # v002.0017 changed [planned strategy instead of paths], v002.0022 changed [batch_count]
+        """Post a progress message for an item (or a batch of batch_count small files in folder rel_path) about to be processed."""
+        if not self.progress_callback:
+            return
+        with self._lock:
+            completed = self.summary.completed_count
+            bytes_done = self.summary.total_bytes_copied + sum(self._in_flight_bytes.values()) # v002.0011 changed
+        progress_text = f"{'Simulating' if self.dry_run else 'Copying'} {completed + 1} of {self._total_count}: {os.path.basename(rel_path)}"
+        if batch_count > 1: # v002.0022 added
+            progress_text = (f"{'Simulating' if self.dry_run else 'Copying'} {completed + 1}-{completed + batch_count} of {self._total_count}: "
+                             f"{batch_count} small files in {rel_path}")
+        # Flag large staged copies so a long pause is not mistaken for a hang
+        if file_size is not None and file_size >= C.COPY_STRATEGY_THRESHOLD:
+            if strategy is None or strategy in (FileCopyManager_class.CopyStrategy.STAGED, FileCopyManager_class.CopyStrategy.DELTA, FileCopyManager_class.CopyStrategy.RESUMABLE): # v002.0015 changed
+                progress_text += f"\n({DisplayFormatter_class.format_size(file_size)} file copy in progress ...not frozen, just busy)"
+        self.progress_callback(completed, progress_text, bytes_done)
+
+    def _pause_between_chunks(self, chunk_progress, bytes_copied: int): # v002.0025 added
+        """Copy engine progress callback which holds the copy while the operation is paused (a cancel lets the file finish)."""
+        self.operation_control.wait_while_paused()
+        if chunk_progress:
+            chunk_progress(bytes_copied)
+
+    def _report_bytes(self, rel_path: str, bytes_copied: int): # v002.0011 added
+        """Post byte progress for a file part way through copying (called per chunk from pool workers)."""
+        with self._lock:
+            self._in_flight_bytes[rel_path] = bytes_copied
+            completed = self.summary.completed_count
+            bytes_done = self.summary.total_bytes_copied + sum(self._in_flight_bytes.values())
+        self.progress_callback(completed, None, bytes_done)
+
+    def _record_result(self, rel_path: str, result: FileCopyManager_class.CopyOperationResult):
+        """Fold one copy_file result into the summary."""
+        if result.success:
+            allocated_bytes = result.allocated_bytes if result.allocated_bytes is not None else result.bytes_copied # v002.0013 added
+            self._record(rel_path, copied=True, bytes_copied=result.bytes_copied, strategy=result.strategy_used,
+                         copy_method=result.copy_method, allocated_bytes=allocated_bytes)
+            return
+        error_msg = f"Failed to {'simulate' if self.dry_run else 'copy'} {rel_path}: {result.error_message}"
+        if self.status_callback:
+            self.status_callback(f"ERROR: {error_msg}")
+        # Critical errors require immediate user attention (only in non-dry-run)
+        critical = (not self.dry_run and ("CRITICAL" in result.error_message or "Rename operation failed" in result.error_message))
+        self._record(rel_path, error=True, strategy=result.strategy_used,
+                     critical_error=result.error_message if critical else None)
+
+    def _record_exception(self, rel_path: str, e: Exception):
+        """Record an unexpected exception while processing an item."""
+        error_msg = f"Error processing {rel_path}: {str(e)}"
+        log_and_flush(logging.ERROR, error_msg)
+        self.copy_manager._log_status(error_msg)
+        if self.status_callback:
+            self.status_callback(f"ERROR: {error_msg}")
+        self._record(rel_path, error=True)
+
+    def _record(self, rel_path: str, copied: bool = False, skipped: bool = False, error: bool = False,
+                bytes_copied: int = 0, strategy: Optional[FileCopyManager_class.CopyStrategy] = None,
+                critical_error: Optional[str] = None, copy_method: Optional[FileCopyManager_class.CopyMethod] = None,
+                allocated_bytes: int = 0, linked: bool = False, bytes_saved: int = 0):
+        """Update the summary counters under the lock, posting periodic progress status lines."""
+        with self._lock:
+            self._count(rel_path, copied, skipped, error, bytes_copied, strategy, critical_error, copy_method, # v002.0022 changed [split out into _count]
+                        allocated_bytes, linked, bytes_saved)
+            completed, bytes_done, status_msg = self._progress_snapshot(1)
+        if self.progress_callback:
+            self.progress_callback(completed, None, bytes_done)
+        if status_msg and self.status_callback:
+            self.status_callback(status_msg)
+
+    def _record_batch(self, ops: list[CopyPlan_class.FileOp], results: list[FileCopyManager_class.CopyOperationResult],
+                      seconds: Optional[float] = None): # v002.0022 added, v002.0023 changed [seconds]
+        """Fold a small-file batch's results into the summary under one lock, posting progress once for the batch."""
+        failed = []
+        with self._lock:
+            self._observe(ops, seconds, sum(result.bytes_copied for result in results if result.success)) # v002.0023 added
+            for op, result in zip(ops, results):
+                if result.success:
+                    self._copied_targets.add(op.dest_path)
+                    self._count(op.rel_path, copied=True, bytes_copied=result.bytes_copied, strategy=result.strategy_used,
+                                copy_method=result.copy_method, allocated_bytes=result.bytes_copied)
+                elif result.error_message == "Source file does not exist":
+                    self._count(op.rel_path, skipped=True)
+                else:
+                    self._count(op.rel_path, error=True, strategy=result.strategy_used)
+                    failed.append((op.rel_path, result.error_message))
+            completed, bytes_done, status_msg = self._progress_snapshot(len(ops))
+        if self.status_callback:
+            for rel_path, error_message in failed:
+                self.status_callback(f"ERROR: Failed to {'simulate' if self.dry_run else 'copy'} {rel_path}: {error_message}")
+        if self.progress_callback:
+            self.progress_callback(completed, None, bytes_done)
+        if status_msg and self.status_callback:
+            self.status_callback(status_msg)
+
+    def _count(self, rel_path: str, copied: bool = False, skipped: bool = False, error: bool = False,
+               bytes_copied: int = 0, strategy: Optional[FileCopyManager_class.CopyStrategy] = None,
+               critical_error: Optional[str] = None, copy_method: Optional[FileCopyManager_class.CopyMethod] = None,
+               allocated_bytes: int = 0, linked: bool = False, bytes_saved: int = 0): # v002.0022 added [split out of _record]
+        """Update the summary counters for one item (caller holds the lock)."""
+        summary = self.summary
+        summary.completed_count += 1
+        if not error: # v002.0025 added
+            summary.done_paths.add(rel_path)
+        if copied:
+            summary.copied_count += 1
+            summary.total_bytes_copied += bytes_copied
+            summary.total_allocated_bytes += allocated_bytes # v002.0013 added
+        if linked: # v002.0021 added
+            summary.linked_count += 1
+            summary.bytes_saved += bytes_saved
+        if skipped:
+            summary.skipped_count += 1
+        if error:
+            summary.error_count += 1
+        if strategy is not None:
+            summary.strategy_counts[strategy.value] = summary.strategy_counts.get(strategy.value, 0) + 1
+        if copy_method is not None:
+            summary.method_counts[copy_method.value] = summary.method_counts.get(copy_method.value, 0) + 1
+        if critical_error:
+            summary.critical_errors.append((rel_path, critical_error))
+        self._in_flight_bytes.pop(rel_path, None) # v002.0011 added
+
+    def _progress_snapshot(self, just_completed: int) -> tuple[int, int, Optional[str]]: # v002.0022 added [split out of _record]
+        """(completed, bytes done, periodic status line or None) after just_completed more items (caller holds the lock)."""
+        summary = self.summary
+        completed = summary.completed_count
+        bytes_done = summary.total_bytes_copied + sum(self._in_flight_bytes.values()) # v002.0011 changed
+        status_msg = None
+        if completed // self._status_interval != (completed - just_completed) // self._status_interval:  # crossed an interval
+            status_msg = (f"Progress: {summary.copied_count} {'simulated' if self.dry_run else 'copied'}, "
+                          + (f"{summary.linked_count} linked, " if summary.linked_count else "") # v002.0021 added
+                          + f"{summary.error_count} errors, {summary.skipped_count} skipped")
+        return completed, bytes_done, status_msg
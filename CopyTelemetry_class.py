@@ -0,0 +1,214 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class CopyTelemetry_class:
+    """
+    Per-file copy telemetry: rolling throughput per device pair and strategy, and a size histogram with latencies.
+
+    Purpose:
+    --------
+    Every CopyOperationResult carries its bytes and duration, but nothing aggregated them.
+    FileCopyManager_class records each copied file here (record), which keeps:
+    - rolling (exponentially weighted, C.COPY_TELEMETRY_EWMA_ALPHA) throughput per
+      (source volume, target volume) pair and per strategy; bytes and seconds are
+      averaged separately and divided, so the throughput is time weighted and a burst of
+      tiny files does not swamp it. Small files (<= C.COPY_SMALL_FILE_THRESHOLD) feed a
+      rolling per-file latency instead, as their time is overhead rather than transfer
+    - for the current operation: a histogram over C.COPY_TELEMETRY_SIZE_BUCKETS of files,
+      bytes and latency (mean, max) per size bucket and strategy, and totals per device
+      pair and strategy
+    The rolling figures survive from one copy operation to the next (reset_operation()
+    clears only the operation figures), so estimate_seconds() can predict a copy before
+    any of its files have finished; CopyScheduler_class uses it for its time remaining
+    estimate until it has fitted its own. write_metrics() writes the operation figures
+    as JSON beside the copy operation log: throughput per strategy and size bucket is the
+    data for choosing C.COPY_STRATEGY_THRESHOLD.
+    Strategy and device pair keys are strings, so this class does not depend on
+    FileCopyManager_class.
+
+    Usage:
+    ------
+    telemetry = CopyTelemetry_class()
+    telemetry.record("/mnt/a -> /mnt/b", "direct", file_size=1048576, bytes_copied=1048576, seconds=0.012)
+    telemetry.estimate_seconds("/mnt/a -> /mnt/b", remaining_files=100, remaining_bytes=10 * 1024 ** 3)
+    telemetry.write_metrics("foldercomparesync_copy_20250101_120000_abcd1234_metrics.json", {"operation_id": "abcd1234"})
+    """
+
+    @dataclass
+    class Rolling:
+        """Exponentially weighted bytes and seconds per transfer (large files), and seconds per small file."""
+        bytes: float = 0.0
+        seconds: float = 0.0
+        transfers: int = 0
+        file_seconds: float = 0.0
+        small_files: int = 0
+
+        def add(self, byte_count: int, seconds: float, small: bool) -> None:
+            alpha = C.COPY_TELEMETRY_EWMA_ALPHA
+            if small:
+                self.file_seconds = seconds if not self.small_files else alpha * seconds + (1 - alpha) * self.file_seconds
+                self.small_files += 1
+            else:
+                self.bytes = byte_count if not self.transfers else alpha * byte_count + (1 - alpha) * self.bytes
+                self.seconds = seconds if not self.transfers else alpha * seconds + (1 - alpha) * self.seconds
+                self.transfers += 1
+
+        @property
+        def bytes_per_second(self) -> Optional[float]:
+            return self.bytes / self.seconds if self.transfers and self.seconds > 0 else None
+
+    @dataclass
+    class Totals:
+        """Files, bytes and seconds for one operation, with the slowest file."""
+        files: int = 0
+        bytes: int = 0
+        seconds: float = 0.0
+        max_seconds: float = 0.0
+
+        def add(self, byte_count: int, seconds: float) -> None:
+            self.files += 1
+            self.bytes += byte_count
+            self.seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+        def to_dict(self) -> dict[str, Any]:
+            return {
+                "files": self.files,
+                "bytes": self.bytes,
+                "seconds": round(self.seconds, 6),
+                "mean_latency_ms": round(self.seconds / self.files * 1000, 3) if self.files else None,
+                "max_latency_ms": round(self.max_seconds * 1000, 3),
+                "mb_per_second": round(self.bytes / self.seconds / (1024 * 1024), 3) if self.seconds > 0 else None,
+            }
+
+    def __init__(self):
+        """Initialize empty telemetry."""
+        self._lock = threading.Lock()
+        self._rolling_by_pair: dict[str, CopyTelemetry_class.Rolling] = {}       # "source volume -> target volume" -> rolling figures
+        self._rolling_by_strategy: dict[str, CopyTelemetry_class.Rolling] = {}   # strategy -> rolling figures
+        self.reset_operation()
+
+    def reset_operation(self) -> None:
+        """Clear the per-operation figures (at the start of each copy operation); the rolling figures are kept."""
+        with self._lock:
+            self._histogram: dict[tuple[int, str], CopyTelemetry_class.Totals] = {}  # (bucket index, strategy) -> totals
+            self._totals_by_pair: dict[str, CopyTelemetry_class.Totals] = {}
+            self._totals_by_strategy: dict[str, CopyTelemetry_class.Totals] = {}
+
+    @staticmethod
+    def device_pair_key(source_volume: str, target_volume: str) -> str:
+        """Key of a (source volume, target volume) pair."""
+        return f"{source_volume} -> {target_volume}"
+
+    @staticmethod
+    def bucket_index(file_size: int) -> int:
+        """Index of the C.COPY_TELEMETRY_SIZE_BUCKETS bucket holding file_size (len(buckets) for the largest files)."""
+        return bisect.bisect_right(C.COPY_TELEMETRY_SIZE_BUCKETS, file_size)
+
+    @staticmethod
+    def bucket_label(index: int) -> str:
+        """Bucket as text, eg "64KB-1MB"."""
+        def size_text(size):
+            for unit in ("B", "KB", "MB", "GB"):
+                if size < 1024 or unit == "GB":
+                    return f"{size:g}{unit}"
+                size /= 1024
+        bounds = C.COPY_TELEMETRY_SIZE_BUCKETS
+        if index == 0:
+            return f"<{size_text(bounds[0])}"
+        if index >= len(bounds):
+            return f">={size_text(bounds[-1])}"
+        return f"{size_text(bounds[index - 1])}-{size_text(bounds[index])}"
+
+    def record(self, device_pair: Optional[str], strategy: str, file_size: int, bytes_copied: int, seconds: float) -> None:
+        """Record one copied file (from any thread); device_pair None keeps it out of the device pair figures (eg a clone moves no data)."""
+        small = file_size <= C.COPY_SMALL_FILE_THRESHOLD
+        with self._lock:
+            self._rolling_by_strategy.setdefault(strategy, CopyTelemetry_class.Rolling()).add(bytes_copied, seconds, small)
+            self._histogram.setdefault((CopyTelemetry_class.bucket_index(file_size), strategy), CopyTelemetry_class.Totals()).add(bytes_copied, seconds)
+            self._totals_by_strategy.setdefault(strategy, CopyTelemetry_class.Totals()).add(bytes_copied, seconds)
+            if device_pair is not None:
+                self._rolling_by_pair.setdefault(device_pair, CopyTelemetry_class.Rolling()).add(bytes_copied, seconds, small)
+                self._totals_by_pair.setdefault(device_pair, CopyTelemetry_class.Totals()).add(bytes_copied, seconds)
+
+    def estimate_seconds(self, device_pair: str, remaining_files: int, remaining_bytes: int) -> Optional[float]:
+        """
+        Single worker seconds to copy remaining_files files of remaining_bytes in total over device_pair.
+
+        Each file costs the rolling small-file latency, and the bytes the rolling throughput,
+        of the device pair (of all pairs together where the pair has no history yet).
+
+        Returns:
+        --------
+        Optional[float]: Estimated seconds, or None without enough history
+        """
+        with self._lock:
+            rolling = self._rolling_by_pair.get(device_pair)
+            if rolling is None or not rolling.transfers:
+                candidates = [r for r in self._rolling_by_pair.values() if r.transfers]
+                if not candidates:
+                    return None
+                rolling = CopyTelemetry_class.Rolling(
+                    bytes=sum(r.bytes for r in candidates), seconds=sum(r.seconds for r in candidates), transfers=len(candidates),
+                    file_seconds=max(r.file_seconds for r in self._rolling_by_pair.values()),
+                    small_files=sum(r.small_files for r in self._rolling_by_pair.values()))
+            bytes_per_second = rolling.bytes_per_second
+            file_seconds = rolling.file_seconds
+        if not bytes_per_second:
+            return None
+        return remaining_files * file_seconds + remaining_bytes / bytes_per_second
+
+    def metrics(self) -> dict[str, Any]:
+        """The operation's histogram and totals, with the rolling throughput, as JSON serializable data."""
+        with self._lock:
+            histogram = {}
+            for (index, strategy), totals in sorted(self._histogram.items()):
+                histogram.setdefault(CopyTelemetry_class.bucket_label(index), {})[strategy] = totals.to_dict()
+
+            def rolling_dict(rolling):
+                return {
+                    "mb_per_second": round(rolling.bytes_per_second / (1024 * 1024), 3) if rolling.bytes_per_second else None,
+                    "small_file_latency_ms": round(rolling.file_seconds * 1000, 3) if rolling.small_files else None,
+                    "transfers": rolling.transfers,
+                    "small_files": rolling.small_files,
+                }
+            return {
+                "size_buckets": [CopyTelemetry_class.bucket_label(index) for index in range(len(C.COPY_TELEMETRY_SIZE_BUCKETS) + 1)],
+                "histogram": histogram,
+                "by_device_pair": {pair: totals.to_dict() for pair, totals in self._totals_by_pair.items()},
+                "by_strategy": {strategy: totals.to_dict() for strategy, totals in self._totals_by_strategy.items()},
+                "rolling_by_device_pair": {pair: rolling_dict(rolling) for pair, rolling in self._rolling_by_pair.items()},
+                "rolling_by_strategy": {strategy: rolling_dict(rolling) for strategy, rolling in self._rolling_by_strategy.items()},
+                "strategy_threshold": C.COPY_STRATEGY_THRESHOLD,
+            }
+
+    def write_metrics(self, path: str, metadata: dict[str, Any]) -> str:
+        """Write metadata and metrics() as JSON to path, returning the path."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({**metadata, **self.metrics()}, f, indent=1)
+        return path
+
+    def summary_lines(self) -> list[str]:
+        """One line per strategy for the operation log: files, MB/s and mean latency this operation."""
+        with self._lock:
+            totals = sorted(self._totals_by_strategy.items())
+        lines = []
+        for strategy, strategy_totals in totals:
+            figures = strategy_totals.to_dict()
+            rate_text = f"{figures['mb_per_second']:.1f} MB/s" if figures['mb_per_second'] is not None else "- MB/s"
+            lines.append(f"{strategy}: {figures['files']:,} files, {figures['bytes']:,} bytes, {rate_text}, "
+                         f"mean {figures['mean_latency_ms']:.1f} ms, max {figures['max_latency_ms']:.1f} ms per file")
+        return lines
@@ -13,6 +13,8 @@ from flushed_logging import log_and_flush, get_log_level, LoggerManager
 
 # Import the things this class references
 from ProgressDialog_class import ProgressDialog_class
+from DisplayFormatter_class import DisplayFormatter_class # v002.0006 added [memoized size/timestamp formatting]
+from OperationControl_class import OperationControl_class # v002.0025 added [cancel/pause and checkpoints]
 
 class DeleteOrphansManager_class:
     """
@@ -688,39 +690,8 @@ class DeleteOrphansManager_class:
         >>> format_timestamp(dt_with_tz, include_timezone=True)
         "2024-12-08 14:30:22.123456 UTC"
         """
-        if timestamp is None:
-            return ""
-        try:
-            # Convert input to datetime object
-            if isinstance(timestamp, datetime):
-                dt = timestamp
-            elif isinstance(timestamp, (int, float)):
-                # Convert epoch timestamp to datetime in local timezone
-                dt = datetime.fromtimestamp(timestamp)
-            else:
-                # Fallback for unexpected types
-                return str(timestamp)
-            
-            # Build format string based on options
-            if include_microseconds:
-                base_format = "%Y-%m-%d %H:%M:%S.%f"
-            else:
-                base_format = "%Y-%m-%d %H:%M:%S"
-            
-            # Format the datetime
-            formatted = dt.strftime(base_format)
-            
-            # Add timezone if requested and available
-            if include_timezone and dt.tzinfo is not None:
-                tz_name = dt.strftime("%Z")
-                if tz_name:  # Only add if timezone name is available
-                    formatted += f" {tz_name}"
-            
-            return formatted
-        except (ValueError, OSError, OverflowError) as e:
-            # Handle invalid timestamps gracefully
-            log_and_flush(logging.DEBUG, f"Invalid timestamp formatting: {timestamp} - {e}")
-            return f"Invalid timestamp: {timestamp}"
+        # v002.0006 changed [single cached implementation shared with the tree population code]
+        return DisplayFormatter_class.format_timestamp(timestamp, include_timezone=include_timezone, include_microseconds=include_microseconds)
     
     @staticmethod
     def format_size(size_bytes):
@@ -740,13 +711,7 @@ class DeleteOrphansManager_class:
         --------
         str: Formatted size string
         """
-        if size_bytes is None:
-            return ""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f}TB"
+        return DisplayFormatter_class.format_size(size_bytes) # v002.0006 changed [single cached implementation]
     
     # ========================================================================
     # INSTANCE METHODS - DIALOG INITIALIZATION AND MANAGEMENT
@@ -876,7 +841,8 @@ class DeleteOrphansManager_class:
                 self.dialog, 
                 "Loading Orphan Files", 
                 "Building orphan file tree...",
-                max_value=100
+                max_value=100,
+                rate_units=None  # v002.0005 added [value is a percentage, so show ETA only]
             )
             threading.Thread(
                 target=self._initialize_data_with_progress, 
@@ -1608,10 +1574,16 @@ class DeleteOrphansManager_class:
                 # This is a file metadata entry
                 metadata = content
                 
-                # Format file display
-                size_str = self.format_size(metadata['size']) if metadata['size'] else ""
-                date_created_str = self.format_timestamp(metadata['date_created'])
-                date_modified_str = self.format_timestamp(metadata['date_modified'])
+                # Format file display # v002.0006 changed [cells rendered once per metadata record and reused on every rebuild]
+                display_values = metadata.get('display_values')
+                if display_values is None:
+                    display_values = (
+                        DisplayFormatter_class.format_size(metadata['size']) if metadata['size'] else "",
+                        DisplayFormatter_class.format_timestamp(metadata['date_created']),
+                        DisplayFormatter_class.format_timestamp(metadata['date_modified']),
+                    )
+                    metadata['display_values'] = display_values
+                size_str, date_created_str, date_modified_str = display_values
                 status_str = metadata['status']
                 
                 # v001.0017 changed [enhanced file checkbox logic based on true orphan status]
@@ -2248,22 +2220,31 @@ class DeleteOrphansManager_class:
         log_and_flush(logging.INFO, "=" * 80)
         
         # Create progress dialog
+        operation_control = OperationControl_class() # v002.0025 added [Pause/Resume and Cancel]
         progress_title = f"{'Simulating' if is_local_dry_run else 'Deleting'} Orphaned Files" # v001.0013 changed [use local dry run mode instead of main app dry run mode]
         progress = ProgressDialog_class(
             self.parent,
             progress_title,
             f"{'Simulating' if is_local_dry_run else 'Processing'} orphaned files...", # v001.0013 changed [use local dry run mode instead of main app dry run mode]
-            max_value=len(sorted_paths) # v001.0023 changed [use sorted_paths length]
+            max_value=len(sorted_paths), # v001.0023 changed [use sorted_paths length]
+            operation_control=operation_control # v002.0025 added
         )
         
         success_count = 0
         error_count = 0
         skipped_count = 0
         total_bytes_processed = 0
+        completed_paths = []  # deleted (or already gone), for the checkpoint of a cancelled deletion # v002.0025 added
+        not_started_paths = []
         
         try:
             # v001.0023 changed [iterate through sorted_paths instead of selected_paths]
             for i, rel_path in enumerate(sorted_paths):
+                # Pause holds here, between items; cancel stops before the next item # v002.0025 added
+                if not operation_control.wait_while_paused():
+                    not_started_paths = sorted_paths[i:]
+                    log_and_flush(logging.INFO, f"DeleteOrphansManager_class: perform_deletion: Cancelled, {len(not_started_paths)} items not started")
+                    break
                 try:
                     # Update progress
                     file_name = rel_path.split('/')[-1]
@@ -2276,6 +2257,7 @@ class DeleteOrphansManager_class:
                     # Skip if file doesn't exist
                     if not os.path.exists(full_path):
                         skipped_count += 1
+                        completed_paths.append(rel_path) # v002.0025 added
                         log_and_flush(logging.ERROR, f"DeleteOrphansManager_class: perform_deletion: ***delete_status: File not found, skipping: {full_path}")
                         continue
                         
@@ -2301,6 +2283,7 @@ class DeleteOrphansManager_class:
                             
                         if success:
                             success_count += 1
+                            completed_paths.append(rel_path) # v002.0025 added
                             log_and_flush(logging.INFO, f"DeleteOrphansManager_class: perform_deletion: ***delete_status: Successfully {method_text.lower()} deleted: {full_path}")
                         else:
                             error_count += 1
@@ -2316,6 +2299,23 @@ class DeleteOrphansManager_class:
             
         finally:
             progress.close()
+            # Cancelled: checkpoint the items deleted and those not started (still listed as orphans after the refresh) # v002.0025 added
+            cancelled_text = ""
+            if not_started_paths:
+                cancelled_text = f"Cancelled: {len(not_started_paths)} items not started"
+                if not is_local_dry_run:
+                    try:
+                        checkpoint_path = OperationControl_class.write_checkpoint(f"delete_{self.side.upper()}", operation_id, {
+                            'source_folder': self.source_folder,
+                            'side': self.side,
+                            'deletion_method': deletion_method,
+                            'completed': completed_paths,
+                            'remaining': not_started_paths,
+                        })
+                        cancelled_text += f", checkpoint saved: {checkpoint_path}"
+                    except OSError as e:
+                        log_and_flush(logging.ERROR, f"DeleteOrphansManager_class: perform_deletion: Could not write checkpoint: {e}")
+                log_and_flush(logging.INFO, f"DeleteOrphansManager_class: perform_deletion: {cancelled_text}")
             # Log operation completion
             elapsed_time = time.time() - operation_start_time
             log_and_flush(logging.INFO, "=" * 80)
@@ -2333,7 +2333,7 @@ class DeleteOrphansManager_class:
             # Show completion dialog
             completion_message = self.format_completion_message(
                 success_count, error_count, skipped_count, total_bytes_processed, 
-                elapsed_time, method_text, operation_id
+                elapsed_time, method_text, operation_id, cancelled_text # v002.0025 changed [cancelled_text]
             )
             
             self.parent.after(0, lambda: messagebox.showinfo(
@@ -2370,7 +2370,7 @@ class DeleteOrphansManager_class:
         return operation_logger
         
     def format_completion_message(self, success_count, error_count, skipped_count, 
-                                total_bytes, elapsed_time, method_text, operation_id):
+                                total_bytes, elapsed_time, method_text, operation_id, cancelled_text=""): # v002.0025 changed [cancelled_text]
         """Format completion message for deletion operation."""
         # Use local dry run mode instead of main app dry run mode # v001.0013 changed [use local dry run mode instead of main app dry run mode]
         is_local_dry_run = self.local_dry_run_mode.get() # v001.0013 changed [use local dry run mode instead of main app dry run mode]
@@ -2378,8 +2378,10 @@ class DeleteOrphansManager_class:
         dry_run_text = " simulation" if is_local_dry_run else "" # v001.0013 changed [use local dry run mode instead of main app dry run mode]
         action_text = "simulated" if is_local_dry_run else method_text.lower() + " deleted" # v001.0013 changed [use local dry run mode instead of main app dry run mode]
         
-        message = f"Deletion{dry_run_text} completed!\n\n"
+        message = f"Deletion{dry_run_text} {'cancelled' if cancelled_text else 'completed'}!\n\n" # v002.0025 changed
         message += f"Successfully {action_text}: {success_count} files\n"
+        if cancelled_text: # v002.0025 added
+            message += f"{cancelled_text}\n"
         
         if error_count > 0:
             message += f"Failed: {error_count} files\n"
@@ -0,0 +1,86 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class DifferenceIndex_class:
+    """
+    Sorted per-side index of different items for range-based selection.
+
+    Purpose:
+    --------
+    Built once after a comparison, so "Select All Differences" and ticking a folder
+    no longer walk the tree widgets or test every row. For each side it holds the
+    sorted rel_paths of items which are different AND exist on that side (ie the
+    items the smart selection logic would tick). Because the paths are sorted,
+    everything underneath a folder is one contiguous slice, found by two binary
+    searches on "folder/".
+
+    Usage:
+    ------
+    index = DifferenceIndex_class(comparison_results)
+    all_left = index.paths('left')                       # every selectable difference, left side
+    in_folder = index.paths_under('right', 'photos/2024') # differences below a folder, right side
+    """
+
+    def __init__(self, comparison_results: dict):
+        """
+        Build the index from comparison results.
+
+        Args:
+        -----
+        comparison_results: rel_path -> FolderCompareSync_class.ComparisonResult_class
+        """
+        start_time = time.time()
+        left_paths = []
+        right_paths = []
+        for rel_path, result in comparison_results.items():
+            if not rel_path or not result.is_different:  # Skip empty (root) path and items which are the same
+                continue
+            if result.left_item and result.left_item.exists:
+                left_paths.append(rel_path)
+            if result.right_item and result.right_item.exists:
+                right_paths.append(rel_path)
+        left_paths.sort()
+        right_paths.sort()
+        self._paths: dict[str, list[str]] = {C.LEFT_SIDE_LOWERCASE: left_paths, C.RIGHT_SIDE_LOWERCASE: right_paths}
+
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"DifferenceIndex_class: indexed {len(left_paths):,} left and {len(right_paths):,} right "
+                                         f"differences in {(time.time() - start_time) * 1000:.1f} ms")
+
+    def paths(self, side: str) -> list[str]:
+        """Sorted rel_paths of all different items existing on a side."""
+        return self._paths[side.lower()]
+
+    def paths_under(self, side: str, folder_rel_path: str) -> list[str]:
+        """
+        Sorted rel_paths of different items existing on a side, anywhere below a folder.
+
+        Args:
+        -----
+        side: Which tree side (LEFT_SIDE_LOWERCASE or RIGHT_SIDE_LOWERCASE)
+        folder_rel_path: Folder relative path, '' for the root folder
+
+        Returns:
+        --------
+        list[str]: Slice of the sorted index (the folder itself is not included)
+        """
+        paths = self._paths[side.lower()]
+        if not folder_rel_path:
+            return paths
+        prefix = folder_rel_path + '/'
+        low = bisect.bisect_left(paths, prefix)
+        high = bisect.bisect_left(paths, prefix + '\U0010ffff')
+        return paths[low:high]
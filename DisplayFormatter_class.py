@@ -0,0 +1,190 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class DisplayFormatter_class:
+    """
+    Memoized formatting of sizes and timestamps for tree rows.
+
+    Purpose:
+    --------
+    Tree population formats a size and two microsecond timestamps for every row,
+    and the same values are formatted again on every rebuild (filter, clear filter,
+    refresh after copy/delete). This class provides:
+    - LRU caches keyed by the raw value (datetime/epoch, options) and by byte size,
+      shared by the main trees and the delete orphans tree
+    - a per-metadata-record memo of the rendered row cells, computed on first
+      insertion of that row and reused on every later rebuild
+
+    All methods are static; FolderCompareSync_class.format_timestamp/format_size and
+    DeleteOrphansManager_class.format_timestamp/format_size delegate here.
+
+    Usage:
+    ------
+    date_str = DisplayFormatter_class.format_timestamp(metadata.date_modified)
+    size_str = DisplayFormatter_class.format_size(metadata.size)
+    size_str, created_str, modified_str, sha512_str = DisplayFormatter_class.file_row_values(metadata)
+    """
+
+    @staticmethod
+    def format_timestamp(timestamp: Union[datetime, float, int, None],
+                         include_timezone: bool = False,
+                         include_microseconds: bool = True) -> str:
+        """
+        Universal timestamp formatting, cached by raw value and options.
+
+        Args:
+        -----
+        timestamp: Can be datetime object, float/int epoch time, or None
+        include_timezone: Whether to include timezone info in output
+        include_microseconds: Whether to include microsecond precision
+
+        Returns:
+        --------
+        str: Formatted timestamp string or empty string if None
+        """
+        if timestamp is None:
+            return ""
+        # tzinfo is part of the key: aware datetimes for the same instant in different
+        # zones compare (and hash) equal, but render different wall-clock times
+        tzinfo = timestamp.tzinfo if isinstance(timestamp, datetime) else None
+        try:
+            return DisplayFormatter_class._format_timestamp_cached(timestamp, tzinfo, include_timezone, include_microseconds)
+        except TypeError:
+            # Unhashable input - format without caching
+            return DisplayFormatter_class._render_timestamp(timestamp, include_timezone, include_microseconds)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=C.DISPLAY_FORMAT_CACHE_SIZE)
+    def _format_timestamp_cached(timestamp, tzinfo, include_timezone: bool, include_microseconds: bool) -> str:
+        """LRU-cached wrapper around _render_timestamp (tzinfo is only used as part of the cache key)."""
+        return DisplayFormatter_class._render_timestamp(timestamp, include_timezone, include_microseconds)
+
+    @staticmethod
+    def _render_timestamp(timestamp, include_timezone: bool, include_microseconds: bool) -> str:
+        """Render a timestamp to text (uncached)."""
+        try:
+            # Convert input to datetime object
+            if isinstance(timestamp, datetime):
+                dt = timestamp
+            elif isinstance(timestamp, (int, float)):
+                # Convert epoch timestamp to datetime in local timezone
+                dt = datetime.fromtimestamp(timestamp)
+            else:
+                # Fallback for unexpected types
+                return str(timestamp)
+
+            # Build format string based on options
+            if include_microseconds:
+                base_format = "%Y-%m-%d %H:%M:%S.%f"
+            else:
+                base_format = "%Y-%m-%d %H:%M:%S"
+
+            # Format the datetime
+            formatted = dt.strftime(base_format)
+
+            # Add timezone if requested and available
+            if include_timezone and dt.tzinfo is not None:
+                tz_name = dt.strftime("%Z")
+                if tz_name:  # Only add if timezone name is available
+                    formatted += f" {tz_name}"
+
+            return formatted
+        except (ValueError, OSError, OverflowError) as e:
+            # Handle invalid timestamps gracefully
+            log_and_flush(logging.DEBUG, f"Invalid timestamp formatting: {timestamp} - {e}")
+            return f"Invalid timestamp: {timestamp}"
+
+    @staticmethod
+    def format_size(size_bytes) -> str:
+        """
+        Format file size in human readable format (B, KB, MB, GB, TB), cached by byte count.
+
+        Args:
+        -----
+        size_bytes: Size in bytes
+
+        Returns:
+        --------
+        str: Formatted size string
+        """
+        if size_bytes is None:
+            return ""
+        return DisplayFormatter_class._format_size_cached(size_bytes)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=C.DISPLAY_FORMAT_CACHE_SIZE)
+    def _format_size_cached(size_bytes) -> str:
+        """LRU-cached size rendering."""
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size_bytes < 1024.0:
+                return f"{size_bytes:.1f}{unit}"
+            size_bytes /= 1024.0
+        return f"{size_bytes:.1f}TB"
+
+    @staticmethod
+    def file_row_values(metadata) -> tuple[str, str, str, str]:
+        """
+        Rendered (size, date_created, date_modified, sha512) cells for a file row, memoized on the record.
+
+        Purpose:
+        --------
+        The first time a row is inserted its cells are rendered and stored on the
+        metadata record (FileMetadata_class.display_values); later rebuilds reuse them.
+
+        Args:
+        -----
+        metadata: FolderCompareSync_class.FileMetadata_class for an existing file
+
+        Returns:
+        --------
+        tuple[str, str, str, str]: size_str, date_created_str, date_modified_str, sha512_str
+        """
+        values = metadata.display_values
+        if values is None:
+            values = (
+                DisplayFormatter_class.format_size(metadata.size) if metadata.size else "",
+                DisplayFormatter_class.format_timestamp(metadata.date_created, include_timezone=False),
+                DisplayFormatter_class.format_timestamp(metadata.date_modified, include_timezone=False),
+                metadata.sha512[:16] + "..." if metadata.sha512 else "",
+            )
+            metadata.display_values = values
+        return values
+
+    @staticmethod
+    def folder_date_values(metadata) -> tuple[str, str]:
+        """Rendered (date_created, date_modified) cells for a folder row, memoized on the record."""
+        values = metadata.display_values
+        if values is None:
+            values = (
+                "",
+                DisplayFormatter_class.format_timestamp(metadata.date_created, include_timezone=False),
+                DisplayFormatter_class.format_timestamp(metadata.date_modified, include_timezone=False),
+                "",
+            )
+            metadata.display_values = values
+        return values[1], values[2]
+
+    @staticmethod
+    def cache_info() -> str:
+        """Cache statistics for debug logging."""
+        return (f"timestamp cache {DisplayFormatter_class._format_timestamp_cached.cache_info()}, "
+                f"size cache {DisplayFormatter_class._format_size_cached.cache_info()}")
+
+    @staticmethod
+    def clear_caches():
+        """Discard all cached rendered strings (eg after a fresh comparison)."""
+        DisplayFormatter_class._format_timestamp_cached.cache_clear()
+        DisplayFormatter_class._format_size_cached.cache_clear()
@@ -0,0 +1,229 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class DriveClassifier_class:
+    """
+    Cached drive type and volume (mount point) classification of paths.
+
+    Purpose:
+    --------
+    FileCopyManager_class.get_drive_type used to call GetDriveTypeW for every path it
+    was given, several times per copied file. The classifier resolves each volume once
+    and caches it, so every later lookup is a dictionary hit:
+    - Windows: the volume is the drive root ("C:\\") or UNC share ("\\\\server\\share");
+      GetDriveTypeW is called once per drive, UNC shares are always network
+    - Linux: /proc/self/mountinfo is read once; a path's volume is its longest matching
+      mount point, and NFS, CIFS/SMB, fuse (sshfs, rclone, ...) and other network
+      filesystems are classified as network
+    The volume string is also a cheap, consistent device identity, used by
+    CopyScheduler_class for its per device pair concurrency limits.
+    Drive types are returned as FileCopyManager_class.DriveType values (strings), so
+    this class does not depend on FileCopyManager_class.
+
+    One process-wide instance (shared()) is used by all callers; it is cleared at the
+    start of each copy operation, so drives mapped or mounted meanwhile are picked up.
+
+    Usage:
+    ------
+    classifier = DriveClassifier_class.shared()
+    info = classifier.classify("/mnt/nas/videos/a.mkv")   # VolumeInfo(volume='/mnt/nas', fs_type='nfs4', drive_type='network_mapped', ...)
+    if classifier.drive_type(path) in C.COPY_PIPELINE_DRIVE_TYPES: ...
+    key = (classifier.volume(source_path), classifier.volume(target_path))
+    """
+
+    # Linux filesystem types mounted from another machine ("fuse.<name>" user space filesystems are matched separately)
+    NETWORK_FILESYSTEMS = frozenset({
+        'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ncpfs', 'afs', 'ceph', 'glusterfs', 'lustre',
+        'gpfs', '9p', 'davfs', 'fuse', 'sshfs', 'coda', 'ocfs2', 'gfs2',
+    })
+
+    @dataclass(frozen=True)
+    class VolumeInfo:
+        """Classification of one volume."""
+        volume: str                 # drive root, UNC share or mount point ('' for relative paths)
+        drive_type: str             # a FileCopyManager_class.DriveType value
+        fs_type: str = ""           # filesystem type where known (Linux)
+        source: str = ""            # mounted device or remote ("server:/export", "//server/share") where known (Linux)
+
+        @property
+        def is_network(self) -> bool:
+            return self.drive_type in ("network_mapped", "network_unc")
+
+    _shared_instance: Optional[DriveClassifier_class] = None
+    _shared_lock = threading.Lock()
+
+    @staticmethod
+    def shared() -> DriveClassifier_class:
+        """The process-wide classifier."""
+        with DriveClassifier_class._shared_lock:
+            if DriveClassifier_class._shared_instance is None:
+                DriveClassifier_class._shared_instance = DriveClassifier_class()
+            return DriveClassifier_class._shared_instance
+
+    def __init__(self):
+        """Initialize an empty cache (mount information is read on first use)."""
+        self._lock = threading.Lock()
+        self._volumes: dict[str, DriveClassifier_class.VolumeInfo] = {}   # volume -> info
+        self._folders: dict[str, DriveClassifier_class.VolumeInfo] = {}   # parent folder -> info (POSIX longest-prefix results)
+        self._mounts: Optional[list[tuple[str, str, str, str]]] = None    # (mount point, fs type, source, major:minor), longest first
+        self._mount_points: set[str] = set()
+
+    def clear(self):
+        """Forget everything, so the next lookups re-read drive and mount information."""
+        with self._lock:
+            self._volumes.clear()
+            self._folders.clear()
+            self._mounts = None
+            self._mount_points = set()
+
+    def classify(self, path: str) -> DriveClassifier_class.VolumeInfo:
+        """
+        Classify the volume a path is on (the path itself need not exist).
+
+        Args:
+        -----
+        path: File or directory path
+
+        Returns:
+        --------
+        VolumeInfo: Volume, drive type and (Linux) filesystem details
+        """
+        if not path:
+            return DriveClassifier_class.VolumeInfo("", "relative")
+        if os.name == 'nt':
+            return self._classify_windows(path)
+        return self._classify_posix(path)
+
+    def drive_type(self, path: str) -> str:
+        """FileCopyManager_class.DriveType value for a path."""
+        return self.classify(path).drive_type
+
+    def volume(self, path: str) -> str:
+        """Volume (drive root, UNC share or mount point) of a path."""
+        return self.classify(path).volume
+
+    def _classify_windows(self, path: str) -> DriveClassifier_class.VolumeInfo:
+        """Windows: drive root or UNC share, GetDriveTypeW once per drive."""
+        drive = os.path.splitdrive(path)[0]
+        if not drive:
+            return DriveClassifier_class.VolumeInfo("", "relative")
+        volume = drive.upper() + '\\' if not path.startswith('\\\\') else drive.lower()
+        with self._lock:
+            info = self._volumes.get(volume)
+        if info is not None:
+            return info
+
+        if path.startswith('\\\\'):
+            # UNC paths (\\server\share)
+            info = DriveClassifier_class.VolumeInfo(volume, "network_unc")
+        else:
+            try:
+                # Map Windows drive types to DriveType values
+                windows_type = ctypes.windll.kernel32.GetDriveTypeW(ctypes.c_wchar_p(volume))
+                drive_type = {2: "local_removable",   # DRIVE_REMOVABLE
+                              3: "local_fixed",       # DRIVE_FIXED
+                              4: "network_mapped",    # DRIVE_REMOTE
+                              5: "local_removable",   # DRIVE_CDROM
+                              6: "local_fixed",       # DRIVE_RAMDISK
+                              }.get(windows_type, "unknown")
+            except Exception as e:
+                log_and_flush(logging.WARNING, f"Could not determine drive type for {path}: {e}")
+                drive_type = "unknown"
+            info = DriveClassifier_class.VolumeInfo(volume, drive_type)
+        with self._lock:
+            self._volumes[volume] = info
+        return info
+
+    def _classify_posix(self, path: str) -> DriveClassifier_class.VolumeInfo:
+        """Linux (and other POSIX): longest mount point prefix from /proc/self/mountinfo, cached per parent folder."""
+        absolute_path = os.path.abspath(path)
+        folder = os.path.dirname(absolute_path)
+        with self._lock:
+            if self._mounts is None:
+                self._mounts = DriveClassifier_class._read_mountinfo()
+                self._mount_points = {mount[0] for mount in self._mounts}
+            if absolute_path in self._mount_points:
+                folder = absolute_path  # the path is itself a mount point (eg a compared root folder)
+            info = self._folders.get(folder)
+            if info is not None:
+                return info
+            mounts = self._mounts
+
+        info = DriveClassifier_class.VolumeInfo("", "unknown")
+        probe = folder if folder.endswith('/') else folder + '/'
+        for mount_point, fs_type, source, device in mounts:
+            if probe.startswith(mount_point if mount_point.endswith('/') else mount_point + '/'):
+                with self._lock:
+                    info = self._volumes.get(mount_point)
+                if info is None:
+                    info = DriveClassifier_class.VolumeInfo(mount_point, DriveClassifier_class._posix_drive_type(fs_type, device),
+                                                            fs_type, source)
+                break
+        with self._lock:
+            if info.volume:
+                self._volumes[info.volume] = info
+            self._folders[folder] = info
+        return info
+
+    @staticmethod
+    def _posix_drive_type(fs_type: str, device: str) -> str:
+        """DriveType value for a Linux mount."""
+        if fs_type in DriveClassifier_class.NETWORK_FILESYSTEMS or fs_type.startswith('fuse.') or fs_type.startswith('nfs'):
+            return "network_mapped"
+        try:
+            # Partitions have no "removable" flag of their own, their disk (the parent directory) does
+            sys_path = f"/sys/dev/block/{device}"
+            for removable_path in (f"{sys_path}/removable", f"{sys_path}/../removable"):
+                if os.path.exists(removable_path):
+                    with open(removable_path) as f:
+                        if f.read().strip() == '1':
+                            return "local_removable"
+                    break
+        except OSError:
+            pass
+        return "local_fixed"
+
+    @staticmethod
+    def _read_mountinfo() -> list[tuple[str, str, str, str]]:
+        """
+        Parse /proc/self/mountinfo.
+
+        Returns:
+        --------
+        list[tuple[str, str, str, str]]: (mount point, fs type, source, major:minor), longest
+        mount point first (later mounts over the same point win); empty where unavailable
+        """
+        def unescape(field):
+            # mountinfo escapes space, tab, newline and backslash as \ooo octal
+            return re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), field)
+
+        mounts = {}
+        try:
+            with open('/proc/self/mountinfo', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    # 36 35 98:0 /mnt1 /mnt2 rw,noatime master:1 - ext3 /dev/root rw,errors=continue
+                    left, _, right = line.partition(' - ')
+                    fields = left.split()
+                    right_fields = right.split()
+                    if len(fields) < 5 or len(right_fields) < 2:
+                        continue
+                    mounts[unescape(fields[4])] = (right_fields[0], unescape(right_fields[1]), fields[2])
+        except OSError as e:
+            if __debug__:
+                log_and_flush(logging.DEBUG, f"DriveClassifier_class: /proc/self/mountinfo unavailable ({e})")
+            return []
+        return sorted(((mount_point, fs_type, source, device) for mount_point, (fs_type, source, device) in mounts.items()),
+                      key=lambda mount: len(mount[0]), reverse=True)
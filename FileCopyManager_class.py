@@ -14,6 +14,14 @@ from flushed_logging import log_and_flush, get_log_level, LoggerManager
 # Import the things this class references
 from ProgressDialog_class import ProgressDialog_class
 from FileTimestampManager_class import FileTimestampManager_class
+from DriveClassifier_class import DriveClassifier_class # v002.0018 added
+from CopyRateLimiter_class import CopyRateLimiter_class # v002.0024 added
+from CopyTelemetry_class import CopyTelemetry_class # v002.0027 added
+from BatchedLogHandler_class import BatchedLogHandler_class # v002.0028 added
+
+# Optional platform modules # v002.0012 added
+from FolderCompareSync_Global_Imports import ensure_global_import
+fcntl = ensure_global_import("fcntl")  # None on Windows; used for the FICLONE (reflink) ioctl on Linux
 
 class FileCopyManager_class:
     """
@@ -27,7 +35,7 @@ class FileCopyManager_class:
     
     Key Features:
     -------------
-    - Dual copy strategies (Direct and Staged) with automatic selection
+    - Copy strategies (Direct, Staged, Clone, Delta and Resumable) with automatic selection # v002.0015 changed
     - Complete timestamp preservation with rollback capability
     - Dry run mode for safe operation testing without file modifications
     - Comprehensive logging and performance tracking
@@ -55,6 +63,70 @@ class FileCopyManager_class:
         DIRECT = "direct".lower()           # Strategy A: Direct copy for small files on local drives
         STAGED = "staged".lower()           # Strategy B: Staged copy with rename-based backup for large files
         NETWORK = "network".lower()         # Network-optimized copy with retry logic
+        CLONE = "clone".lower()             # Strategy C: clone (reflink) on copy-on-write volumes, no data copied # v002.0012 added
+        DELTA = "delta".lower()             # Strategy D: rewrite only changed blocks of a large existing target, behind an undo journal # v002.0014 added
+        RESUMABLE = "resumable".lower()     # Strategy E: chunk-journaled copy into a partial file which a retry or later session resumes # v002.0015 added
+        HARDLINK = "hardlink".lower()       # Strategy F: hardlink to an already copied member of the same source inode group, no data copied # v002.0021 added
+    
+    class CopyMethod(Enum): # v002.0010 added
+        """
+        Data transfer method used by the copy engine for a file.
+        
+        Purpose:
+        --------
+        Records how the bytes were actually moved. The engine prefers kernel-side
+        zero-copy transfers and falls back per file when a method is unavailable
+        for the source/target filesystems.
+        """
+        COPY_FILE_RANGE = "copy_file_range"   # os.copy_file_range: in-kernel copy, may use reflinks/server-side copy
+        SENDFILE = "sendfile"                 # os.sendfile: in-kernel copy between file descriptors
+        READINTO = "readinto"                 # large-buffer readinto/write loop (always available, eg Windows)
+        PIPELINED = "pipelined"               # reader thread + writer over a ring of buffers, for high-latency drives # v002.0011 added
+        FICLONE = "ficlone"                   # FICLONE ioctl: target shares the source's extents (Btrfs, XFS reflink, ...) # v002.0012 added
+        SPARSE = "sparse"                     # data extents only (SEEK_DATA/SEEK_HOLE), holes recreated on the target # v002.0013 added
+        DELTA_BLOCKS = "delta_blocks"         # changed blocks only, written in place over the existing target # v002.0014 added
+        JOURNALED = "journaled"               # journaled chunks (copy engine, extent aware), resumable from the last good chunk # v002.0015 added
+        SMALL_BATCH = "small_batch"           # whole small file in one read and one write, as part of a batch for one target folder # v002.0022 added
+    
+    # errno values which mean "this transfer method is not usable here", rather than a real I/O error # v002.0010 added
+    _COPY_METHOD_FALLBACK_ERRNOS = frozenset(
+        getattr(errno, name) for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EBADF', 'ENOTSOCK', 'EPERM', 'ETXTBSY', 'ENOTTY')
+        if hasattr(errno, name)
+    )
+    
+    # errno values (and Windows network winerror values) of I/O failures which may clear up on a retry # v002.0015 added
+    _TRANSIENT_COPY_ERRNOS = frozenset(
+        getattr(errno, name) for name in ('EIO', 'EINTR', 'EAGAIN', 'EBUSY', 'ETIMEDOUT', 'ECONNRESET', 'ECONNABORTED',
+                                          'ECONNREFUSED', 'ENETDOWN', 'ENETUNREACH', 'ENETRESET', 'EHOSTDOWN',
+                                          'EHOSTUNREACH', 'EPIPE', 'EREMOTEIO')
+        if hasattr(errno, name)
+    )
+    _TRANSIENT_COPY_WINERRORS = frozenset({
+        32,    # ERROR_SHARING_VIOLATION
+        33,    # ERROR_LOCK_VIOLATION
+        51,    # ERROR_REM_NOT_LIST
+        53,    # ERROR_BAD_NETPATH
+        59,    # ERROR_UNEXP_NET_ERR
+        64,    # ERROR_NETNAME_DELETED
+        121,   # ERROR_SEM_TIMEOUT
+        240,   # ERROR_VC_DISCONNECTED
+        1231,  # ERROR_NETWORK_UNREACHABLE
+        1232,  # ERROR_HOST_UNREACHABLE
+        1236,  # ERROR_CONNECTION_ABORTED
+    })
+    
+    class DurabilityPolicy(Enum): # v002.0020 added
+        """
+        When copied data is forced to disk (C.COPY_DURABILITY_POLICY).
+        
+        Purpose:
+        --------
+        Trades throughput against crash safety: without an fsync a "completed" copy
+        may still be only in the OS cache when power is lost.
+        """
+        NONE = "none"           # never fsync (fastest; the OS writes back in its own time)
+        PER_FILE = "per_file"   # fsync each target and its parent folder before cleanup (safest, slowest for many small files)
+        GROUP = "group"         # group commit: fsync batches of files and their folders every N files or MB
     
     class DriveType(Enum):
         """
@@ -99,16 +171,19 @@ class FileCopyManager_class:
         retry_count: int = 0
         temp_path: str = ""
         backup_path: str = ""
+        copy_method: Optional[FileCopyManager_class.CopyMethod] = None  # how the data was transferred (None in dry run) # v002.0010 added
+        allocated_bytes: Optional[int] = None  # disk space allocated to the target, where the platform reports it (< file_size for sparse files) # v002.0013 added
     
     @staticmethod
     def get_drive_type(path: str) -> FileCopyManager_class.DriveType:
         """
-        Determine the drive type for a given path using Windows API.
+        Determine the drive type for a given path (Windows API, or /proc/self/mountinfo on Linux). # v002.0018 changed
         
         Purpose:
         --------
         Analyzes the drive type to enable optimal copy strategy selection
-        based on drive characteristics.
+        based on drive characteristics. Lookups go through the shared
+        DriveClassifier_class cache, so each drive/mount is only classified once. # v002.0018 added
         
         Args:
         -----
@@ -124,40 +199,7 @@ class FileCopyManager_class:
         if drive_type == FileCopyManager_class.DriveType.NETWORK_MAPPED:
             # Use network-optimized copy strategy
         """
-        if not path:
-            return FileCopyManager_class.DriveType.RELATIVE
-        
-        # Handle UNC paths (\\server\share)
-        if path.startswith('\\\\'):
-            return FileCopyManager_class.DriveType.NETWORK_UNC
-        
-        # Extract drive letter
-        drive = os.path.splitdrive(path)[0]
-        if not drive:
-            return FileCopyManager_class.DriveType.RELATIVE
-        
-        try:
-            # Use Windows API to determine drive type
-            drive_root = drive + '\\'
-            drive_type = ctypes.windll.kernel32.GetDriveTypeW(ctypes.c_wchar_p(drive_root))
-            
-            # Map Windows drive types to our enum
-            if drive_type == 2:  # DRIVE_REMOVABLE
-                return FileCopyManager_class.DriveType.LOCAL_REMOVABLE
-            elif drive_type == 3:  # DRIVE_FIXED
-                return FileCopyManager_class.DriveType.LOCAL_FIXED
-            elif drive_type == 4:  # DRIVE_REMOTE
-                return FileCopyManager_class.DriveType.NETWORK_MAPPED
-            elif drive_type == 5:  # DRIVE_CDROM
-                return FileCopyManager_class.DriveType.LOCAL_REMOVABLE
-            elif drive_type == 6:  # DRIVE_RAMDISK
-                return FileCopyManager_class.DriveType.LOCAL_FIXED
-            else:
-                return FileCopyManager_class.DriveType.UNKNOWN
-                
-        except Exception as e:
-            log_and_flush(logging.WARNING, f"Could not determine drive type for {path}: {e}")
-            return FileCopyManager_class.DriveType.UNKNOWN
+        return FileCopyManager_class.DriveType(DriveClassifier_class.shared().drive_type(path)) # v002.0018 changed [cached classification]
     
     @staticmethod
     def determine_copy_strategy(source_path: str, target_path: str, file_size: int) -> FileCopyManager_class.CopyStrategy:
@@ -166,33 +208,86 @@ class FileCopyManager_class:
         
         Purpose:
         --------
-        Analyzes file characteristics and drive types to select the most efficient
-        copy strategy for optimal performance and reliability.
+        Looks up the drive types and target state for one file and applies
+        choose_copy_strategy. CopyPlan_class calls choose_copy_strategy directly, with
+        drive types looked up once per plan and target state from the comparison. # v002.0017 changed
+        
+        Args:
+        -----
+        source_path: Source file path for analysis
+        target_path: Target file path for analysis  
+        file_size: File size in bytes for threshold comparison
+        
+        Returns:
+        --------
+        CopyStrategy: Optimal strategy for the given file and drive combination
+        """
+        try: # v002.0014 changed [one stat for the target's existence and link count]
+            target_stat = os.stat(target_path)
+            target_exists = stat.S_ISREG(target_stat.st_mode)
+        except OSError:
+            target_stat = None
+            target_exists = False
+        return FileCopyManager_class.choose_copy_strategy(
+            file_size,
+            FileCopyManager_class.get_drive_type(source_path),
+            FileCopyManager_class.get_drive_type(target_path),
+            target_exists,
+            os.path.exists(target_path + C.COPY_RESUMABLE_PARTIAL_SUFFIX + C.COPY_RESUMABLE_JOURNAL_SUFFIX),
+            target_exists and target_stat.st_nlink > 1,
+        )
+    
+    @staticmethod
+    def choose_copy_strategy(file_size: int, source_drive_type: FileCopyManager_class.DriveType,
+                             target_drive_type: FileCopyManager_class.DriveType,
+                             target_exists: bool, partial_exists: bool,
+                             target_hardlinked: bool = False) -> FileCopyManager_class.CopyStrategy: # v002.0017 added [split out of determine_copy_strategy, no file system access], v002.0014 changed [target_hardlinked]
+        """
+        Select the copy strategy from already known file and drive characteristics.
         
         Strategy Logic:
         ---------------
-        - Network drives always use STAGED strategy (rename-based backup)
-        - Files >= COPY_STRATEGY_THRESHOLD use STAGED strategy (rename-based backup)
+        - A target with an unfinished partial copy (from a failed attempt or earlier session) uses RESUMABLE strategy # v002.0015 added
+        - Network drives use RESUMABLE strategy for files >= COPY_RESUMABLE_THRESHOLD, else STAGED strategy (COPY_STAGED_MODE) # v002.0016 changed
+        - Files >= COPY_DELTA_THRESHOLD whose target already exists use DELTA strategy (changed blocks only), # v002.0014 added
+          unless the target has other hardlinks (an in-place update would change them too)
+        - Files >= COPY_RESUMABLE_THRESHOLD use RESUMABLE strategy (journaled chunks, resumable) # v002.0015 added
+        - Files >= COPY_STRATEGY_THRESHOLD use STAGED strategy (temp file + atomic replace, or rename-based backup, per COPY_STAGED_MODE) # v002.0016 changed
         - Small files on local drives use DIRECT strategy
         
         Args:
         -----
-        source_path: Source file path for analysis
-        target_path: Target file path for analysis  
         file_size: File size in bytes for threshold comparison
+        source_drive_type: DriveType of the source
+        target_drive_type: DriveType of the target
+        target_exists: Whether the target file already exists
+        partial_exists: Whether the target has an unfinished RESUMABLE partial copy (its journal exists)
+        target_hardlinked: Whether the existing target has more than one hardlink (st_nlink > 1) # v002.0014 added
         
         Returns:
         --------
         CopyStrategy: Optimal strategy for the given file and drive combination
         """
-        source_drive_type = FileCopyManager_class.get_drive_type(source_path)
-        target_drive_type = FileCopyManager_class.get_drive_type(target_path)
+        # An unfinished partial copy of this target is always resumed # v002.0015 added
+        if partial_exists:
+            return FileCopyManager_class.CopyStrategy.RESUMABLE
         
-        # Network drives always use staged strategy (rename-based backup)
+        # Network drives always use staged strategy (rename-based backup), or resumable for very large files # v002.0015 changed
         if (source_drive_type in [FileCopyManager_class.DriveType.NETWORK_MAPPED, FileCopyManager_class.DriveType.NETWORK_UNC] or
             target_drive_type in [FileCopyManager_class.DriveType.NETWORK_MAPPED, FileCopyManager_class.DriveType.NETWORK_UNC]):
+            if file_size >= C.COPY_RESUMABLE_THRESHOLD:
+                return FileCopyManager_class.CopyStrategy.RESUMABLE
             return FileCopyManager_class.CopyStrategy.STAGED
         
+        # Very large files replacing an existing target only rewrite the blocks which changed # v002.0014 added
+        # (not a hardlinked target: the replacing strategies break the link, an in-place update would not) # v002.0014 changed
+        if file_size >= C.COPY_DELTA_THRESHOLD and target_exists and not target_hardlinked:
+            return FileCopyManager_class.CopyStrategy.DELTA
+        
+        # Very large new files copy resumably # v002.0015 added
+        if file_size >= C.COPY_RESUMABLE_THRESHOLD:
+            return FileCopyManager_class.CopyStrategy.RESUMABLE
+        
         # Large files use staged strategy (rename-based backup)
         if file_size >= C.COPY_STRATEGY_THRESHOLD:
             return FileCopyManager_class.CopyStrategy.STAGED
@@ -209,6 +304,9 @@ class FileCopyManager_class:
         --------
         Establishes isolated logging for individual copy operations to enable
         detailed tracking, debugging, and performance analysis per operation.
+        With C.COPY_LOG_ASYNC the file is written by a BatchedLogHandler_class (a
+        background thread, batched writes, flushed within C.COPY_LOG_FLUSH_INTERVAL_SECONDS)
+        so copy workers never wait on the log file. # v002.0028 added
         
         Args:
         -----
@@ -231,8 +329,11 @@ class FileCopyManager_class:
         operation_logger = logging.getLogger(f"copy_operation_{operation_id}")
         operation_logger.setLevel(logging.DEBUG)
         
-        # Create file handler for this operation with UTF-8 encoding
-        file_handler = logging.FileHandler(log_filepath, mode='w', encoding='utf-8')
+        # Create file handler for this operation with UTF-8 encoding (batched on a background thread, or written per line) # v002.0028 changed
+        if C.COPY_LOG_ASYNC:
+            file_handler = BatchedLogHandler_class(log_filepath, mode='w', encoding='utf-8')
+        else:
+            file_handler = logging.FileHandler(log_filepath, mode='w', encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         
         # Create formatter for operation logs
@@ -263,6 +364,23 @@ class FileCopyManager_class:
         self.dry_run_mode = False  # New: Dry run mode flag
         self.operation_sequence = 0  # New: Sequential numbering for operations
         
+        # copy_file may be called from several CopyScheduler_class workers at once # v002.0009 added
+        self._sequence_lock = threading.Lock()  # guards operation_sequence
+        self._log_lock = threading.Lock()       # keeps each file's buffered log lines together
+        self._thread_state = threading.local()  # per-worker log buffer (see buffered_log)
+        self._status_to_debug_log = True        # also send status lines to the main log; only while it logs DEBUG (set per operation) # v002.0028 added
+        self._unsupported_copy_methods: dict[tuple[int, int], set] = {}  # (source st_dev, target st_dev) -> CopyMethods which failed # v002.0010 added
+        self._clone_unsupported_volumes: set[str] = set()  # volumes (DriveClassifier_class) where cloning failed as unsupported # v002.0012 added
+        self._resumable_partials: list[str] = []  # partial files of RESUMABLE copies which failed this operation # v002.0015 added
+        self._durability_lock = threading.Lock()  # guards the group commit and fsync statistics below # v002.0020 added
+        self._durability_group: list[tuple[str, list[str]]] = []  # (target path, cleanup paths) awaiting a group commit
+        self._durability_group_bytes = 0
+        self._fsync_count = 0
+        self._fsync_seconds = 0.0
+        self.rate_limiter = CopyRateLimiter_class(C.COPY_RATE_LIMIT_BYTES_PER_SECOND, C.COPY_RATE_LIMIT_FILES_PER_SECOND)  # shared by all workers # v002.0024 added
+        self.telemetry = CopyTelemetry_class()  # per-file throughput and latency, rolling across operations # v002.0027 added
+        self.operation_log_path: Optional[str] = None  # the metrics file is written beside it # v002.0027 added
+        
         # Log timezone information for the copy manager
         log_and_flush(logging.INFO, f"FileCopyManager_class initialized with timezone: {self.timestamp_manager.get_timezone_string()}")
 
@@ -283,14 +401,271 @@ class FileCopyManager_class:
         self.timestamp_manager = FileTimestampManager_class(dry_run=enabled)  # Update timestamp manager
         mode_text = "DRY RUN" if enabled else "NORMAL"
         self._log_status(f"Copy manager mode set to: {mode_text}")
+    
+    def device_pair_key(self, source_path: str, target_path: str) -> str: # v002.0027 added
+        """Telemetry key of the (source volume, target volume) pair of a copy."""
+        classifier = DriveClassifier_class.shared()
+        return CopyTelemetry_class.device_pair_key(classifier.volume(source_path), classifier.volume(target_path))
+    
+    def _record_telemetry(self, result: FileCopyManager_class.CopyOperationResult): # v002.0027 added
+        """Add a successful, real (not dry run) copy to the telemetry; clones move no data, so they stay out of the device pair throughput."""
+        if not result.success or self.dry_run_mode or not C.COPY_TELEMETRY_ENABLED:
+            return
+        device_pair = None if result.strategy_used == FileCopyManager_class.CopyStrategy.CLONE else self.device_pair_key(result.source_path, result.target_path)
+        self.telemetry.record(device_pair, result.strategy_used.value, result.file_size, result.bytes_copied, result.duration_seconds)
+    
+    def set_rate_limits(self, bytes_per_second: Optional[float] = None, files_per_second: Optional[float] = None): # v002.0024 added
+        """
+        Change the copy bandwidth and/or IOPS limits, including while a copy is running.
+        
+        Args:
+        -----
+        bytes_per_second: Bandwidth limit over all workers (None = unchanged, 0 = unlimited)
+        files_per_second: Files started per second over all workers (None = unchanged, 0 = unlimited)
+        """
+        before = self.rate_limiter.limits
+        self.rate_limiter.set_limits(bytes_per_second, files_per_second)
+        if self.rate_limiter.limits != before:
+            self._log_status(f"Rate limit changed to {CopyRateLimiter_class.format_limits(*self.rate_limiter.limits)}")
         
     def _log_status(self, message: str):
         """Log status message to both operation logger and status callback."""
+        detail = getattr(self._thread_state, 'file_detail', None) # v002.0028 added [held by file_log_scope()]
+        if detail is not None:
+            detail.append(message)
+            return
+        buffer = getattr(self._thread_state, 'log_buffer', None) # v002.0009 added [hold lines while inside buffered_log()]
+        if buffer is not None:
+            buffer.append(message)
+            return
+        with self._log_lock:
+            self._emit_status(message)
+    
+    def _emit_status(self, message: str): # v002.0009 added [split out of _log_status]
+        """Write one status message to the operation logger and status callback (caller holds _log_lock)."""
         if self.operation_logger:
             self.operation_logger.info(message)
         if self.status_callback:
             self.status_callback(message)
-        log_and_flush(logging.DEBUG, f"Copy operation status: {message}")
+        if self._status_to_debug_log: # v002.0028 changed [log_and_flush flushes every handler, even for a filtered DEBUG line]
+            log_and_flush(logging.DEBUG, f"Copy operation status: {message}")
+    
+    @contextlib.contextmanager
+    def buffered_log(self): # v002.0009 added
+        """
+        Buffer this thread's status messages and write them out as one block on exit.
+        
+        Purpose:
+        --------
+        When several files are copied concurrently, each worker wraps its file in
+        buffered_log() so the operation log shows every file's lines together
+        instead of interleaved with other workers' lines.
+        
+        Usage:
+        ------
+        with copy_manager.buffered_log():
+            result = copy_manager.copy_file(source, target, overwrite=True)
+        """
+        if getattr(self._thread_state, 'log_buffer', None) is not None:
+            yield  # Already buffering on this thread
+            return
+        self._thread_state.log_buffer = []
+        try:
+            yield
+        finally:
+            messages = self._thread_state.log_buffer
+            self._thread_state.log_buffer = None
+            if messages:
+                with self._log_lock:
+                    for message in messages:
+                        self._emit_status(message)
+    
+    @contextlib.contextmanager
+    def file_log_scope(self): # v002.0028 added
+        """
+        Hold this thread's detail lines for one file while C.COPY_LOG_VERBOSITY is "summary".
+        
+        Purpose:
+        --------
+        copy_file logs 8 to 12 lines per file (more with strategy detail); for trees of
+        many files that is most of the log, and of the work. In "summary" verbosity
+        the lines logged inside the scope are held rather than logged, and the caller
+        logs one structured line for the file instead (file_summary_line), plus the
+        held lines only when the file failed. If an exception escapes the scope the
+        held lines are logged before it propagates.
+        
+        Returns:
+        --------
+        Yields the list of held lines, or None in "detailed" verbosity (lines are logged as usual)
+        
+        Usage:
+        ------
+        with self.file_log_scope() as detail_lines:
+            result = ...
+        if detail_lines is not None:
+            ...
+        """
+        if C.COPY_LOG_VERBOSITY != "summary" or getattr(self._thread_state, 'file_detail', None) is not None:
+            yield None
+            return
+        detail_lines = []
+        self._thread_state.file_detail = detail_lines
+        try:
+            yield detail_lines
+        except BaseException:
+            self._thread_state.file_detail = None
+            for message in detail_lines:
+                self._log_status(message)
+            raise
+        finally:
+            self._thread_state.file_detail = None
+    
+    def _log_file_result(self, detail_lines: list[str], sequence_number: int, result: FileCopyManager_class.CopyOperationResult): # v002.0028 added
+        """Log a file's held detail lines when it failed, then its one line summary (file_log_scope)."""
+        if not result.success:
+            for message in detail_lines:
+                self._log_status(message)
+        self._log_status(self.file_summary_line(sequence_number, result))
+    
+    def file_summary_line(self, sequence_number: int, result: FileCopyManager_class.CopyOperationResult) -> str: # v002.0028 added
+        """
+        One structured line for a copied (or linked) file: key=value fields, paths quoted last.
+        
+        Returns:
+        --------
+        str: eg 'File [12] SUCCESSFUL strategy=direct method=copy_file_range size=1,048,576 copied=1,048,576 seconds=0.012 verified=True source="..." target="..."'
+        """
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        fields = [
+            f"{dry_run_prefix}File [{sequence_number}] {'SUCCESSFUL' if result.success else 'FAILED'}",
+            f"strategy={result.strategy_used.value}",
+            f"method={result.copy_method.value if result.copy_method else '-'}",
+            f"size={result.file_size:,}",
+            f"copied={result.bytes_copied:,}",
+            f"seconds={result.duration_seconds:.3f}",
+            f"verified={result.verification_passed}",
+        ]
+        if result.retry_count:
+            fields.append(f"retries={result.retry_count}")
+        if not result.success:
+            fields.append(f"error={json.dumps(result.error_message)}")
+        fields.append(f"source={json.dumps(result.source_path)}")
+        fields.append(f"target={json.dumps(result.target_path)}")
+        return " ".join(fields)
+    
+    @staticmethod
+    def fsync_path(path: str, is_directory: bool = False) -> bool: # v002.0020 added
+        """
+        Flush a file (or a directory entry table) to disk by path.
+        
+        Directories can only be flushed on POSIX; on Windows directory updates are
+        covered by the NTFS metadata journal, so they are skipped (returns False).
+        Files are opened for writing on Windows, which FlushFileBuffers requires.
+        
+        Returns:
+        --------
+        bool: True if flushed, False if not possible here
+        """
+        if is_directory:
+            if os.name == 'nt':
+                return False
+            directory_fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+            return True
+        with open(path, 'r+b' if os.name == 'nt' else 'rb', buffering=0) as f:
+            os.fsync(f.fileno())
+        return True
+    
+    def _fsync_timed(self, path: str, is_directory: bool = False): # v002.0020 added
+        """fsync_path, adding the call and its duration to this operation's durability statistics."""
+        start_time = time.perf_counter()
+        flushed = FileCopyManager_class.fsync_path(path, is_directory)
+        elapsed = time.perf_counter() - start_time
+        if flushed:
+            with self._durability_lock:
+                self._fsync_count += 1
+                self._fsync_seconds += elapsed
+    
+    def _commit_durable(self, target_path: str, file_size: int, cleanup_paths: Optional[list[str]] = None): # v002.0020 added
+        """
+        Apply the durability policy to a completed copy, then remove its cleanup files.
+        
+        Purpose:
+        --------
+        cleanup_paths (eg a STAGED backup, or a DELTA journal) must only be removed
+        once the new target is safely on disk, so they are removed after the fsync:
+        - NONE: no fsync, cleanup files removed now
+        - PER_FILE: the target and its parent directory are fsynced now, then cleanup
+        - GROUP: the target joins the pending group; when the group reaches
+          COPY_DURABILITY_GROUP_FILES files or COPY_DURABILITY_GROUP_BYTES bytes, every
+          file in it and each distinct parent directory are fsynced once, then all the
+          group's cleanup files are removed (also done by flush_durable at the end of
+          the operation)
+        
+        Args:
+        -----
+        target_path: Completed target file
+        file_size: Its size in bytes (for the group byte threshold)
+        cleanup_paths: Files to remove once the target is durable
+        """
+        cleanup_paths = [path for path in (cleanup_paths or []) if path]
+        policy = FileCopyManager_class.DurabilityPolicy(C.COPY_DURABILITY_POLICY)
+        if policy == FileCopyManager_class.DurabilityPolicy.PER_FILE:
+            try:
+                self._fsync_timed(target_path)
+                self._fsync_timed(os.path.dirname(os.path.abspath(target_path)), is_directory=True)
+            except OSError as e:
+                self._log_status(f"Warning: Could not flush {target_path} to disk: {e}")
+        elif policy == FileCopyManager_class.DurabilityPolicy.GROUP:
+            with self._durability_lock:
+                self._durability_group.append((target_path, cleanup_paths))
+                self._durability_group_bytes += file_size
+                group_full = (len(self._durability_group) >= C.COPY_DURABILITY_GROUP_FILES or
+                              self._durability_group_bytes >= C.COPY_DURABILITY_GROUP_BYTES)
+            if group_full:
+                self.flush_durable()
+            return
+        self._remove_cleanup_paths(cleanup_paths)
+    
+    def flush_durable(self): # v002.0020 added
+        """Group commit: fsync every pending file and each of their parent directories once, then remove their cleanup files."""
+        with self._durability_lock:
+            group = self._durability_group
+            self._durability_group = []
+            self._durability_group_bytes = 0
+        if not group:
+            return
+        directories = set()
+        for target_path, _ in group:
+            try:
+                self._fsync_timed(target_path)
+            except OSError as e:
+                self._log_status(f"Warning: Could not flush {target_path} to disk: {e}")
+            directories.add(os.path.dirname(os.path.abspath(target_path)))
+        for directory in sorted(directories):
+            try:
+                self._fsync_timed(directory, is_directory=True)
+            except OSError as e:
+                self._log_status(f"Warning: Could not flush folder {directory} to disk: {e}")
+        for _, cleanup_paths in group:
+            self._remove_cleanup_paths(cleanup_paths)
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"Group commit: {len(group)} files in {len(directories)} folders flushed to disk")
+    
+    def _remove_cleanup_paths(self, cleanup_paths: list[str]): # v002.0020 added
+        """Remove files which are no longer needed once a copy is durable (non-critical if it fails)."""
+        for path in cleanup_paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+                    self._log_status(f"Removed: {path}")
+            except Exception as e:
+                # Non-critical - the copy itself succeeded
+                self._log_status(f"Warning: Could not remove {path}: {e}")
+                self._log_status("This is not critical - copy operation succeeded")
     
     def _verify_copy(self, source_path: str, target_path: str) -> bool:
         """
@@ -326,122 +701,1193 @@ class FileCopyManager_class:
             self._log_status(f"Simple verification error: {str(e)}")
             return False
     
-    def _copy_direct_strategy(self, source_path: str, target_path: str) -> FileCopyManager_class.CopyOperationResult:
+    @staticmethod
+    def available_copy_methods() -> list[FileCopyManager_class.CopyMethod]: # v002.0010 added
+        """Copy methods supported by this platform, in order of preference."""
+        methods = []
+        if hasattr(os, 'copy_file_range'):
+            methods.append(FileCopyManager_class.CopyMethod.COPY_FILE_RANGE)
+        if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):  # other platforms only sendfile to sockets
+            methods.append(FileCopyManager_class.CopyMethod.SENDFILE)
+        methods.append(FileCopyManager_class.CopyMethod.READINTO)
+        return methods
+    
+    @staticmethod
+    def copy_file_data(source_fd: int, target_fd: int, file_size: int,
+                       methods: list[FileCopyManager_class.CopyMethod],
+                       unsupported: Optional[set] = None,
+                       progress_callback=None,
+                       max_chunk_size: Optional[int] = None) -> tuple[int, FileCopyManager_class.CopyMethod]: # v002.0010 added, v002.0011 changed [progress per chunk], v002.0024 changed [max_chunk_size]
         """
-        Strategy A: Direct copy for small files on local drives (with dry run support).
-        Uses shutil.copy2 with error handling and Simple verification.
+        Copy all data from source_fd to target_fd using the first method that works.
+        
+        Purpose:
+        --------
+        The copy engine: tries each method in order, continuing from the current
+        offset when a method turns out not to be supported (eg copy_file_range across
+        filesystems on older kernels, or sendfile on a filesystem without splice support).
+        Methods which fail that way are added to `unsupported` so later files on the same
+        device pair go straight to a working method. Both descriptors must be positioned
+        at offset 0 and the target opened for writing.
+        
+        Args:
+        -----
+        source_fd: Source file descriptor (opened for reading)
+        target_fd: Target file descriptor (opened for writing, truncated)
+        file_size: Source size in bytes, from fstat
+        methods: CopyMethods to try, in order (READINTO should be last, it always works)
+        unsupported: Optional set of CopyMethods known not to work here, updated in place
+        progress_callback: Optional callable(bytes_copied_so_far), called after every chunk
+        max_chunk_size: Optional cap on the chunk size (CopyRateLimiter_class.max_chunk_size) # v002.0024 added
+        
+        Returns:
+        --------
+        tuple[int, CopyMethod]: Bytes copied, and the method that completed the copy
+        
+        Raises:
+        -------
+        OSError: A real I/O error (disk full, permission denied, device error, ...)
         """
-        start_time = time.time()
-        file_size = Path(source_path).stat().st_size
+        if unsupported is None:
+            unsupported = set()
+        kernel_chunk_size = min(C.COPY_ENGINE_KERNEL_CHUNK_SIZE, max_chunk_size or C.COPY_ENGINE_KERNEL_CHUNK_SIZE) # v002.0024 added
+        offset = 0
+        for method in methods:
+            if method in unsupported and method != FileCopyManager_class.CopyMethod.READINTO:
+                continue
+            try:
+                if method == FileCopyManager_class.CopyMethod.COPY_FILE_RANGE:
+                    while offset < file_size:
+                        copied = os.copy_file_range(source_fd, target_fd, min(kernel_chunk_size, file_size - offset))
+                        if copied == 0:
+                            break  # EOF (file shrank) or a filesystem which reports 0 instead of an error
+                        offset += copied
+                        if progress_callback:
+                            progress_callback(offset)
+                    if offset == 0 and file_size > 0:
+                        raise OSError(errno.ENOSYS, "copy_file_range copied no data")
+                    if offset < file_size:
+                        continue  # finish with the next method from the current offset
+                    return offset, method
+                elif method == FileCopyManager_class.CopyMethod.SENDFILE:
+                    while offset < file_size:
+                        sent = os.sendfile(target_fd, source_fd, offset, min(kernel_chunk_size, file_size - offset))
+                        if sent == 0:
+                            break
+                        offset += sent
+                        if progress_callback:
+                            progress_callback(offset)
+                    os.lseek(source_fd, offset, os.SEEK_SET)  # sendfile with an explicit offset does not move the source position
+                    if offset < file_size:
+                        continue
+                    return offset, method
+                else:
+                    # readinto loop: reads until EOF, so it also picks up anything left by the methods above
+                    buffer = bytearray(min(C.COPY_ENGINE_BUFFER_SIZE, kernel_chunk_size, max(file_size - offset, 1)))
+                    view = memoryview(buffer)
+                    with open(source_fd, 'rb', buffering=0, closefd=False) as source_file:
+                        while True:
+                            read = source_file.readinto(view)
+                            if not read:
+                                break
+                            written = 0
+                            while written < read:
+                                written += os.write(target_fd, view[written:read])
+                            offset += read
+                            if progress_callback:
+                                progress_callback(offset)
+                    return offset, method
+            except OSError as e:
+                if e.errno not in FileCopyManager_class._COPY_METHOD_FALLBACK_ERRNOS or method == FileCopyManager_class.CopyMethod.READINTO:
+                    raise
+                unsupported.add(method)
+                if __debug__:
+                    log_and_flush(logging.DEBUG, f"Copy method {method.value} unavailable ({e}), falling back at offset {offset:,}")
+                # Continue from where the failed method stopped
+                os.lseek(source_fd, offset, os.SEEK_SET)
+                os.lseek(target_fd, offset, os.SEEK_SET)
+        raise OSError(errno.ENOSYS, f"No copy method completed the copy ({offset:,} of {file_size:,} bytes copied)")
+    
+    @staticmethod
+    def copy_file_data_range(source_fd: int, target_fd: int, start: int, end: int,
+                             methods: list[FileCopyManager_class.CopyMethod],
+                             unsupported: Optional[set] = None,
+                             progress_callback=None,
+                             max_chunk_size: Optional[int] = None) -> FileCopyManager_class.CopyMethod: # v002.0015 added [copy engine for journaled chunks]
+        """
+        Copy bytes start..end of source_fd to the same offsets of target_fd, using the first method that works.
         
-        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
-        self._log_status(f"{dry_run_prefix}Using DIRECT strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        Purpose:
+        --------
+        copy_file_data for one range of a file (a RESUMABLE chunk, or one data extent of
+        it): copy_file_range and sendfile are given explicit offsets, the read/write
+        fallback seeks both descriptors, so neither descriptor's position matters.
+        Methods which turn out not to be supported are added to `unsupported`, as in
+        copy_file_data, and the copy continues from where they stopped.
         
-        result = FileCopyManager_class.CopyOperationResult(
-            success=False,
-            strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
-            source_path=source_path,
-            target_path=target_path,
-            file_size=file_size,
-            duration_seconds=0,
-            bytes_copied=0
-        )
+        Args:
+        -----
+        source_fd: Source file descriptor
+        target_fd: Target file descriptor (opened for writing)
+        start: First offset to copy
+        end: Offset to copy up to (exclusive)
+        methods: CopyMethods to try, in order (READINTO should be last, it always works)
+        unsupported: Optional set of CopyMethods known not to work here, updated in place
+        progress_callback: Optional callable(offset_reached), called after every chunk
+        max_chunk_size: Optional cap on the chunk size (CopyRateLimiter_class.max_chunk_size)
         
-        try:
-            # Ensure target directory exists (or simulate in dry run)
-            target_dir = Path(target_path).parent
-            if target_dir and not target_dir.exists():
-                if self.dry_run_mode:
-                    self._log_status(f"DRY RUN: Would create target directory: {target_dir}")
+        Returns:
+        --------
+        CopyMethod: The method that completed the range
+        
+        Raises:
+        -------
+        OSError: A real I/O error, or the source ended before `end` (it shrank while copying)
+        """
+        if unsupported is None:
+            unsupported = set()
+        kernel_chunk_size = min(C.COPY_ENGINE_KERNEL_CHUNK_SIZE, max_chunk_size or C.COPY_ENGINE_KERNEL_CHUNK_SIZE)
+        position = start
+        for method in methods:
+            if method in unsupported and method != FileCopyManager_class.CopyMethod.READINTO:
+                continue
+            try:
+                if method == FileCopyManager_class.CopyMethod.COPY_FILE_RANGE:
+                    while position < end:
+                        copied = os.copy_file_range(source_fd, target_fd, min(kernel_chunk_size, end - position), position, position)
+                        if copied == 0:
+                            break
+                        position += copied
+                        if progress_callback:
+                            progress_callback(position)
+                    if position == start and end > start:
+                        raise OSError(errno.ENOSYS, "copy_file_range copied no data")
+                    if position < end:
+                        continue  # finish with the next method from the current offset
+                    return method
+                elif method == FileCopyManager_class.CopyMethod.SENDFILE:
+                    os.lseek(target_fd, position, os.SEEK_SET)
+                    while position < end:
+                        sent = os.sendfile(target_fd, source_fd, position, min(kernel_chunk_size, end - position))
+                        if sent == 0:
+                            break
+                        position += sent
+                        if progress_callback:
+                            progress_callback(position)
+                    if position < end:
+                        continue
+                    return method
                 else:
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    self._log_status(f"Created target directory: {target_dir}")
-            
-            # Perform direct copy (or simulate in dry run)
-            self._log_status(f"{dry_run_prefix}Copying: {source_path} -> {target_path}")
-            
-            if not self.dry_run_mode:
-                shutil.copy2(source_path, target_path)
-                result.bytes_copied = file_size
-                
-                # Copy timestamps from source to target for complete preservation
-                self.timestamp_manager.copy_timestamps(source_path, target_path)
-            else:
-                # Simulate copy operation
-                result.bytes_copied = file_size
-                self._log_status(f"DRY RUN: Would copy timestamps from source to target")
-            
-            # Verify the copy (or simulate Simple verification in dry run)
-            if self._verify_copy(source_path, target_path):
-                result.success = True
-                result.verification_passed = True
-                self._log_status(f"{dry_run_prefix}DIRECT copy completed successfully")
-            else:
-                result.error_message = "Copy Simple verification failed"
-                self._log_status(f"{dry_run_prefix}DIRECT copy failed Simple verification")
-                
-        except Exception as e:
-            if not self.dry_run_mode:
-                result.error_message = str(e)
-                self._log_status(f"DIRECT copy failed: {str(e)}")
-            else:
-                # In dry run, we don't expect real exceptions
-                result.success = True
-                result.verification_passed = True
-                self._log_status(f"DRY RUN: DIRECT copy simulation completed")
+                    os.lseek(source_fd, position, os.SEEK_SET)
+                    os.lseek(target_fd, position, os.SEEK_SET)
+                    while position < end:
+                        data = os.read(source_fd, min(C.COPY_ENGINE_BUFFER_SIZE, kernel_chunk_size, end - position))
+                        if not data:
+                            raise OSError(errno.EIO, f"Source file shrank during copy (at offset {position:,})")
+                        with memoryview(data) as view:
+                            written = 0
+                            while written < len(data):
+                                written += os.write(target_fd, view[written:])
+                        position += len(data)
+                        if progress_callback:
+                            progress_callback(position)
+                    return method
+            except OSError as e:
+                if e.errno not in FileCopyManager_class._COPY_METHOD_FALLBACK_ERRNOS or method == FileCopyManager_class.CopyMethod.READINTO:
+                    raise
+                unsupported.add(method)
+                if __debug__:
+                    log_and_flush(logging.DEBUG, f"Copy method {method.value} unavailable ({e}), falling back at offset {position:,}")
+        raise OSError(errno.ENOSYS, f"No copy method completed the range ({position:,} of {start:,}-{end:,} copied)")
+    
+    FICLONE_IOCTL = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h # v002.0012 added
+    
+    @staticmethod
+    def clone_file_data(source_fd: int, target_fd: int): # v002.0012 added
+        """
+        Make target_fd share source_fd's data extents (reflink) with the FICLONE ioctl.
         
-        result.duration_seconds = time.time() - start_time
-        return result
+        Raises:
+        -------
+        OSError: Cloning is unsupported (other platform, other filesystem, different volumes) or failed
+        """
+        if fcntl is None or not sys.platform.startswith('linux'):
+            raise OSError(errno.EOPNOTSUPP, "File cloning is not supported on this platform")
+        fcntl.ioctl(target_fd, FileCopyManager_class.FICLONE_IOCTL, source_fd)
     
-    def _copy_staged_strategy(self, source_path: str, target_path: str, overwrite: bool = True) -> FileCopyManager_class.CopyOperationResult:
+    @staticmethod
+    def get_pipeline_settings(source_path: str, target_path: str) -> Optional[tuple[int, int]]: # v002.0011 added
         """
-        Strategy B: staged copy using rename-based backup for large files or network drives (with dry run support).
-        Implements 4-step process: save timestamps -> rename to backup -> copy source -> verify
-        Uses atomic rename operations instead of expensive copy operations for backup.
+        Chunk size and queue depth for a pipelined copy, or None when the pipeline is not wanted.
+        
+        Purpose:
+        --------
+        The pipeline pays off when reads or writes have high latency (network shares).
+        Settings come from C.COPY_PIPELINE_CHUNK_SIZES / C.COPY_PIPELINE_QUEUE_DEPTHS keyed by
+        the DriveType value of either end; where both ends qualify the larger values win.
+        
+        Returns:
+        --------
+        Optional[tuple[int, int]]: (chunk_size, queue_depth), or None for a non-pipelined copy
         """
-        start_time = time.time()
-        file_size = Path(source_path).stat().st_size
+        drive_types = {FileCopyManager_class.get_drive_type(source_path).value,
+                       FileCopyManager_class.get_drive_type(target_path).value}
+        pipelined_types = drive_types.intersection(C.COPY_PIPELINE_DRIVE_TYPES)
+        if not pipelined_types:
+            return None
+        chunk_size = max(C.COPY_PIPELINE_CHUNK_SIZES.get(t, C.COPY_CHUNK_SIZE) for t in pipelined_types)
+        queue_depth = max(C.COPY_PIPELINE_QUEUE_DEPTHS.get(t, C.COPY_PIPELINE_DEFAULT_QUEUE_DEPTH) for t in pipelined_types)
+        return max(4096, int(chunk_size)), max(2, int(queue_depth))
+    
+    @staticmethod
+    def copy_file_data_pipelined(source_fd: int, target_fd: int, chunk_size: int, queue_depth: int,
+                                 progress_callback=None) -> int: # v002.0011 added
+        """
+        Copy all data from source_fd to target_fd with a reader thread and this thread writing.
         
-        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
-        self._log_status(f"{dry_run_prefix}Using STAGED strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        Purpose:
+        --------
+        Double (or deeper) buffering for high-latency drives: a reader thread fills a ring
+        of queue_depth buffers of chunk_size bytes while the calling thread writes filled
+        buffers out, so read and write latency overlap instead of adding up. A read or
+        write that makes no progress for C.COPY_NETWORK_TIMEOUT seconds aborts the copy.
+        Time the writer spends in progress_callback (a paused operation, or the rate
+        limiter holding the copy back) is not counted against the reader's timeout. # v002.0025 added
         
-        result = FileCopyManager_class.CopyOperationResult(
-            success=False,
-            strategy_used=FileCopyManager_class.CopyStrategy.STAGED,
-            source_path=source_path,
-            target_path=target_path,
-            file_size=file_size,
-            duration_seconds=0,
-            bytes_copied=0
-        )
+        Args:
+        -----
+        source_fd: Source file descriptor (opened for reading, at offset 0)
+        target_fd: Target file descriptor (opened for writing, truncated)
+        chunk_size: Bytes per buffer
+        queue_depth: Number of buffers in the ring
+        progress_callback: Optional callable(bytes_copied_so_far), called after every chunk is written; it may block
         
-        # Generate unique identifier for backup file
-        backup_uuid = uuid.uuid4().hex[:8]
-        backup_path = f"{target_path}.backup_{backup_uuid}" if Path(target_path).exists() else None
-        original_timestamps = None
+        Returns:
+        --------
+        int: Bytes copied
         
-        result.backup_path = backup_path
+        Raises:
+        -------
+        TimeoutError: The reader or writer stalled for longer than C.COPY_NETWORK_TIMEOUT
+        OSError: Any read or write error
+        """
+        timeout = C.COPY_NETWORK_TIMEOUT
+        free_buffers: queue.Queue = queue.Queue()
+        filled_buffers: queue.Queue = queue.Queue()
+        for _ in range(queue_depth):
+            free_buffers.put(bytearray(chunk_size))
+        stop_event = threading.Event()
+        writer_in_callback = threading.Event()  # set while the writer is held in progress_callback (eg paused) # v002.0025 added
+        callback_returned_at = [0.0]            # time.monotonic() when progress_callback last returned
+        
+        def reader():
+            try:
+                with open(source_fd, 'rb', buffering=0, closefd=False) as source_file:
+                    while not stop_event.is_set():
+                        try:
+                            buffer = free_buffers.get(timeout=timeout)
+                        except queue.Empty:
+                            if writer_in_callback.is_set() or time.monotonic() - callback_returned_at[0] < timeout:
+                                continue  # paused or throttled (within the last timeout), not stalled: wait again # v002.0025 added
+                            raise TimeoutError(f"Pipelined copy: writer made no progress for {timeout}s")
+                        if buffer is None:
+                            return  # Writer finished or failed
+                        read = source_file.readinto(buffer)
+                        filled_buffers.put((buffer, read))
+                        if not read:
+                            return  # EOF
+            except BaseException as e:
+                filled_buffers.put((e, 0))
         
+        reader_thread = threading.Thread(target=reader, name="FCS_copy_reader", daemon=True)
+        reader_thread.start()
+        offset = 0
         try:
-            # Ensure target directory exists (or simulate in dry run)
-            target_dir = Path(target_path).parent
-            if target_dir and not target_dir.exists():
-                if self.dry_run_mode:
-                    self._log_status(f"DRY RUN: Would create target directory: {target_dir}")
-                else:
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    self._log_status(f"Created target directory: {target_dir}")
-            
-            # Step 1: Check overwrite permission and save original timestamps (or simulate in dry run)
-            if Path(target_path).exists():
-                if not overwrite:
-                    result.error_message = "Target file exists and overwrite is disabled"
-                    self._log_status(f"{dry_run_prefix}STAGED copy skipped: Target exists and overwrite disabled")
-                    return result
-                
-                # Save original timestamps for potential rollback (or simulate in dry run)
+            while True:
                 try:
-                    if not self.dry_run_mode:
+                    buffer, read = filled_buffers.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Pipelined copy: no data read from source for {timeout}s")
+                if isinstance(buffer, BaseException):
+                    raise buffer
+                if not read:
+                    break  # EOF
+                with memoryview(buffer) as view:
+                    written = 0
+                    while written < read:
+                        written += os.write(target_fd, view[written:read])
+                offset += read
+                free_buffers.put(buffer)
+                if progress_callback:
+                    writer_in_callback.set() # v002.0025 added
+                    try:
+                        progress_callback(offset)
+                    finally:
+                        callback_returned_at[0] = time.monotonic()
+                        writer_in_callback.clear()
+        finally:
+            stop_event.set()
+            free_buffers.put(None)  # Wake the reader if it is waiting for a buffer
+            reader_thread.join(timeout)
+        return offset
+    
+    @staticmethod
+    def is_transient_error(error: OSError) -> bool: # v002.0015 added
+        """True for I/O errors worth retrying (a flaky disk or network), False for ones a retry cannot fix (no space, access denied, ...)."""
+        if isinstance(error, (TimeoutError, ConnectionError)):
+            return True
+        return (getattr(error, 'winerror', None) in FileCopyManager_class._TRANSIENT_COPY_WINERRORS or
+                error.errno in FileCopyManager_class._TRANSIENT_COPY_ERRNOS)
+    
+    @staticmethod
+    def get_allocated_bytes(file_stat: os.stat_result) -> Optional[int]: # v002.0013 added
+        """Disk space allocated to a file from its stat, or None where the platform does not report it (eg Windows)."""
+        blocks = getattr(file_stat, 'st_blocks', None)
+        return blocks * 512 if blocks is not None else None
+    
+    @staticmethod
+    def is_sparse(file_stat: os.stat_result) -> bool: # v002.0013 added
+        """True when a file has holes and this platform can find them (SEEK_DATA/SEEK_HOLE)."""
+        if not (hasattr(os, 'SEEK_DATA') and hasattr(os, 'SEEK_HOLE')):
+            return False
+        allocated = FileCopyManager_class.get_allocated_bytes(file_stat)
+        return allocated is not None and file_stat.st_size > 0 and allocated < file_stat.st_size
+    
+    @staticmethod
+    def copy_file_data_sparse(source_fd: int, target_fd: int, file_size: int, progress_callback=None,
+                              max_chunk_size: Optional[int] = None) -> int: # v002.0013 added, v002.0024 changed [max_chunk_size]
+        """
+        Copy only the data extents of a sparse file, leaving holes in the target.
+        
+        Purpose:
+        --------
+        VM disk images and database files are often mostly holes. Copying them byte for
+        byte writes every hole out as zeros, growing the target to its full logical size.
+        Here SEEK_DATA/SEEK_HOLE walk the source's data extents, each extent is copied to
+        the same offset in the target (copy_file_range, else pread/pwrite), and the target
+        is truncated to the logical size so trailing holes are recreated too. The target's
+        logical size equals the source's, so size verification is unaffected.
+        
+        Args:
+        -----
+        source_fd: Source file descriptor
+        target_fd: Target file descriptor (opened for writing, truncated)
+        file_size: Source logical size in bytes
+        progress_callback: Optional callable(logical_offset_reached), called after every chunk
+        max_chunk_size: Optional cap on the chunk size (CopyRateLimiter_class.max_chunk_size) # v002.0024 added
+        
+        Returns:
+        --------
+        int: Data bytes copied (excluding holes)
+        """
+        kernel_chunk_size = min(C.COPY_ENGINE_KERNEL_CHUNK_SIZE, max_chunk_size or C.COPY_ENGINE_KERNEL_CHUNK_SIZE) # v002.0024 added
+        data_bytes = 0
+        offset = 0
+        use_copy_file_range = hasattr(os, 'copy_file_range')
+        while offset < file_size:
+            try:
+                data_start = os.lseek(source_fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    break  # No more data: the rest of the file is a hole
+                raise
+            data_end = min(os.lseek(source_fd, data_start, os.SEEK_HOLE), file_size)
+            position = data_start
+            while position < data_end:
+                count = min(kernel_chunk_size, data_end - position)
+                copied = 0
+                if use_copy_file_range:
+                    try:
+                        copied = os.copy_file_range(source_fd, target_fd, count, position, position)
+                    except OSError as e:
+                        if e.errno not in FileCopyManager_class._COPY_METHOD_FALLBACK_ERRNOS:
+                            raise
+                        use_copy_file_range = False
+                if not copied:
+                    chunk = os.pread(source_fd, min(count, C.COPY_ENGINE_BUFFER_SIZE), position)
+                    if not chunk:
+                        break  # File shrank while copying
+                    copied = 0
+                    while copied < len(chunk):
+                        copied += os.pwrite(target_fd, chunk[copied:], position + copied)
+                position += copied
+                data_bytes += copied
+                if progress_callback:
+                    progress_callback(position)
+            offset = data_end
+        os.ftruncate(target_fd, file_size)
+        if progress_callback:
+            progress_callback(file_size)
+        return data_bytes
+    
+    DELTA_JOURNAL_MAGIC = b"FCSDELTA1\n"  # undo journal header, followed by the target's original size (8 bytes) # v002.0014 added
+    
+    @staticmethod
+    def _write_fully(file_object, data) -> None: # v002.0014 added
+        """Write all of data to an unbuffered file object (raw writes may be partial)."""
+        view = memoryview(data)
+        while view:
+            view = view[file_object.write(view):]
+    
+    @staticmethod
+    def _journal_block(journal_file, offset: int, original_data: bytes) -> None: # v002.0014 added
+        """Append one undo entry (offset, length, original bytes) to a delta journal."""
+        FileCopyManager_class._write_fully(journal_file, offset.to_bytes(8, 'big') + len(original_data).to_bytes(8, 'big'))
+        FileCopyManager_class._write_fully(journal_file, original_data)
+    
+    @staticmethod
+    def delta_update_file_data(source_file, target_file, journal_file, file_size: int,
+                               block_size: int = None, progress_callback=None) -> tuple[int, int, int]: # v002.0014 added
+        """
+        Rewrite, in place, only the blocks of an existing target which differ from the source.
+        
+        Purpose:
+        --------
+        Compares source and target in fixed-size blocks and writes just the blocks that
+        differ, so a huge file with a few changed megabytes costs a read of both files
+        instead of a full rewrite. Before any target block is overwritten its original
+        contents are appended to the undo journal and the journal is fsynced, so
+        restore_delta_journal can always put the target back exactly as it was. Blocks
+        are handled in batches of COPY_DELTA_BATCH_BLOCKS to keep fsyncs infrequent.
+        A longer target has its tail journaled and is then truncated; a shorter one is
+        extended (rollback truncates back to the journaled original size).
+        
+        Args:
+        -----
+        source_file: Source file object (unbuffered, opened 'rb')
+        target_file: Target file object (unbuffered, opened 'r+b')
+        journal_file: Empty journal file object (unbuffered, opened for writing)
+        file_size: Source size in bytes
+        block_size: Comparison block size (default COPY_DELTA_BLOCK_SIZE)
+        progress_callback: Optional callable(bytes_compared_so_far), called after every batch
+        
+        Returns:
+        --------
+        tuple[int, int, int]: Changed blocks, total blocks, and bytes written to the target
+        
+        Raises:
+        -------
+        OSError: I/O error, or the source changed size during the update
+        """
+        block_size = block_size or C.COPY_DELTA_BLOCK_SIZE
+        target_size = os.fstat(target_file.fileno()).st_size
+        FileCopyManager_class._write_fully(journal_file, FileCopyManager_class.DELTA_JOURNAL_MAGIC + target_size.to_bytes(8, 'big'))
+        
+        changed_blocks = 0
+        total_blocks = 0
+        bytes_written = 0
+        offset = 0
+        while offset < file_size:
+            # Compare one batch of blocks, keeping the differing ones
+            changes = []
+            batch_end = min(offset + block_size * C.COPY_DELTA_BATCH_BLOCKS, file_size)
+            source_file.seek(offset)
+            target_file.seek(offset)
+            while offset < batch_end:
+                length = min(block_size, file_size - offset)
+                new_data = source_file.read(length)
+                if len(new_data) != length:
+                    raise OSError(errno.EIO, f"Source file changed size during delta update (short read at offset {offset:,})")
+                old_data = target_file.read(length) if offset < target_size else b""
+                if new_data != old_data:
+                    changes.append((offset, new_data, old_data))
+                total_blocks += 1
+                offset += length
+            
+            # Journal the originals durably, then overwrite those blocks
+            if changes:
+                for change_offset, _, old_data in changes:
+                    if old_data:  # blocks wholly beyond the original end are undone by truncation
+                        FileCopyManager_class._journal_block(journal_file, change_offset, old_data)
+                os.fsync(journal_file.fileno())
+                for change_offset, new_data, _ in changes:
+                    target_file.seek(change_offset)
+                    FileCopyManager_class._write_fully(target_file, new_data)
+                    bytes_written += len(new_data)
+                changed_blocks += len(changes)
+            if progress_callback:
+                progress_callback(offset)
+        
+        if target_size > file_size:
+            # Journal the tail which truncation will discard
+            tail_offset = file_size
+            target_file.seek(tail_offset)
+            while tail_offset < target_size:
+                old_data = target_file.read(min(block_size, target_size - tail_offset))
+                if not old_data:
+                    break
+                FileCopyManager_class._journal_block(journal_file, tail_offset, old_data)
+                tail_offset += len(old_data)
+            os.fsync(journal_file.fileno())
+        if target_size != file_size:
+            target_file.truncate(file_size)
+        os.fsync(target_file.fileno())
+        if progress_callback:
+            progress_callback(file_size)
+        return changed_blocks, total_blocks, bytes_written
+    
+    @staticmethod
+    def restore_delta_journal(journal_path: str, target_path: str) -> int: # v002.0014 added
+        """
+        Undo a delta update: write every journaled original block back and restore the original size.
+        
+        Journal entries cover disjoint ranges, so they are replayed in file order.
+        Replaying is idempotent, so a replay interrupted part way can simply be repeated.
+        A journal shorter than its header (the update stopped while creating it) is empty:
+        the header is fsynced with the first batch, before any target block is written,
+        so the target was never modified and nothing is restored. # v002.0014 changed
+        
+        Returns:
+        --------
+        int: Number of blocks restored
+        
+        Raises:
+        -------
+        OSError: I/O error, or the journal is not a delta journal
+        """
+        magic = FileCopyManager_class.DELTA_JOURNAL_MAGIC
+        header_length = len(magic) + 8
+        restored = 0
+        with open(journal_path, 'rb') as journal_file:
+            header = journal_file.read(header_length)
+            if len(header) < header_length and magic.startswith(header[:len(magic)]): # v002.0014 added [torn header: target never modified]
+                return 0
+            if not header.startswith(magic):
+                raise OSError(errno.EINVAL, f"Not a delta journal: {journal_path}")
+            with open(target_path, 'r+b', buffering=0) as target_file:
+                original_size = int.from_bytes(header[-8:], 'big')
+                while True:
+                    entry_header = journal_file.read(16)
+                    if len(entry_header) < 16:
+                        break  # end of journal (a torn final entry was never applied to the target)
+                    offset = int.from_bytes(entry_header[:8], 'big')
+                    length = int.from_bytes(entry_header[8:], 'big')
+                    original_data = journal_file.read(length)
+                    if len(original_data) < length:
+                        break
+                    target_file.seek(offset)
+                    FileCopyManager_class._write_fully(target_file, original_data)
+                    restored += 1
+                target_file.truncate(original_size)
+                os.fsync(target_file.fileno())
+        return restored
+    
+    def recover_delta_journal(self, target_path: str) -> bool: # v002.0014 added [interrupted update recovery]
+        """
+        Roll back a DELTA update of target_path which was interrupted (crash, kill, power loss).
+        
+        Purpose:
+        --------
+        A DELTA update leaves its undo journal ("<target>.fcs_delta_journal") beside the
+        target until it has committed, so a journal found there means the target may be
+        a mix of original and new blocks. The journal is replayed (restore_delta_journal),
+        putting back the original blocks and size, and then removed. A journal whose
+        target no longer exists has nothing to restore and is just removed.
+        
+        Returns:
+        --------
+        bool: True if a journal was found (replayed, or would be in dry run), else False
+        
+        Raises:
+        -------
+        OSError: The journal could not be replayed; it is kept for another attempt
+        """
+        journal_path = target_path + C.COPY_DELTA_JOURNAL_SUFFIX
+        if not os.path.exists(journal_path):
+            return False
+        if self.dry_run_mode:
+            self._log_status(f"DRY RUN: Would replay interrupted DELTA update journal: {journal_path}")
+            return True
+        if not os.path.exists(target_path):
+            os.remove(journal_path)
+            self._log_status(f"Removed interrupted DELTA update journal of a target which no longer exists: {journal_path}")
+            return True
+        self._log_status(f"Replaying interrupted DELTA update journal: {journal_path}")
+        restored = FileCopyManager_class.restore_delta_journal(journal_path, target_path)
+        os.remove(journal_path)
+        self._log_status(f"Restored {restored:,} original blocks of {target_path} from the interrupted DELTA update")
+        return True
+    
+    def _resume_partial_copy(self, source_path: str, source_stat: os.stat_result, partial_path: str, journal_path: str) -> int: # v002.0015 added
+        """
+        Work out where a resumable copy continues from, (re)writing its journal.
+        
+        Purpose:
+        --------
+        A journal is only reused when it describes the same source (path, size and
+        modification time) and chunk size; otherwise any stale partial and journal are
+        discarded and the copy starts from offset 0. Journaled chunks are re-checked
+        against the source (or, in journals from earlier versions, their digests) from
+        the last one backwards, and the copy continues after the last chunk which still
+        matches (earlier chunks were fsynced before being journaled). Chunks journaled
+        without an fsync (COPY_DURABILITY_POLICY "none") carry no such promise, so from
+        the first of them on every chunk is checked, forwards, up to the first mismatch.
+        The journal is rewritten with just the good chunks plus a record of this
+        operation id resuming it.
+        
+        Returns:
+        --------
+        int: Offset to continue copying from
+        """
+        header = None
+        chunks = []
+        if os.path.exists(journal_path) and os.path.exists(partial_path):
+            with open(journal_path, 'r', encoding='utf-8') as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn last line, written when the previous attempt stopped
+                    if header is None:
+                        header = record
+                    elif 'length' in record: # v002.0015 changed [chunk records may have no digest]
+                        chunks.append(record)
+            if header is not None and (header.get('source') != source_path or
+                                       header.get('source_size') != source_stat.st_size or
+                                       header.get('source_mtime_ns') != source_stat.st_mtime_ns or
+                                       header.get('chunk_size') != C.COPY_RESUMABLE_CHUNK_SIZE):
+                self._log_status(f"Discarding partial copy: source changed since it was started")
+                header = None
+        
+        resume_offset = 0
+        if header is None:
+            header = {
+                'source': source_path,
+                'source_size': source_stat.st_size,
+                'source_mtime_ns': source_stat.st_mtime_ns,
+                'chunk_size': C.COPY_RESUMABLE_CHUNK_SIZE,
+                'verify': 'source', # v002.0015 changed [chunks are compared with the source on resume]
+                'operation_id': self.operation_id,
+                'started': datetime.now().isoformat(),
+            }
+            chunks = []
+            with open(partial_path, 'wb'):
+                pass
+        else:
+            partial_size = os.path.getsize(partial_path)
+            with open(source_path, 'rb') as source_file, open(partial_path, 'rb') as partial_file:
+                def chunk_matches(chunk):
+                    if chunk['offset'] + chunk['length'] > partial_size:
+                        return False
+                    partial_file.seek(chunk['offset'])
+                    if 'digest' in chunk:  # journal written by an earlier version
+                        return hashlib.blake2b(partial_file.read(chunk['length']), digest_size=16).hexdigest() == chunk['digest']
+                    source_file.seek(chunk['offset'])
+                    remaining = chunk['length']
+                    while remaining > 0:
+                        length = min(C.COPY_ENGINE_BUFFER_SIZE, remaining)
+                        if source_file.read(length) != partial_file.read(length):
+                            return False
+                        remaining -= length
+                    return True
+                
+                first_unsynced = next((index for index, chunk in enumerate(chunks) if not chunk.get('synced', True)), len(chunks))
+                if first_unsynced < len(chunks):  # v002.0015 added [no fsync before journaling: check each chunk]
+                    good_count = first_unsynced
+                    while good_count < len(chunks) and chunk_matches(chunks[good_count]):
+                        good_count += 1
+                    chunks = chunks[:good_count]
+                else:
+                    while chunks and not chunk_matches(chunks[-1]):
+                        chunks.pop()
+            if chunks:
+                resume_offset = chunks[-1]['offset'] + chunks[-1]['length']
+            self._log_status(f"Resuming partial copy started by operation {header.get('operation_id')} at offset {resume_offset:,} of {source_stat.st_size:,}")
+        
+        temp_journal_path = f"{journal_path}.{uuid.uuid4().hex[:8]}"
+        with open(temp_journal_path, 'w', encoding='utf-8') as journal_file:
+            journal_file.write(json.dumps(header) + "\n")
+            for chunk in chunks:
+                journal_file.write(json.dumps(chunk) + "\n")
+            journal_file.write(json.dumps({'resumed_by': self.operation_id, 'offset': resume_offset, 'time': datetime.now().isoformat()}) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temp_journal_path, journal_path)
+        return resume_offset
+    
+    @staticmethod
+    def copy_file_data_journaled(source_file, partial_file, journal_file, offset: int, file_size: int,
+                                 progress_callback=None, methods: Optional[list[FileCopyManager_class.CopyMethod]] = None,
+                                 unsupported: Optional[set] = None, sparse: bool = False, preallocate: bool = False,
+                                 sync_chunks: bool = True, max_chunk_size: Optional[int] = None
+                                 ) -> tuple[int, int, Optional[FileCopyManager_class.CopyMethod]]: # v002.0015 added
+        """
+        Copy source to a partial target from offset, journaling each completed chunk.
+        
+        Each COPY_RESUMABLE_CHUNK_SIZE chunk is copied with the copy engine
+        (copy_file_data_range: copy_file_range, sendfile, else read/write) and, with
+        sync_chunks, fsynced before a JSON line recording its offset and length is
+        appended (and fsynced) to the journal, so every journaled chunk is safely on disk.
+        Without sync_chunks (COPY_DURABILITY_POLICY "none") the lines are marked
+        "synced": false and resuming checks those chunks against the source instead.
+        A sparse source has only the data extents of each chunk copied (SEEK_DATA /
+        SEEK_HOLE), the holes are left as holes; otherwise, with preallocate, the whole
+        partial is preallocated first (preallocate_file).
+        
+        Args:
+        -----
+        source_file: Source file object (unbuffered, opened 'rb')
+        partial_file: Partial target file object (unbuffered, opened 'r+b')
+        journal_file: Journal text file object (opened for appending)
+        offset: Offset to continue from (the partial is truncated to it)
+        file_size: Source size in bytes
+        progress_callback: Optional callable(offset_reached), called after every chunk of the engine
+        methods: CopyMethods to try, in order (default available_copy_methods())
+        unsupported: Optional set of CopyMethods known not to work here, updated in place
+        sparse: Copy only the source's data extents (is_sparse)
+        preallocate: Preallocate the partial to file_size before copying (not with sparse)
+        sync_chunks: fsync each chunk, then its journal line, before the next chunk
+        max_chunk_size: Optional cap on the engine's chunk size (CopyRateLimiter_class.max_chunk_size)
+        
+        Returns:
+        --------
+        tuple[int, int, Optional[CopyMethod]]: Logical bytes copied by this call, data bytes
+        written (less than that for a sparse source), and the last copy engine method used
+        """
+        methods = methods or FileCopyManager_class.available_copy_methods()
+        source_fd = source_file.fileno()
+        partial_fd = partial_file.fileno()
+        start_offset = offset
+        data_bytes = 0
+        method = None
+        partial_file.truncate(offset)
+        if preallocate and not sparse and file_size > offset:
+            try:
+                FileCopyManager_class.preallocate_file(partial_fd, file_size)
+            except OSError:
+                partial_file.truncate(offset)  # release whatever was allocated before it failed
+                raise
+        while offset < file_size:
+            length = min(C.COPY_RESUMABLE_CHUNK_SIZE, file_size - offset)
+            chunk_end = offset + length
+            if sparse:
+                position = offset
+                while position < chunk_end:
+                    try:
+                        data_start = os.lseek(source_fd, position, os.SEEK_DATA)
+                    except OSError as e:
+                        if e.errno == errno.ENXIO:
+                            break  # No more data: the rest of the file is a hole
+                        raise
+                    if data_start >= chunk_end:
+                        break
+                    data_end = min(os.lseek(source_fd, data_start, os.SEEK_HOLE), chunk_end)
+                    method = FileCopyManager_class.copy_file_data_range(
+                        source_fd, partial_fd, data_start, data_end, methods, unsupported, progress_callback, max_chunk_size)
+                    data_bytes += data_end - data_start
+                    position = data_end
+                if os.fstat(partial_fd).st_size < chunk_end:
+                    os.ftruncate(partial_fd, chunk_end)  # a hole at the end of the chunk
+                if progress_callback:
+                    progress_callback(chunk_end)
+            else:
+                method = FileCopyManager_class.copy_file_data_range(
+                    source_fd, partial_fd, offset, chunk_end, methods, unsupported, progress_callback, max_chunk_size)
+                data_bytes += length
+            record = {'offset': offset, 'length': length}
+            if sync_chunks:
+                os.fsync(partial_fd)
+            else:
+                record['synced'] = False
+            journal_file.write(json.dumps(record) + "\n")
+            journal_file.flush()
+            if sync_chunks:
+                os.fsync(journal_file.fileno())
+            offset = chunk_end
+        if os.fstat(partial_fd).st_size != file_size:
+            os.ftruncate(partial_fd, file_size)
+        return offset - start_offset, data_bytes, method
+    
+    @staticmethod
+    def preallocate_file(target_fd: int, file_size: int) -> bool: # v002.0019 added
+        """
+        Reserve file_size bytes of disk space for a newly created (empty) target.
+        
+        Purpose:
+        --------
+        Allocating the whole file up front fails fast when the volume is too full,
+        before any time is spent copying, and lets the filesystem choose contiguous
+        extents. Uses os.posix_fallocate where available (Linux); on Windows, setting
+        the end of file on NTFS allocates the clusters. The target's size becomes
+        file_size, so callers must truncate it if fewer bytes end up being copied.
+        
+        Returns:
+        --------
+        bool: True if preallocated, False if the platform/filesystem does not support it
+        
+        Raises:
+        -------
+        OSError: Preallocation failed for a real reason (eg ENOSPC, no space left on device)
+        """
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(target_fd, 0, file_size)
+            elif os.name == 'nt':
+                os.ftruncate(target_fd, file_size)
+            else:
+                return False
+        except OSError as e:
+            if e.errno in FileCopyManager_class._COPY_METHOD_FALLBACK_ERRNOS:
+                return False
+            raise OSError(e.errno, f"Preallocation of {file_size:,} bytes failed: {e.strerror}") from e
+        return True
+    
+    def _copy_file_contents(self, source_path: str, target_path: str, progress_callback=None) -> tuple[int, FileCopyManager_class.CopyMethod, Optional[int]]: # v002.0010 added [replaces shutil.copy2], v002.0013 changed [allocated bytes]
+        """
+        Copy a file's data with the copy engine, then its permission bits and times (as shutil.copy2 does).
+        
+        Network sources/targets use the pipelined copy, everything else the zero-copy engine. # v002.0011 added
+        Sparse sources copy only their data extents. # v002.0013 added
+        While bandwidth is limited, chunks are cut to the rate limiter's max_chunk_size. # v002.0024 added
+        Other local targets >= COPY_PREALLOCATE_THRESHOLD are preallocated first; a failed # v002.0019 added
+        preallocation (eg out of space) raises OSError before any data is copied.
+        
+        Args:
+        -----
+        source_path: Source file path
+        target_path: Target file path
+        progress_callback: Optional callable(bytes_copied_so_far), called after every chunk
+        
+        Returns:
+        --------
+        tuple[int, CopyMethod, Optional[int]]: Logical bytes copied, the method used, and the
+        bytes allocated to the target (None where the platform does not report it)
+        """
+        pipeline_settings = FileCopyManager_class.get_pipeline_settings(source_path, target_path) # v002.0011 added
+        max_chunk_size = self.rate_limiter.max_chunk_size() # v002.0024 added [None unless bandwidth is limited]
+        with open(source_path, 'rb', buffering=0) as source_file, open(target_path, 'wb', buffering=0) as target_file:
+            source_fd = source_file.fileno()
+            target_fd = target_file.fileno()
+            source_stat = os.fstat(source_fd)
+            # Preallocate large targets (not sparse ones, nor network drives where posix_fallocate may fall back to writing zeros) # v002.0019 added
+            preallocated = False
+            if (source_stat.st_size >= C.COPY_PREALLOCATE_THRESHOLD and not pipeline_settings
+                    and not FileCopyManager_class.is_sparse(source_stat)):
+                try:
+                    preallocated = FileCopyManager_class.preallocate_file(target_fd, source_stat.st_size)
+                except OSError:
+                    os.ftruncate(target_fd, 0)  # release whatever was allocated before it failed
+                    raise
+                if preallocated:
+                    self._log_status(f"Preallocated {source_stat.st_size:,} bytes for target")
+            if pipeline_settings: # v002.0011 added
+                chunk_size, queue_depth = pipeline_settings
+                chunk_size = min(chunk_size, max_chunk_size or chunk_size) # v002.0024 added
+                self._log_status(f"Pipelined copy: {chunk_size:,} byte chunks, queue depth {queue_depth}")
+                bytes_copied = FileCopyManager_class.copy_file_data_pipelined(
+                    source_fd, target_fd, chunk_size, queue_depth, progress_callback)
+                method = FileCopyManager_class.CopyMethod.PIPELINED
+            elif FileCopyManager_class.is_sparse(source_stat): # v002.0013 added
+                data_bytes = FileCopyManager_class.copy_file_data_sparse(source_fd, target_fd, source_stat.st_size, progress_callback, max_chunk_size)
+                self._log_status(f"Sparse copy: {data_bytes:,} data bytes of {source_stat.st_size:,} logical bytes")
+                bytes_copied = source_stat.st_size
+                method = FileCopyManager_class.CopyMethod.SPARSE
+            else:
+                device_pair = (source_stat.st_dev, os.fstat(target_fd).st_dev)
+                unsupported = self._unsupported_copy_methods.setdefault(device_pair, set())
+                bytes_copied, method = FileCopyManager_class.copy_file_data(
+                    source_fd, target_fd, source_stat.st_size, FileCopyManager_class.available_copy_methods(), unsupported,
+                    progress_callback, max_chunk_size)
+            if preallocated and bytes_copied != source_stat.st_size: # v002.0019 added [source changed size while copying]
+                os.ftruncate(target_fd, bytes_copied)
+        shutil.copystat(source_path, target_path)
+        return bytes_copied, method, FileCopyManager_class.get_allocated_bytes(os.stat(target_path))
+    
+    def _copy_clone_strategy(self, source_path: str, target_path: str, overwrite: bool = True,
+                             progress_callback=None) -> Optional[FileCopyManager_class.CopyOperationResult]: # v002.0012 added
+        """
+        Strategy C: clone (reflink) the source when source and target are on the same copy-on-write volume.
+        
+        Purpose:
+        --------
+        On Btrfs, XFS (reflink=1) and similar filesystems a clone shares the source's
+        data extents, so even very large copies complete almost instantly. The clone is
+        made into a temporary file beside the target, its metadata copied and verified,
+        and then atomically renamed over the target.
+        
+        Returns None (after cleaning up) whenever cloning is not possible or fails, so
+        copy_file falls back transparently to the DIRECT or STAGED strategy; volumes where
+        the filesystem reports cloning as unsupported are remembered and not tried again.
+        Whether a clone is possible is decided from the cached volume classification
+        (DriveClassifier_class) before any file system access, so cross-volume, network
+        and known-unsupported copies cost no stat or mkdir here.
+        
+        Returns:
+        --------
+        Optional[CopyOperationResult]: Successful CLONE result, or None to fall back
+        """
+        if self.dry_run_mode or fcntl is None or not sys.platform.startswith('linux'):
+            return None
+        # Only local copies within one volume can clone: decide from the cached classification first # v002.0012 changed
+        classifier = DriveClassifier_class.shared()
+        source_info = classifier.classify(source_path)
+        target_info = classifier.classify(target_path)
+        if (source_info.volume != target_info.volume or source_info.is_network or target_info.is_network or
+                source_info.volume in self._clone_unsupported_volumes):
+            return None
+        if not overwrite and Path(target_path).exists():
+            return None  # Let the normal strategy report the overwrite refusal
+        start_time = time.time()
+        try:
+            source_stat = os.stat(source_path)
+            target_dir = Path(target_path).parent
+            target_dir.mkdir(parents=True, exist_ok=True)
+            if os.stat(target_dir).st_dev != source_stat.st_dev:
+                return None  # eg a bind mount or subvolume classified as the same volume
+        except OSError:
+            return None
+        
+        temp_path = f"{target_path}.clone_{uuid.uuid4().hex[:8]}"
+        try:
+            with open(source_path, 'rb', buffering=0) as source_file, open(temp_path, 'wb', buffering=0) as temp_file:
+                FileCopyManager_class.clone_file_data(source_file.fileno(), temp_file.fileno())
+            shutil.copystat(source_path, temp_path)
+            self.timestamp_manager.copy_timestamps(source_path, temp_path)
+            if not self._verify_copy(source_path, temp_path):
+                raise OSError(errno.EIO, "clone verification failed")
+            os.replace(temp_path, target_path)
+            self._commit_durable(target_path, source_stat.st_size) # v002.0020 added
+        except OSError as e:
+            if e.errno in FileCopyManager_class._COPY_METHOD_FALLBACK_ERRNOS:
+                self._clone_unsupported_volumes.add(source_info.volume)
+            self._log_status(f"Clone not available ({e}), falling back to a full copy")
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError as remove_error:
+                self._log_status(f"Warning: Could not remove temporary clone file {temp_path}: {remove_error}")
+            return None
+        
+        if progress_callback:
+            progress_callback(source_stat.st_size)
+        self._log_status(f"Using CLONE strategy for {os.path.basename(source_path)} ({source_stat.st_size} bytes)")
+        self._log_status(f"CLONE completed successfully")
+        return FileCopyManager_class.CopyOperationResult(
+            success=True,
+            strategy_used=FileCopyManager_class.CopyStrategy.CLONE,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=source_stat.st_size,
+            duration_seconds=time.time() - start_time,
+            bytes_copied=source_stat.st_size,
+            verification_passed=True,
+            copy_method=FileCopyManager_class.CopyMethod.FICLONE,
+            allocated_bytes=FileCopyManager_class.get_allocated_bytes(source_stat), # v002.0013 added [shared extents, as allocated as the source]
+        )
+    
+    def _copy_direct_strategy(self, source_path: str, target_path: str, progress_callback=None, file_size: Optional[int] = None) -> FileCopyManager_class.CopyOperationResult: # v002.0011 changed [progress_callback], v002.0017 changed [planned file_size]
+        """
+        Strategy A: Direct copy for small files on local drives (with dry run support).
+        Uses the copy engine (_copy_file_contents) with error handling and Simple verification.
+        """
+        start_time = time.time()
+        if file_size is None:  # planned by CopyPlan_class, else stat the source # v002.0017 changed
+            file_size = Path(source_path).stat().st_size
+        
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        self._log_status(f"{dry_run_prefix}Using DIRECT strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        
+        result = FileCopyManager_class.CopyOperationResult(
+            success=False,
+            strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=0,
+            bytes_copied=0
+        )
+        
+        try:
+            # Ensure target directory exists (or simulate in dry run)
+            target_dir = Path(target_path).parent
+            if target_dir and not target_dir.exists():
+                if self.dry_run_mode:
+                    self._log_status(f"DRY RUN: Would create target directory: {target_dir}")
+                else:
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    self._log_status(f"Created target directory: {target_dir}")
+            
+            # Perform direct copy (or simulate in dry run)
+            self._log_status(f"{dry_run_prefix}Copying: {source_path} -> {target_path}")
+            
+            if not self.dry_run_mode:
+                result.bytes_copied, result.copy_method, result.allocated_bytes = self._copy_file_contents(source_path, target_path, progress_callback) # v002.0010 changed [copy engine instead of shutil.copy2]
+                self._log_status(f"Copy method: {result.copy_method.value}")
+                
+                # Copy timestamps from source to target for complete preservation
+                self.timestamp_manager.copy_timestamps(source_path, target_path)
+            else:
+                # Simulate copy operation
+                result.bytes_copied = file_size
+                self._log_status(f"DRY RUN: Would copy timestamps from source to target")
+            
+            # Verify the copy (or simulate Simple verification in dry run)
+            if self._verify_copy(source_path, target_path):
+                if not self.dry_run_mode:
+                    self._commit_durable(target_path, file_size) # v002.0020 added
+                result.success = True
+                result.verification_passed = True
+                self._log_status(f"{dry_run_prefix}DIRECT copy completed successfully")
+            else:
+                result.error_message = "Copy Simple verification failed"
+                self._log_status(f"{dry_run_prefix}DIRECT copy failed Simple verification")
+                
+        except Exception as e:
+            if not self.dry_run_mode:
+                result.error_message = str(e)
+                self._log_status(f"DIRECT copy failed: {str(e)}")
+            else:
+                # In dry run, we don't expect real exceptions
+                result.success = True
+                result.verification_passed = True
+                self._log_status(f"DRY RUN: DIRECT copy simulation completed")
+        
+        result.duration_seconds = time.time() - start_time
+        return result
+    
+    def _copy_staged_atomic_replace(self, source_path: str, target_path: str, overwrite: bool = True, progress_callback=None, file_size: Optional[int] = None) -> FileCopyManager_class.CopyOperationResult: # v002.0016 added, v002.0017 changed [planned file_size]
+        """
+        Strategy B, COPY_STAGED_MODE "atomic_replace": copy to a temp file beside the target, then os.replace it over the target (with dry run support).
+        Implements 4-step process: copy source to temp -> fsync and apply timestamps -> verify -> atomic replace
+        The target stays complete and readable until the single rename; on failure only the temp file is removed.
+        """
+        start_time = time.time()
+        if file_size is None:  # planned by CopyPlan_class, else stat the source # v002.0017 changed
+            file_size = Path(source_path).stat().st_size
+        
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        self._log_status(f"{dry_run_prefix}Using STAGED strategy (atomic replace) for {os.path.basename(source_path)} ({file_size} bytes)")
+        
+        result = FileCopyManager_class.CopyOperationResult(
+            success=False,
+            strategy_used=FileCopyManager_class.CopyStrategy.STAGED,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=0,
+            bytes_copied=0
+        )
+        
+        if not overwrite and Path(target_path).exists():
+            result.error_message = "Target file exists and overwrite is disabled"
+            self._log_status(f"{dry_run_prefix}STAGED copy skipped: Target exists and overwrite disabled")
+            return result
+        
+        temp_path = f"{target_path}.tmp_{uuid.uuid4().hex[:8]}"
+        result.temp_path = temp_path
+        
+        if self.dry_run_mode:
+            self._log_status(f"DRY RUN: Step 1: Would copy source to temp file: {source_path} -> {temp_path}")
+            self._log_status(f"DRY RUN: Step 2: Would fsync the temp file and copy timestamps from source")
+            self._log_status(f"DRY RUN: Step 3: Would verify the temp file")
+            self._log_status(f"DRY RUN: Step 4: Would atomically replace the target: {temp_path} -> {target_path}")
+            result.bytes_copied = file_size
+            result.success = True
+            result.verification_passed = True
+            result.duration_seconds = time.time() - start_time
+            self._log_status(f"DRY RUN: STAGED copy simulation completed successfully")
+            return result
+        
+        try:
+            # Ensure target directory exists
+            target_dir = Path(target_path).parent
+            if target_dir and not target_dir.exists():
+                target_dir.mkdir(parents=True, exist_ok=True)
+                self._log_status(f"Created target directory: {target_dir}")
+            
+            # Step 1: Copy source to a temp file in the target directory (same volume, so the replace is a rename)
+            self._log_status(f"Step 1: Copying source to temp file: {source_path} -> {temp_path}")
+            result.bytes_copied, result.copy_method, result.allocated_bytes = self._copy_file_contents(source_path, temp_path, progress_callback)
+            self._log_status(f"Copy operation completed (copy method: {result.copy_method.value})")
+            
+            # Step 2: Flush the data to disk before it can replace the target (unless the durability policy is none), then copy timestamps
+            if C.COPY_DURABILITY_POLICY != FileCopyManager_class.DurabilityPolicy.NONE.value: # v002.0020 changed
+                self._fsync_timed(temp_path)
+            self.timestamp_manager.copy_timestamps(source_path, temp_path)
+            self._log_status(f"Step 2: Temp file flushed to disk and timestamps copied from source")
+            
+            # Step 3: Verify the temp file
+            self._log_status(f"Step 3: Verifying temp file")
+            if not self._verify_copy(source_path, temp_path):
+                result.error_message = "Copy Simple verification failed"
+                raise Exception("Simple verification failed")
+            
+            # Step 4: Atomically replace the target (the only rename on the success path)
+            os.replace(temp_path, target_path)
+            self._log_status(f"Step 4: Atomically replaced target: {temp_path} -> {target_path}")
+            self._commit_durable(target_path, file_size) # v002.0020 added [persist the rename]
+            
+            result.success = True
+            result.verification_passed = True
+            self._log_status(f"STAGED copy completed successfully")
+        
+        except Exception as e:
+            result.error_message = str(e) if not result.error_message else result.error_message
+            self._log_status(f"STAGED copy failed: {result.error_message} - target left unchanged")
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                    self._log_status(f"Removed temp file: {temp_path}")
+                except Exception as remove_error:
+                    self._log_status(f"Warning: Could not remove temp file {temp_path}: {remove_error}")
+        
+        result.duration_seconds = time.time() - start_time
+        return result
+    
+    def _copy_staged_strategy(self, source_path: str, target_path: str, overwrite: bool = True, progress_callback=None, file_size: Optional[int] = None) -> FileCopyManager_class.CopyOperationResult: # v002.0011 changed [progress_callback], v002.0017 changed [planned file_size]
+        """
+        Strategy B: staged copy using rename-based backup for large files or network drives (with dry run support).
+        Implements 4-step process: save timestamps -> rename to backup -> copy source -> verify
+        Uses atomic rename operations instead of expensive copy operations for backup.
+        This is COPY_STAGED_MODE "rename_backup"; "atomic_replace" uses _copy_staged_atomic_replace. # v002.0016 added
+        """
+        if C.COPY_STAGED_MODE == "atomic_replace": # v002.0016 added
+            return self._copy_staged_atomic_replace(source_path, target_path, overwrite, progress_callback, file_size)
+        
+        start_time = time.time()
+        if file_size is None:  # planned by CopyPlan_class, else stat the source # v002.0017 changed
+            file_size = Path(source_path).stat().st_size
+        
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        self._log_status(f"{dry_run_prefix}Using STAGED strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        
+        result = FileCopyManager_class.CopyOperationResult(
+            success=False,
+            strategy_used=FileCopyManager_class.CopyStrategy.STAGED,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=0,
+            bytes_copied=0
+        )
+        
+        # Generate unique identifier for backup file
+        backup_uuid = uuid.uuid4().hex[:8]
+        backup_path = f"{target_path}.backup_{backup_uuid}" if Path(target_path).exists() else None
+        original_timestamps = None
+        
+        result.backup_path = backup_path
+        
+        try:
+            # Ensure target directory exists (or simulate in dry run)
+            target_dir = Path(target_path).parent
+            if target_dir and not target_dir.exists():
+                if self.dry_run_mode:
+                    self._log_status(f"DRY RUN: Would create target directory: {target_dir}")
+                else:
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    self._log_status(f"Created target directory: {target_dir}")
+            
+            # Step 1: Check overwrite permission and save original timestamps (or simulate in dry run)
+            if Path(target_path).exists():
+                if not overwrite:
+                    result.error_message = "Target file exists and overwrite is disabled"
+                    self._log_status(f"{dry_run_prefix}STAGED copy skipped: Target exists and overwrite disabled")
+                    return result
+                
+                # Save original timestamps for potential rollback (or simulate in dry run)
+                try:
+                    if not self.dry_run_mode:
                         original_timestamps = self.timestamp_manager.get_file_timestamps(target_path)
                         self._log_status(f"Step 1: Saved original timestamps for potential rollback")
                     else:
@@ -475,9 +1921,8 @@ class FileCopyManager_class:
                 self._log_status(f"{dry_run_prefix}Step 3: Copying source to target: {source_path} -> {target_path}")
                 
                 if not self.dry_run_mode:
-                    shutil.copy2(source_path, target_path)
-                    result.bytes_copied = file_size
-                    self._log_status(f"Copy operation completed")
+                    result.bytes_copied, result.copy_method, result.allocated_bytes = self._copy_file_contents(source_path, target_path, progress_callback) # v002.0010 changed [copy engine instead of shutil.copy2]
+                    self._log_status(f"Copy operation completed (copy method: {result.copy_method.value})")
                     
                     # Copy timestamps from source to target for complete preservation
                     self.timestamp_manager.copy_timestamps(source_path, target_path)
@@ -509,18 +1954,12 @@ class FileCopyManager_class:
                 else:
                     self._log_status(f"DRY RUN: Simple verification simulation completed")
             
-            # Step 5: Success - remove backup file (or simulate in dry run)
-            if backup_path and (Path(backup_path).exists() or self.dry_run_mode):
-                try:
-                    if not self.dry_run_mode:
-                        os.remove(backup_path)
-                        self._log_status(f"Step 5: Removed backup file: {backup_path}")
-                    else:
-                        self._log_status(f"DRY RUN: Step 5: Would remove backup file: {backup_path}")
-                except Exception as e:
-                    # Non-critical - backup removal failed but copy succeeded
-                    self._log_status(f"Warning: Could not remove backup file {backup_path}: {e}")
-                    self._log_status("This is not critical - copy operation succeeded")
+            # Step 5: Success - make the target durable per the durability policy, then remove backup file (or simulate in dry run) # v002.0020 changed
+            if not self.dry_run_mode:
+                self._log_status(f"Step 5: Committing target ({C.COPY_DURABILITY_POLICY} durability), then removing backup file: {backup_path}")
+                self._commit_durable(target_path, file_size, [backup_path] if backup_path else None)
+            elif backup_path:
+                self._log_status(f"DRY RUN: Step 5: Would remove backup file: {backup_path}")
             
             result.success = True
             result.verification_passed = True
@@ -583,7 +2022,256 @@ class FileCopyManager_class:
         result.duration_seconds = time.time() - start_time
         return result
     
-    def copy_file(self, source_path: str, target_path: str, overwrite: bool = True) -> FileCopyManager_class.CopyOperationResult:
+    def _copy_delta_strategy(self, source_path: str, target_path: str, overwrite: bool = True, progress_callback=None, file_size: Optional[int] = None) -> FileCopyManager_class.CopyOperationResult: # v002.0014 added, v002.0017 changed [planned file_size]
+        """
+        Strategy D: block-level delta update of a large existing target on local drives (with dry run support).
+        Rewrites only the changed blocks in place behind an undo journal (delta_update_file_data);
+        on any failure the journal is replayed (restore_delta_journal) and the original timestamps
+        restored, so the target is rolled back just as the STAGED strategy restores its backup.
+        The journal has a fixed name ("<target>.fcs_delta_journal"), so if the process dies
+        mid-update copy_file finds it and replays it (recover_delta_journal) before the
+        target is next copied. # v002.0014 changed [interrupted update recovery]
+        """
+        start_time = time.time()
+        if file_size is None:  # planned by CopyPlan_class, else stat the source # v002.0017 changed
+            file_size = Path(source_path).stat().st_size
+        
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        self._log_status(f"{dry_run_prefix}Using DELTA strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        
+        result = FileCopyManager_class.CopyOperationResult(
+            success=False,
+            strategy_used=FileCopyManager_class.CopyStrategy.DELTA,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=0,
+            bytes_copied=0
+        )
+        
+        if not overwrite:
+            result.error_message = "Target file exists and overwrite is disabled"
+            self._log_status(f"{dry_run_prefix}DELTA copy skipped: Target exists and overwrite disabled")
+            return result
+        
+        if self.dry_run_mode:
+            self._log_status(f"DRY RUN: Would compare {C.COPY_DELTA_BLOCK_SIZE:,} byte blocks and rewrite changed blocks in place behind an undo journal")
+            self._log_status(f"DRY RUN: Would copy timestamps from source to target")
+            result.bytes_copied = file_size
+            result.success = True
+            result.verification_passed = True
+            result.duration_seconds = time.time() - start_time
+            self._log_status(f"DRY RUN: DELTA copy simulation completed successfully")
+            return result
+        
+        journal_path = target_path + C.COPY_DELTA_JOURNAL_SUFFIX  # fixed name, found again after a crash # v002.0014 changed
+        result.backup_path = journal_path
+        original_timestamps = None
+        
+        try:
+            # Step 1: Save original timestamps for potential rollback
+            try:
+                original_timestamps = self.timestamp_manager.get_file_timestamps(target_path)
+                self._log_status(f"Step 1: Saved original timestamps for potential rollback")
+            except Exception as e:
+                self._log_status(f"Warning: Could not save original timestamps: {e}")
+                # Continue anyway - this is not critical for copy operation
+            
+            # Step 2: Rewrite changed blocks, journaling the originals first
+            self._log_status(f"Step 2: Updating changed blocks in place: {source_path} -> {target_path} (journal: {journal_path})")
+            with open(source_path, 'rb', buffering=0) as source_file, \
+                 open(target_path, 'r+b', buffering=0) as target_file, \
+                 open(journal_path, 'xb', buffering=0) as journal_file:
+                changed_blocks, total_blocks, bytes_written = FileCopyManager_class.delta_update_file_data(
+                    source_file, target_file, journal_file, file_size, C.COPY_DELTA_BLOCK_SIZE, progress_callback)
+            self._log_status(f"Delta update completed: {changed_blocks:,} of {total_blocks:,} blocks changed ({bytes_written:,} bytes written)")
+            result.bytes_copied = file_size
+            result.copy_method = FileCopyManager_class.CopyMethod.DELTA_BLOCKS
+            
+            # Step 3: Copy permission bits and timestamps from source to target
+            shutil.copystat(source_path, target_path)
+            self.timestamp_manager.copy_timestamps(source_path, target_path)
+            self._log_status(f"Step 3: Timestamps copied from source to target")
+            
+            # Step 4: Verify
+            self._log_status(f"Step 4: Verifying updated file")
+            if not self._verify_copy(source_path, target_path):
+                result.error_message = "Copy Simple verification failed"
+                self._log_status(f"DELTA copy failed: Simple verification failed - Beginning rollback")
+                raise Exception("Simple verification failed")  # Trigger rollback
+            result.allocated_bytes = FileCopyManager_class.get_allocated_bytes(os.stat(target_path))
+            
+            # Step 5: Success - commit per the durability policy, then remove the journal # v002.0020 changed
+            self._log_status(f"Step 5: Committing target ({C.COPY_DURABILITY_POLICY} durability), then removing delta journal: {journal_path}")
+            self._commit_durable(target_path, file_size, [journal_path])
+            
+            result.success = True
+            result.verification_passed = True
+            self._log_status(f"DELTA copy completed successfully")
+        
+        except Exception as e:
+            result.error_message = str(e) if not result.error_message else result.error_message
+            self._log_status(f"DELTA copy failed: {result.error_message}")
+            
+            # ROLLBACK PROCEDURE: Replay the undo journal and restore timestamps
+            if Path(journal_path).exists():
+                try:
+                    self._log_status(f"Beginning rollback procedure for failed DELTA copy")
+                    restored = FileCopyManager_class.restore_delta_journal(journal_path, target_path)
+                    self._log_status(f"Restored {restored:,} original blocks from delta journal")
+                    if original_timestamps:
+                        try:
+                            self.timestamp_manager.set_file_timestamps(target_path, *original_timestamps)
+                            self._log_status(f"Original timestamps restored successfully")
+                        except Exception as timestamp_error:
+                            self._log_status(f"Warning: Could not restore original timestamps: {timestamp_error}")
+                    os.remove(journal_path)
+                    self._log_status(f"Rollback procedure completed")
+                except Exception as restore_error:
+                    # CRITICAL: Rollback failed
+                    critical_error = f"CRITICAL ROLLBACK FAILURE: {str(restore_error)}"
+                    self._log_status(critical_error)
+                    self._log_status(f"CRITICAL: Target may be partially updated. Original blocks are in the journal: {journal_path}")
+                    self._log_status("RECOMMENDED ACTION: Keep the journal; the next copy of this file replays it before copying.")
+                    result.error_message += f" | {critical_error}"
+            else:
+                self._log_status("No delta journal to restore (target was not modified)")
+        
+        result.duration_seconds = time.time() - start_time
+        return result
+    
+    def _copy_resumable_strategy(self, source_path: str, target_path: str, overwrite: bool = True, progress_callback=None) -> FileCopyManager_class.CopyOperationResult: # v002.0015 added
+        """
+        Strategy E: resumable copy of very large files into a journaled partial file (with dry run support).
+        Copies into "<target>.fcs_partial" chunk by chunk, journaling each fsynced chunk in
+        "<target>.fcs_partial.journal". Chunks go through the copy engine (copy_file_range,
+        sendfile), sparse sources keep their holes, other local targets are preallocated,
+        and with COPY_DURABILITY_POLICY "none" chunks are not fsynced (resuming then checks
+        them against the source). On a transient I/O error (is_transient_error) the copy is
+        retried COPY_RETRY_COUNT times, each retry continuing from the last good chunk;
+        other errors (no space, access denied, ...) fail at once. The completed partial gets the
+        source timestamps, is verified and then atomically replaces the target, so the
+        original target is untouched until then. A copy which still fails keeps its partial
+        and journal, and a later copy of the same file (in this or a later session) resumes it.
+        """
+        start_time = time.time()
+        source_stat = os.stat(source_path)
+        file_size = source_stat.st_size
+        partial_path = target_path + C.COPY_RESUMABLE_PARTIAL_SUFFIX
+        journal_path = partial_path + C.COPY_RESUMABLE_JOURNAL_SUFFIX
+        
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        self._log_status(f"{dry_run_prefix}Using RESUMABLE strategy for {os.path.basename(source_path)} ({file_size} bytes)")
+        
+        result = FileCopyManager_class.CopyOperationResult(
+            success=False,
+            strategy_used=FileCopyManager_class.CopyStrategy.RESUMABLE,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=0,
+            bytes_copied=0,
+            temp_path=partial_path
+        )
+        
+        if not overwrite and Path(target_path).exists():
+            result.error_message = "Target file exists and overwrite is disabled"
+            self._log_status(f"{dry_run_prefix}RESUMABLE copy skipped: Target exists and overwrite disabled")
+            return result
+        
+        if self.dry_run_mode:
+            if os.path.exists(journal_path):
+                self._log_status(f"DRY RUN: Would resume the partial copy in {partial_path}")
+            self._log_status(f"DRY RUN: Would copy in {C.COPY_RESUMABLE_CHUNK_SIZE:,} byte journaled chunks to {partial_path}")
+            self._log_status(f"DRY RUN: Would copy timestamps, verify, and replace the target with the completed copy")
+            result.bytes_copied = file_size
+            result.success = True
+            result.verification_passed = True
+            result.duration_seconds = time.time() - start_time
+            self._log_status(f"DRY RUN: RESUMABLE copy simulation completed successfully")
+            return result
+        
+        try:
+            target_dir = Path(target_path).parent
+            if target_dir and not target_dir.exists():
+                target_dir.mkdir(parents=True, exist_ok=True)
+                self._log_status(f"Created target directory: {target_dir}")
+            
+            # Step 1: Copy journaled chunks into the partial file, retrying from the last good chunk
+            # Sparse sources keep their holes; other local targets are preallocated (as _copy_file_contents does) # v002.0015 changed
+            sparse = FileCopyManager_class.is_sparse(source_stat)
+            preallocate = (file_size >= C.COPY_PREALLOCATE_THRESHOLD and not sparse
+                           and not FileCopyManager_class.get_pipeline_settings(source_path, target_path))
+            sync_chunks = FileCopyManager_class.DurabilityPolicy(C.COPY_DURABILITY_POLICY) != FileCopyManager_class.DurabilityPolicy.NONE
+            attempt = 0
+            while True:
+                try:
+                    resume_offset = self._resume_partial_copy(source_path, source_stat, partial_path, journal_path)
+                    self._log_status(f"Step 1: Copying from offset {resume_offset:,}: {source_path} -> {partial_path}")
+                    with open(source_path, 'rb', buffering=0) as source_file, \
+                         open(partial_path, 'r+b', buffering=0) as partial_file, \
+                         open(journal_path, 'a', encoding='utf-8') as journal_file:
+                        device_pair = (source_stat.st_dev, os.fstat(partial_file.fileno()).st_dev) # v002.0015 changed [copy engine, extents, preallocation, durability policy]
+                        _, data_bytes, engine_method = FileCopyManager_class.copy_file_data_journaled(
+                            source_file, partial_file, journal_file, resume_offset, file_size, progress_callback,
+                            methods=FileCopyManager_class.available_copy_methods(),
+                            unsupported=self._unsupported_copy_methods.setdefault(device_pair, set()),
+                            sparse=sparse,
+                            preallocate=preallocate,
+                            sync_chunks=sync_chunks,
+                            max_chunk_size=self.rate_limiter.max_chunk_size())
+                    engine_text = engine_method.value if engine_method else "none (all holes)"
+                    sparse_text = f", sparse: {data_bytes:,} data bytes of {file_size - resume_offset:,}" if sparse else ""
+                    self._log_status(f"Journaled copy via {engine_text}{sparse_text}, chunks {'fsynced' if sync_chunks else 'not fsynced'}")
+                    break
+                except OSError as e:
+                    if not FileCopyManager_class.is_transient_error(e):
+                        raise  # eg ENOSPC, EACCES, EROFS, a missing source: retrying cannot help # v002.0015 changed
+                    attempt += 1
+                    result.retry_count = attempt
+                    if attempt > C.COPY_RETRY_COUNT:
+                        raise
+                    self._log_status(f"Copy interrupted ({e}) - retry {attempt} of {C.COPY_RETRY_COUNT} in {C.COPY_RETRY_DELAY}s, resuming from the last good chunk")
+                    time.sleep(C.COPY_RETRY_DELAY)
+            result.bytes_copied = file_size
+            result.copy_method = FileCopyManager_class.CopyMethod.JOURNALED
+            
+            # Step 2: Copy permission bits and timestamps onto the completed partial file, then verify it
+            shutil.copystat(source_path, partial_path)
+            self.timestamp_manager.copy_timestamps(source_path, partial_path)
+            self._log_status(f"Step 2: Timestamps copied from source to partial file, verifying")
+            if not self._verify_copy(source_path, partial_path):
+                # A bad partial cannot be resumed, so start again next time
+                os.remove(partial_path)
+                os.remove(journal_path)
+                result.error_message = "Copy Simple verification failed"
+                self._log_status(f"RESUMABLE copy failed: Simple verification failed - partial copy discarded")
+                result.duration_seconds = time.time() - start_time
+                return result
+            
+            # Step 3: Atomically replace the target, then remove the journal
+            os.replace(partial_path, target_path)
+            self._log_status(f"Step 3: Replaced target with completed copy: {partial_path} -> {target_path}")
+            self._commit_durable(target_path, file_size, [journal_path]) # v002.0020 changed [journal removed once durable]
+            result.allocated_bytes = FileCopyManager_class.get_allocated_bytes(os.stat(target_path))
+            
+            result.success = True
+            result.verification_passed = True
+            self._log_status(f"RESUMABLE copy completed successfully")
+        
+        except Exception as e:
+            result.error_message = str(e) if not result.error_message else result.error_message
+            self._log_status(f"RESUMABLE copy failed: {result.error_message}")
+            if os.path.exists(journal_path):
+                self._resumable_partials.append(partial_path)
+                self._log_status(f"Original target left unchanged. Partial copy kept for resuming: {partial_path}")
+        
+        result.duration_seconds = time.time() - start_time
+        return result
+    
+    def copy_file(self, source_path: str, target_path: str, overwrite: bool = True, progress_callback=None,
+                  planned_size: Optional[int] = None, planned_strategy: Optional[FileCopyManager_class.CopyStrategy] = None,
+                  delta_journal_exists: Optional[bool] = None) -> FileCopyManager_class.CopyOperationResult: # v002.0011 changed [progress_callback], v002.0017 changed [planned_size, planned_strategy], v002.0014 changed [delta_journal_exists]
         """
         Main copy method that automatically selects the appropriate strategy and supports dry run mode.
         
@@ -597,70 +2285,299 @@ class FileCopyManager_class:
         source_path: Source file path
         target_path: Target file path  
         overwrite: Whether to overwrite existing files
+        progress_callback: Optional callable(bytes_copied_so_far) called per chunk copied # v002.0011 added
+        planned_size: Source size from a fresh stat (CopyPlan_class); skips the existence checks and stat # v002.0017 added
+        planned_strategy: Strategy from CopyPlan_class; skips determine_copy_strategy # v002.0017 added
+        delta_journal_exists: Whether an interrupted DELTA update left its journal (from CopyPlan_class); None checks the file system
         
         Returns:
         --------
         CopyOperationResult: Detailed result of the copy operation
         """
-        # Increment sequence number for this operation
-        self.operation_sequence += 1
+        # Increment sequence number for this operation (thread-safe, copy_file may run on several workers) # v002.0009 changed
+        with self._sequence_lock:
+            self.operation_sequence += 1
+            sequence_number = self.operation_sequence
         
-        # Validate input paths
-        if not Path(source_path).exists():
-            return FileCopyManager_class.CopyOperationResult(
-                success=False,
-                strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
-                source_path=source_path,
-                target_path=target_path,
-                file_size=0,
-                duration_seconds=0,
-                error_message="Source file does not exist"
-            )
+        # Validate input paths and get the file size, unless a CopyPlan_class freshness check just did # v002.0017 changed
+        if planned_size is None:
+            if not Path(source_path).exists():
+                return FileCopyManager_class.CopyOperationResult(
+                    success=False,
+                    strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
+                    source_path=source_path,
+                    target_path=target_path,
+                    file_size=0,
+                    duration_seconds=0,
+                    error_message="Source file does not exist"
+                )
         
-        if not Path(source_path).is_file():
-            return FileCopyManager_class.CopyOperationResult(
-                success=False,
-                strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
-                source_path=source_path,
-                target_path=target_path,
-                file_size=0,
-                duration_seconds=0,
-                error_message="Source path is not a file"
-            )
+            if not Path(source_path).is_file():
+                return FileCopyManager_class.CopyOperationResult(
+                    success=False,
+                    strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
+                    source_path=source_path,
+                    target_path=target_path,
+                    file_size=0,
+                    duration_seconds=0,
+                    error_message="Source path is not a file"
+                )
         
-        # Get file size for strategy determination
-        file_size = Path(source_path).stat().st_size
+            # Get file size for strategy determination
+            file_size = Path(source_path).stat().st_size
+        else:
+            file_size = planned_size
+        
+        # Determine copy strategy (unless planned) # v002.0017 changed
+        strategy = planned_strategy if planned_strategy is not None else FileCopyManager_class.determine_copy_strategy(source_path, target_path, file_size)
         
-        # Determine copy strategy
-        strategy = FileCopyManager_class.determine_copy_strategy(source_path, target_path, file_size)
+        # A planned DELTA update rewrites the target in place, so re-plan if it has been hardlinked since # v002.0014 added
+        if planned_strategy == FileCopyManager_class.CopyStrategy.DELTA:
+            try:
+                if os.stat(target_path).st_nlink > 1:
+                    strategy = FileCopyManager_class.determine_copy_strategy(source_path, target_path, file_size)
+            except OSError:
+                pass  # the DELTA strategy reports a missing target
         
         # Log operation start with sequence number
         dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
-        sequence_info = f"[{self.operation_sequence}]"
-        
-        self._log_status(f"{dry_run_prefix}Starting copy operation {sequence_info}:")
-        self._log_status(f"  Source: {source_path}")
-        self._log_status(f"  Target: {target_path}")
-        self._log_status(f"  Size: {file_size:,} bytes")
-        self._log_status(f"  Strategy: {strategy.value}")
-        self._log_status(f"  Overwrite: {overwrite}")
-        if self.dry_run_mode:
-            self._log_status(f"  Mode: DRY RUN SIMULATION")
+        sequence_info = f"[{sequence_number}]" # v002.0009 changed
+        
+        with self.file_log_scope() as detail_lines: # v002.0028 added [one line per file in "summary" verbosity]
+            self._log_status(f"{dry_run_prefix}Starting copy operation {sequence_info}:")
+            self._log_status(f"  Source: {source_path}")
+            self._log_status(f"  Target: {target_path}")
+            self._log_status(f"  Size: {file_size:,} bytes")
+            self._log_status(f"  Strategy: {strategy.value}")
+            self._log_status(f"  Overwrite: {overwrite}")
+            if self.dry_run_mode:
+                self._log_status(f"  Mode: DRY RUN SIMULATION")
+            
+            # Roll back an interrupted DELTA update of this target before copying over it # v002.0014 added
+            result = None
+            if delta_journal_exists is not False:
+                try:
+                    self.recover_delta_journal(target_path)
+                except Exception as e:
+                    result = FileCopyManager_class.CopyOperationResult(
+                        success=False,
+                        strategy_used=strategy,
+                        source_path=source_path,
+                        target_path=target_path,
+                        file_size=file_size,
+                        duration_seconds=0,
+                        error_message=f"Could not replay interrupted DELTA update journal {target_path + C.COPY_DELTA_JOURNAL_SUFFIX}: {e}"
+                    )
+        
+            # Throttle to the rate limits: one file token now, and each chunk's bytes as it is copied # v002.0024 added
+            # (a clone moves no data, so it is given the unthrottled callback)
+            if not self.dry_run_mode:
+                self.rate_limiter.acquire_files()
+            clone_progress_callback = progress_callback
+            progress_callback = self.rate_limiter.wrap_progress(progress_callback)
         
-        # Execute appropriate strategy
-        if strategy == FileCopyManager_class.CopyStrategy.DIRECT:
-            result = self._copy_direct_strategy(source_path, target_path)
-        else:  # STAGED strategy with rename-based backup
-            result = self._copy_staged_strategy(source_path, target_path, overwrite)
+            # Execute appropriate strategy, trying a clone first (None when cloning is not possible here) # v002.0012 changed
+            # unless an interrupted DELTA update could not be rolled back # v002.0014 changed
+            if result is None:
+                result = self._copy_clone_strategy(source_path, target_path, overwrite, clone_progress_callback) # v002.0024 changed [unthrottled]
+            if result is None:
+                if strategy == FileCopyManager_class.CopyStrategy.DIRECT:
+                    result = self._copy_direct_strategy(source_path, target_path, progress_callback, file_size)
+                elif strategy == FileCopyManager_class.CopyStrategy.DELTA: # v002.0014 added
+                    result = self._copy_delta_strategy(source_path, target_path, overwrite, progress_callback, file_size)
+                elif strategy == FileCopyManager_class.CopyStrategy.RESUMABLE: # v002.0015 added
+                    result = self._copy_resumable_strategy(source_path, target_path, overwrite, progress_callback)
+                else:  # STAGED strategy (COPY_STAGED_MODE)
+                    result = self._copy_staged_strategy(source_path, target_path, overwrite, progress_callback, file_size)
         
-        # Log final result with sequence number
-        if result.success:
+        self._record_telemetry(result) # v002.0027 added
+        
+        # Log final result with sequence number (one structured line in "summary" verbosity) # v002.0028 changed
+        if detail_lines is not None:
+            self._log_file_result(detail_lines, sequence_number, result)
+        elif result.success:
             self._log_status(f"{dry_run_prefix}Copy operation {sequence_info} SUCCESSFUL - {result.bytes_copied:,} bytes in {result.duration_seconds:.2f}s")
         else:
             self._log_status(f"{dry_run_prefix}Copy operation {sequence_info} FAILED - {result.error_message}")
         
         return result
     
+    def link_file(self, source_path: str, link_source: str, target_path: str, overwrite: bool = True,
+                  file_size: int = 0) -> Optional[FileCopyManager_class.CopyOperationResult]: # v002.0021 added
+        """
+        Strategy F: recreate a source hardlink on the target, instead of copying the data again.
+        
+        Purpose:
+        --------
+        source_path is a hardlink of a source file whose copy already exists on the
+        target at link_source, so target_path is made another link to that copy. The
+        link is made beside the target and atomically renamed over it, so an existing
+        target is only replaced once the link exists. The members of an inode group
+        share their data and timestamps, so there is nothing further to copy or verify.
+        
+        Returns None whenever a link cannot be made (eg link_source is on another
+        filesystem, or the target filesystem has no hardlinks), so the caller falls back
+        to copy_file.
+        
+        Args:
+        -----
+        source_path: Source file (a hardlink of the file copied to link_source)
+        link_source: Already copied target file to link to
+        target_path: Target file path
+        overwrite: Whether to overwrite an existing target
+        file_size: Size of the file, reported as bytes saved
+        
+        Returns:
+        --------
+        Optional[CopyOperationResult]: Successful HARDLINK result, or None to fall back to copying
+        """
+        if not overwrite and Path(target_path).exists():
+            return None  # Let copy_file report the overwrite refusal
+        with self._sequence_lock:
+            self.operation_sequence += 1
+            sequence_number = self.operation_sequence
+        start_time = time.time()
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        
+        with self.file_log_scope() as detail_lines: # v002.0028 added [one line per link in "summary" verbosity]
+            self._log_status(f"{dry_run_prefix}Starting hardlink operation [{sequence_number}]:")
+            self._log_status(f"  Source: {source_path}")
+            self._log_status(f"  Target: {target_path}")
+            self._log_status(f"  Linked to: {link_source}")
+            link_error = None
+            if not self.dry_run_mode:
+                self.rate_limiter.acquire_files()  # a link is still a file operation on the target # v002.0024 added
+                try:
+                    if os.path.exists(target_path) and os.path.samefile(link_source, target_path):
+                        self._log_status(f"Target is already linked to {link_source}")
+                    else:
+                        temp_path = f"{target_path}.link_{uuid.uuid4().hex[:8]}"
+                        os.link(link_source, temp_path)
+                        try:
+                            os.replace(temp_path, target_path)
+                        except OSError:
+                            os.remove(temp_path)
+                            raise
+                        self._commit_durable(target_path, 0)  # the data is already durable (or pending) with link_source
+                except OSError as e:
+                    link_error = e
+        
+        if link_error is not None: # v002.0028 changed [the held lines are logged with the fallback]
+            for message in detail_lines or []:
+                self._log_status(message)
+            self._log_status(f"Hardlink not available ({link_error}), falling back to a full copy")
+            return None
+        result = FileCopyManager_class.CopyOperationResult(
+            success=True,
+            strategy_used=FileCopyManager_class.CopyStrategy.HARDLINK,
+            source_path=source_path,
+            target_path=target_path,
+            file_size=file_size,
+            duration_seconds=time.time() - start_time,
+            verification_passed=True,
+        )
+        if detail_lines is not None:
+            self._log_file_result(detail_lines, sequence_number, result)
+        else:
+            self._log_status(f"{dry_run_prefix}Hardlink operation [{sequence_number}] SUCCESSFUL - {file_size:,} bytes not copied")
+        return result
+    
+    def copy_small_file_batch(self, batch: list[tuple[str, str, int]], overwrite: bool = True) -> list[FileCopyManager_class.CopyOperationResult]: # v002.0022 added
+        """
+        Copy a batch of small files into one target folder, with minimal per-file overhead.
+        
+        Purpose:
+        --------
+        For trees of tiny files the cost of copy_file is mostly per-file overhead rather
+        than data: eight or more log lines, an existence check and stat, a timestamp copy
+        which stats both files again, and a verification stat of both files. Here each
+        file is opened, fstat'ed and read whole once, written with one write, and given
+        its timestamps and permission bits from that same fstat (as shutil.copy2 would);
+        verification compares the bytes written with
+        the fstat size (no further stats). The target folder is created once per batch and
+        the batch is logged as one line (failures are logged individually).
+        The files use the DIRECT strategy (as copy_file would choose for them); the
+        durability policy applies as usual (group commit suits batches well), as do
+        the rate limits (one file token and the file's bytes per file). # v002.0024 added
+        With overwrite disabled an existing target is not touched and its file fails
+        ("Target file exists and overwrite is disabled"), as with the other strategies.
+        
+        Args:
+        -----
+        batch: (source_path, target_path, planned size) of each file, all targets in one folder
+        overwrite: Whether to overwrite existing targets
+        
+        Returns:
+        --------
+        list[CopyOperationResult]: One result per file, in batch order
+        """
+        start_time = time.time()
+        with self._sequence_lock:
+            first_sequence = self.operation_sequence + 1
+            self.operation_sequence += len(batch)
+        dry_run_prefix = "DRY RUN: " if self.dry_run_mode else ""
+        target_dir = os.path.dirname(batch[0][1]) if batch else ""
+        if target_dir and not os.path.isdir(target_dir):
+            if self.dry_run_mode:
+                self._log_status(f"DRY RUN: Would create target directory: {target_dir}")
+            else:
+                os.makedirs(target_dir, exist_ok=True)
+                self._log_status(f"Created target directory: {target_dir}")
+        
+        results = []
+        for source_path, target_path, file_size in batch:
+            file_start_time = time.time()
+            result = FileCopyManager_class.CopyOperationResult(
+                success=False,
+                strategy_used=FileCopyManager_class.CopyStrategy.DIRECT,
+                source_path=source_path,
+                target_path=target_path,
+                file_size=file_size,
+                duration_seconds=0,
+            )
+            if not overwrite and self.dry_run_mode and os.path.exists(target_path):
+                result.error_message = "Target file exists and overwrite is disabled"
+            elif self.dry_run_mode:
+                result.success = True
+                result.verification_passed = True
+                result.bytes_copied = file_size
+            else:
+                try:
+                    self.rate_limiter.acquire_files() # v002.0024 added
+                    with open(source_path, 'rb', buffering=0) as source_file:
+                        source_stat = os.fstat(source_file.fileno())
+                        data = source_file.read()
+                    self.rate_limiter.acquire_bytes(len(data)) # v002.0024 added
+                    with open(target_path, 'wb' if overwrite else 'xb', buffering=0) as target_file: # v002.0022 changed [overwrite]
+                        FileCopyManager_class._write_fully(target_file, data)
+                    result.file_size = source_stat.st_size
+                    result.bytes_copied = len(data)
+                    result.copy_method = FileCopyManager_class.CopyMethod.SMALL_BATCH
+                    if C.COPY_VERIFICATION_ENABLED and len(data) != source_stat.st_size:
+                        raise OSError(errno.EIO, f"Simple verification failed: Size mismatch - Source: {source_stat.st_size}, Copied: {len(data)}")
+                    self.timestamp_manager.copy_timestamps_from_stat(source_stat, target_path)
+                    os.chmod(target_path, stat.S_IMODE(source_stat.st_mode))  # permission bits last, as shutil.copystat does # v002.0022 added
+                    self._commit_durable(target_path, len(data))
+                    result.success = True
+                    result.verification_passed = C.COPY_VERIFICATION_ENABLED
+                except FileExistsError: # v002.0022 added [overwrite disabled]
+                    result.error_message = "Target file exists and overwrite is disabled"
+                except FileNotFoundError as e:
+                    result.error_message = "Source file does not exist" if not os.path.exists(source_path) else str(e)
+                except Exception as e:
+                    result.error_message = str(e)
+                if not result.success:
+                    self._log_status(f"Copy operation [{first_sequence + len(results)}] FAILED - {source_path} -> {target_path}: {result.error_message}")
+            result.duration_seconds = time.time() - file_start_time
+            self._record_telemetry(result) # v002.0027 added
+            results.append(result)
+        
+        copied = [result for result in results if result.success]
+        self._log_status(f"{dry_run_prefix}Small file batch [{first_sequence}-{first_sequence + len(batch) - 1}]: "
+                         f"{len(copied)} of {len(batch)} files, {sum(result.bytes_copied for result in copied):,} bytes "
+                         f"-> {target_dir} in {(time.time() - start_time) * 1000:.1f} ms")
+        return results
+    
     def start_copy_operation(self, operation_name: str, dry_run: bool = False) -> str:
         """
         Start a new copy operation session with dedicated logging and dry run support.
@@ -677,6 +2594,16 @@ class FileCopyManager_class:
         self.operation_id = uuid.uuid4().hex[:8]
         self.operation_logger = FileCopyManager_class.create_copy_operation_logger(self.operation_id)
         self.operation_sequence = 0  # Reset sequence counter for new operation
+        DriveClassifier_class.shared().clear()  # classify drives afresh once per operation # v002.0018 added
+        self._resumable_partials = []  # v002.0015 added
+        with self._durability_lock: # v002.0020 added
+            self._fsync_count = 0
+            self._fsync_seconds = 0.0
+        self.rate_limiter.reset() # v002.0024 added
+        self.telemetry.reset_operation() # v002.0027 added
+        self.operation_log_path = next((handler.baseFilename for handler in self.operation_logger.handlers
+                                        if hasattr(handler, 'baseFilename')), None) # v002.0027 added, v002.0028 changed [any file handler]
+        self._status_to_debug_log = get_log_level() <= logging.DEBUG # v002.0028 added
         self.set_dry_run_mode(dry_run)
         
         dry_run_text = " (DRY RUN SIMULATION)" if dry_run else ""
@@ -685,12 +2612,14 @@ class FileCopyManager_class:
         self.operation_logger.info(f"COPY OPERATION STARTED: {operation_name}{dry_run_text}")
         self.operation_logger.info(f"Operation ID: {self.operation_id}")
         self.operation_logger.info(f"Mode: {'DRY RUN SIMULATION' if dry_run else 'NORMAL OPERATION'}")
+        self.operation_logger.info(f"Rate limit: {CopyRateLimiter_class.format_limits(*self.rate_limiter.limits)}") # v002.0024 added
+        self.operation_logger.info(f"Log: {C.COPY_LOG_VERBOSITY} verbosity, {'batched on a background thread' if C.COPY_LOG_ASYNC else 'written per line'}") # v002.0028 added
         self.operation_logger.info(f"Timestamp: {datetime.now().isoformat()}")
         self.operation_logger.info("=" * 80)
         
         return self.operation_id
     
-    def end_copy_operation(self, success_count: int, error_count: int, total_bytes: int):
+    def end_copy_operation(self, success_count: int, error_count: int, total_bytes: int, allocated_bytes: Optional[int] = None): # v002.0013 changed [allocated_bytes]
         """
         End the current copy operation session with comprehensive summary.
         
@@ -699,7 +2628,9 @@ class FileCopyManager_class:
         success_count: Number of successfully processed files
         error_count: Number of files that failed
         total_bytes: Total bytes processed
+        allocated_bytes: Disk space allocated to the copied files on the target (sparse files use less), if known
         """
+        self.flush_durable()  # group commit for files still pending # v002.0020 added
         if self.operation_logger:
             dry_run_text = " (DRY RUN SIMULATION)" if self.dry_run_mode else ""
             
@@ -709,7 +2640,40 @@ class FileCopyManager_class:
             self.operation_logger.info(f"Files processed successfully: {success_count}")
             self.operation_logger.info(f"Files failed: {error_count}")
             self.operation_logger.info(f"Total bytes processed: {total_bytes:,}")
+            if allocated_bytes is not None: # v002.0013 added
+                self.operation_logger.info(f"Total bytes allocated on target: {allocated_bytes:,} (logical {total_bytes:,})")
             self.operation_logger.info(f"Total operations: {self.operation_sequence}")
+            durability_text = C.COPY_DURABILITY_POLICY # v002.0020 added
+            if C.COPY_DURABILITY_POLICY == FileCopyManager_class.DurabilityPolicy.GROUP.value:
+                durability_text += f" (every {C.COPY_DURABILITY_GROUP_FILES} files or {C.COPY_DURABILITY_GROUP_BYTES:,} bytes)"
+            self.operation_logger.info(f"Durability policy: {durability_text}, {self._fsync_count:,} fsync calls taking {self._fsync_seconds:.3f}s")
+            rate_statistics = self.rate_limiter.statistics() # v002.0024 added
+            changed_text = f" (changed {rate_statistics.limit_changes} times while copying)" if rate_statistics.limit_changes else ""
+            self.operation_logger.info(f"Effective throughput: {rate_statistics.bytes_per_second / (1024 * 1024):.1f} MB/s, "
+                                       f"{rate_statistics.files_per_second:.1f} files/s against a limit of "
+                                       f"{CopyRateLimiter_class.format_limits(rate_statistics.bytes_per_second_limit, rate_statistics.files_per_second_limit)}"
+                                       f"{changed_text}; workers throttled for {rate_statistics.throttled_seconds:.1f}s")
+            if C.COPY_TELEMETRY_ENABLED and not self.dry_run_mode: # v002.0027 added [per strategy figures, and the metrics file beside this log]
+                for line in self.telemetry.summary_lines():
+                    self.operation_logger.info(f"Telemetry: {line}")
+                if self.operation_log_path:
+                    metrics_path = os.path.splitext(self.operation_log_path)[0] + "_metrics.json"
+                    try:
+                        self.telemetry.write_metrics(metrics_path, {
+                            "operation_id": self.operation_id,
+                            "timestamp": datetime.now().isoformat(),
+                            "files_succeeded": success_count,
+                            "files_failed": error_count,
+                            "total_bytes": total_bytes,
+                            "workers": C.COPY_WORKER_COUNT,
+                        })
+                        self.operation_logger.info(f"Copy metrics written to: {metrics_path}")
+                    except OSError as e:
+                        self.operation_logger.info(f"Copy metrics could not be written to {metrics_path}: {e}")
+            if self._resumable_partials: # v002.0015 added
+                self.operation_logger.info(f"Unfinished resumable copies (copy again to resume): {len(self._resumable_partials)}")
+                for partial_path in self._resumable_partials:
+                    self.operation_logger.info(f"  {partial_path}")
             if self.dry_run_mode:
                 self.operation_logger.info("NOTE: This was a DRY RUN simulation - no actual files were modified")
             self.operation_logger.info(f"Timestamp: {datetime.now().isoformat()}")
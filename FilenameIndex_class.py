@@ -0,0 +1,146 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class FilenameIndex_class:
+    """
+    Filename index over comparison results for instant wildcard filtering.
+
+    Purpose:
+    --------
+    Built once after a comparison, so applying a wildcard filter no longer runs
+    fnmatch against every entry of comparison_results. The index holds:
+    - lowercased basenames of every file (files only - folders are never filter matches)
+    - an extension -> rel_paths map, used directly for the common "*.ext" patterns
+    - a basename -> rel_paths map, used directly for patterns without wildcards
+    - sorted basenames and sorted reversed basenames, so "prefix*" and "*suffix"
+      patterns (eg "IMG_*", "*.tar.gz") are two binary searches
+    Any other pattern is matched with a compiled (and cached) regular expression
+    from fnmatch.translate, case-insensitively, over the basename list.
+
+    Usage:
+    ------
+    index = FilenameIndex_class(comparison_results)
+    matches = index.match("*.jpg", limit=C.MAX_FILTER_RESULTS)  # list of rel_paths in path order
+    """
+
+    _WILDCARD_CHARS = frozenset('*?[')
+
+    def __init__(self, comparison_results: dict):
+        """
+        Build the index from comparison results.
+
+        Args:
+        -----
+        comparison_results: rel_path -> FolderCompareSync_class.ComparisonResult_class
+        """
+        start_time = time.time()
+        self.rel_paths: list[str] = []          # file rel_paths, sorted
+        self.basenames: list[str] = []          # lowercased basenames, parallel to rel_paths
+        self.by_extension: dict[str, list[int]] = {}   # ".ext" (lowercased, last suffix) -> positions
+        self.by_basename: dict[str, list[int]] = {}    # lowercased basename -> positions
+
+        file_paths = []
+        for rel_path, result in comparison_results.items():
+            if not rel_path:  # Skip empty (root) path
+                continue
+            # Only index files, not folders
+            is_file = ((result.left_item and not result.left_item.is_folder) or
+                       (result.right_item and not result.right_item.is_folder))
+            if is_file:
+                file_paths.append(rel_path)
+        file_paths.sort()
+
+        for position, rel_path in enumerate(file_paths):
+            basename = rel_path.rsplit('/', 1)[-1].lower()
+            self.rel_paths.append(rel_path)
+            self.basenames.append(basename)
+            self.by_basename.setdefault(basename, []).append(position)
+            dot = basename.rfind('.')
+            if dot >= 0:
+                self.by_extension.setdefault(basename[dot:], []).append(position)
+
+        # Sorted (basename, position) and (reversed basename, position) for prefix/suffix range lookups
+        by_name = sorted(zip(self.basenames, range(len(self.basenames))))
+        self._sorted_names = [name for name, _ in by_name]
+        self._sorted_name_positions = [position for _, position in by_name]
+        by_reversed = sorted(zip((name[::-1] for name in self.basenames), range(len(self.basenames))))
+        self._sorted_reversed_names = [name for name, _ in by_reversed]
+        self._sorted_reversed_positions = [position for _, position in by_reversed]
+
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"FilenameIndex_class: indexed {len(self.rel_paths):,} files, "
+                                         f"{len(self.by_extension):,} extensions in {(time.time() - start_time) * 1000:.1f} ms")
+
+    def __len__(self) -> int:
+        return len(self.rel_paths)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def compile_matcher(wildcard: str):
+        """Compile a (lowercased) shell wildcard into a regex match function, cached per pattern."""
+        return re.compile(fnmatch.translate(wildcard.lower())).match
+
+    def match(self, wildcard: str, limit: Optional[int] = None) -> list[str]:
+        """
+        Return rel_paths of files whose basename matches the wildcard (case-insensitive).
+
+        Args:
+        -----
+        wildcard: Shell-style pattern, eg "*.jpg", "IMG_??.*", "readme.txt"
+        limit: Maximum number of matches to return (None for no limit)
+
+        Returns:
+        --------
+        list[str]: Matching rel_paths in path order
+        """
+        pattern = wildcard.lower()
+
+        # Fast path: no wildcard characters at all - exact basename lookup
+        if not (FilenameIndex_class._WILDCARD_CHARS & set(pattern)):
+            positions = self.by_basename.get(pattern, [])
+            return [self.rel_paths[p] for p in positions[:limit]]
+
+        # Fast path: "*.ext" with a plain single-suffix extension
+        if pattern.startswith('*.'):
+            extension = pattern[1:]
+            if '.' not in extension[1:] and not (FilenameIndex_class._WILDCARD_CHARS & set(extension)):
+                positions = self.by_extension.get(extension, [])
+                return [self.rel_paths[p] for p in positions[:limit]]
+
+        # Fast path: "prefix*" or "*suffix" with no other wildcard characters
+        if pattern.endswith('*') and not (FilenameIndex_class._WILDCARD_CHARS & set(pattern[:-1])):
+            positions = FilenameIndex_class._prefix_range(self._sorted_names, self._sorted_name_positions, pattern[:-1])
+            return [self.rel_paths[p] for p in sorted(positions)[:limit]]
+        if pattern.startswith('*') and not (FilenameIndex_class._WILDCARD_CHARS & set(pattern[1:])):
+            positions = FilenameIndex_class._prefix_range(self._sorted_reversed_names, self._sorted_reversed_positions, pattern[1:][::-1])
+            return [self.rel_paths[p] for p in sorted(positions)[:limit]]
+
+        # General case: compiled regex over the lowercased basenames
+        matcher = FilenameIndex_class.compile_matcher(pattern)
+        matches = []
+        for rel_path, basename in zip(self.rel_paths, self.basenames):
+            if matcher(basename):
+                matches.append(rel_path)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    @staticmethod
+    def _prefix_range(sorted_keys: list[str], positions: list[int], prefix: str) -> list[int]:
+        """Positions of all keys starting with prefix, found by binary search over sorted keys."""
+        low = bisect.bisect_left(sorted_keys, prefix)
+        high = bisect.bisect_left(sorted_keys, prefix + '\U0010ffff')
+        return positions[low:high]
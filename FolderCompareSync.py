@@ -3,6 +3,31 @@
 FolderCompareSync - A Folder Comparison & Synchronization Tool
 
 Version:
+         v002.0028 - buffered copy operation log: BatchedLogHandler_class writes each foldercomparesync_copy_*.log from a background thread in batches, flushed within COPY_LOG_FLUSH_INTERVAL_SECONDS (COPY_LOG_ASYNC); COPY_LOG_VERBOSITY "summary" logs one structured line per file instead of 8-12 (failed files keep their detail); status lines only go to the main log when it logs DEBUG
+         v002.0027 - per-file copy telemetry: CopyTelemetry_class keeps rolling throughput per device pair and strategy and a file size histogram with latencies, drives the copy ETA before the scheduler's own fit, and writes a JSON metrics summary beside each foldercomparesync_copy_*.log (data for choosing COPY_STRATEGY_THRESHOLD)
+         v002.0026 - zero-I/O dry runs: COPY_DRY_RUN_MODE "plan" reports the copy plan from the comparison metadata (directories to create, new/overwritten files, bytes per strategy, missing items, estimated duration) as one summary, optionally written as a JSON plan file (COPY_PLAN_FILE_ENABLED); "simulate" keeps the per-file dry run
+         v002.0025 - cancellable, pausable copy and delete operations: OperationControl_class with Pause/Resume and Cancel in the progress dialog (items in progress finish, nothing new starts), checkpoint of the items done and the remaining copy plan, Resume Copy... continues a cancelled copy without a comparison; Quit cancels a running copy first
+         v002.0024 - copy bandwidth and IOPS throttling: CopyRateLimiter_class token buckets (bytes/s and files/s) shared by all copy workers, COPY_RATE_LIMIT_BYTES_PER_SECOND / COPY_RATE_LIMIT_FILES_PER_SECOND, adjustable live from the copy progress dialog, effective throughput against the limit in the operation log
+         v002.0023 - copy schedule policies COPY_SCHEDULE_POLICY (plan_order, largest_first, smallest_first, balanced) and a time remaining estimate fitted to observed per-file and per-byte copy times; utility/benchmark_copy_scheduling.py
+         v002.0022 - small-file batching: DIRECT files <= COPY_SMALL_FILE_THRESHOLD copied in batches of COPY_SMALL_FILE_BATCH_FILES per target folder (folder order), one read/write/timestamp call per file, one log line and progress update per batch; utility/benchmark_small_file_copy.py
+         v002.0021 - hardlink preservation COPY_PRESERVE_HARDLINKS: selected source files sharing an inode are copied once and the other members recreated as hardlinks on the target (same volume), summary counts linked files and bytes saved
+         v002.0020 - durability policy COPY_DURABILITY_POLICY: "none", "per_file" or "group" (group commit fsyncs batches of files and their folders every N files or MB); backups/journals removed only once durable, fsync count and time logged per operation
+         v002.0019 - preallocate local copy targets >= COPY_PREALLOCATE_THRESHOLD (posix_fallocate, or NTFS end of file) so out-of-space fails fast, plus a free space precheck over the whole copy plan
+         v002.0018 - DriveClassifier_class: drive type and volume classified once per drive/mount (GetDriveTypeW, or /proc/self/mountinfo with NFS/CIFS/fuse as network), shared by get_drive_type, the copy plan and the scheduler's per volume pair limits
+         v002.0017 - CopyPlan_class: copy plan compiled once from comparison results (directories, files, sizes, strategies); the scheduler makes one freshness stat per file
+         v002.0016 - STAGED copy mode COPY_STAGED_MODE: "atomic_replace" (temp file, fsync, timestamps, verify, os.replace; default) or the original "rename_backup"
+         v002.0015 - RESUMABLE copy strategy for very large files: chunks copied by the copy engine (sparse aware) into a .fcs_partial file with a JSON-lines journal, retries and later sessions resume from the last good chunk
+         v002.0014 - DELTA copy strategy: large local files with an existing target rewrite only changed blocks in place behind an fsynced undo journal (COPY_DELTA_THRESHOLD, COPY_DELTA_BLOCK_SIZE)
+         v002.0013 - sparse-aware copy (SEEK_DATA/SEEK_HOLE data extents only, holes recreated), allocated vs logical bytes in the copy summary
+         v002.0012 - CLONE copy strategy: FICLONE reflink on copy-on-write volumes with transparent fallback to DIRECT/STAGED
+         v002.0011 - pipelined reader-thread/writer copy for network drives (COPY_CHUNK_SIZE, per drive type chunk size and queue depth, COPY_NETWORK_TIMEOUT) and per-chunk copy progress
+         v002.0010 - copy engine in FileCopyManager_class: os.copy_file_range, then os.sendfile, then a large-buffer readinto loop, method recorded per file; plus utility/benchmark_copy_methods.py
+         v002.0009 - add CopyScheduler_class: files copied on a worker pool (directories first, per device pair cap), thread-safe counters and per-file buffered copy logs
+         v002.0008 - add DifferenceIndex_class: select all differences and smart folder ticking are sorted-range lookups; O(1) item -> path reverse mapping
+         v002.0007 - add FilenameIndex_class: indexed instant wildcard filtering; filtered view detaches/reattaches tree rows instead of rebuilding the trees
+         v002.0006 - add DisplayFormatter_class: LRU-cached size/timestamp formatting and per-record memo of rendered tree cells, plus utility/benchmark_tree_formatting.py
+         v002.0005 - ProgressDialog_class throttles its own repaints (at most N per second, latest state wins) and shows items/s, bytes/s and ETA
+         v002.0004 - add UIEventQueue_class: worker threads post coalesced progress, status lines and calls which the Tk thread drains at a fixed frame rate
          v002.0003 - moved main classes into their own separate .py files, included by 'from xxx.py include xxx'
          v002.0000 - reorganised class and def for
                      Reduced Global Namespace Pollution,
@@ -129,6 +154,17 @@ def main():
     # Import all of the reorganised Classes etc
     # The "dynamic imports" have already been done above so impoting here should pick up every global import
     from ProgressDialog_class        import ProgressDialog_class
+    from UIEventQueue_class          import UIEventQueue_class # v002.0004 added [coalescing UI event queue]
+    from DisplayFormatter_class      import DisplayFormatter_class # v002.0006 added [memoized size/timestamp formatting]
+    from FilenameIndex_class         import FilenameIndex_class # v002.0007 added [indexed instant filtering]
+    from DifferenceIndex_class       import DifferenceIndex_class # v002.0008 added [range-based difference selection]
+    from DriveClassifier_class       import DriveClassifier_class # v002.0018 added [cached drive type and volume classification]
+    from CopyRateLimiter_class       import CopyRateLimiter_class # v002.0024 added [copy bandwidth and IOPS throttling]
+    from OperationControl_class      import OperationControl_class # v002.0025 added [cancel/pause and checkpoints]
+    from CopyTelemetry_class         import CopyTelemetry_class # v002.0027 added [per-file copy telemetry]
+    from BatchedLogHandler_class     import BatchedLogHandler_class # v002.0028 added [background batched copy operation log]
+    from CopyPlan_class              import CopyPlan_class # v002.0017 added [copy plan compiled from comparison results]
+    from CopyScheduler_class         import CopyScheduler_class # v002.0009 added [parallel copy worker pool]
     from FileTimestampManager_class  import FileTimestampManager_class
     from FileCopyManager_class       import FileCopyManager_class
     from DeleteOrphansManager_class  import DeleteOrphansManager_class
@@ -197,6 +233,15 @@ def main():
     log_and_flush(logging.DEBUG, f"  Max files/folders: {C.MAX_FILES_FOLDERS:,}")
     log_and_flush(logging.DEBUG, f"  Status log history: {C.STATUS_LOG_MAX_HISTORY:,} lines")
     log_and_flush(logging.DEBUG, f"  Copy strategy threshold: {C.COPY_STRATEGY_THRESHOLD / (1024*1024):.1f} MB")
+    log_and_flush(logging.DEBUG, f"  Staged copy mode: {C.COPY_STAGED_MODE}") # v002.0016 added
+    log_and_flush(logging.DEBUG, f"  Copy schedule policy: {C.COPY_SCHEDULE_POLICY}") # v002.0023 added
+    log_and_flush(logging.DEBUG, f"  Copy rate limit: {C.COPY_RATE_LIMIT_BYTES_PER_SECOND / (1024*1024):.1f} MB/s, {C.COPY_RATE_LIMIT_FILES_PER_SECOND} files/s (0 = unlimited)") # v002.0024 added
+    log_and_flush(logging.DEBUG, f"  Dry run mode: {C.COPY_DRY_RUN_MODE} (plan file: {C.COPY_PLAN_FILE_ENABLED})") # v002.0026 added
+    log_and_flush(logging.DEBUG, f"  Copy telemetry: {C.COPY_TELEMETRY_ENABLED} (EWMA alpha {C.COPY_TELEMETRY_EWMA_ALPHA})") # v002.0027 added
+    log_and_flush(logging.DEBUG, f"  Copy log: {C.COPY_LOG_VERBOSITY} verbosity, async {C.COPY_LOG_ASYNC} (batch {C.COPY_LOG_BATCH_LINES} lines, flush within {C.COPY_LOG_FLUSH_INTERVAL_SECONDS}s)") # v002.0028 added
+    log_and_flush(logging.DEBUG, f"  Small file batching: <= {C.COPY_SMALL_FILE_THRESHOLD / 1024:.0f} KB, {C.COPY_SMALL_FILE_BATCH_FILES} files per batch") # v002.0022 added
+    log_and_flush(logging.DEBUG, f"  Preserve hardlinks: {C.COPY_PRESERVE_HARDLINKS}") # v002.0021 added
+    log_and_flush(logging.DEBUG, f"  Durability policy: {C.COPY_DURABILITY_POLICY} (group of {C.COPY_DURABILITY_GROUP_FILES} files / {C.COPY_DURABILITY_GROUP_BYTES / (1024*1024):.1f} MB)") # v002.0020 added
     log_and_flush(logging.DEBUG, f"  SHA512 status threshold: {C.SHA512_STATUS_MESSAGE_THRESHOLD / (1024*1024):.1f} MB")
     log_and_flush(logging.DEBUG, f"  Simple verification enabled: {C.COPY_VERIFICATION_ENABLED}")
     log_and_flush(logging.DEBUG, f"  Retry count: {C.COPY_RETRY_COUNT}")
@@ -70,10 +70,15 @@ WINDOW_TOP_OFFSET = 0              # Pixels from top of screen
 
 # Progress dialog appearance and behavior
 PROGRESS_DIALOG_WIDTH = 400        # Progress dialog width in pixels
-PROGRESS_DIALOG_HEIGHT = 150       # Progress dialog height in pixels
+PROGRESS_DIALOG_HEIGHT = 175       # Progress dialog height in pixels # v002.0005 changed [room for the rate/ETA line]
+PROGRESS_DIALOG_RATE_LIMIT_HEIGHT = 40   # Extra height when the dialog shows the copy rate limit controls # v002.0024 added
+PROGRESS_DIALOG_CONTROLS_HEIGHT = 45     # Extra height when the dialog shows the Pause/Resume and Cancel buttons # v002.0025 added
 PROGRESS_ANIMATION_SPEED = 10      # Animation speed for indeterminate progress
 PROGRESS_UPDATE_FREQUENCY = 100    # Update progress every N items processed
 PROGRESS_PERCENTAGE_FREQUENCY = 1  # Update percentage display every N%
+UI_EVENT_DRAIN_INTERVAL_MS = 50    # Drain worker-thread UI events every N ms (~20 frames/second) # v002.0004 added [coalescing UI event queue]
+PROGRESS_DIALOG_MAX_REPAINTS_PER_SECOND = 10   # Progress dialogs repaint at most N times per second, however often they are updated # v002.0005 added
+PROGRESS_RATE_MIN_ELAPSED_SECONDS = 1.0        # Show rates/ETA only after this many seconds, so early estimates are not wild # v002.0005 added
 
 # File processing limits and thresholds
 SHA512_MAX_FILE_SIZE = (1000 * 1024 * 1024) * 25  # 25 GB filesize limit for hash computation
@@ -83,17 +88,68 @@ SCAN_PROGRESS_UPDATE_INTERVAL = 50                # Update scanning progress eve
 COMPARISON_PROGRESS_BATCH = 100                   # Process comparison updates every N items
 
 # Copy System Configuration
-COPY_STRATEGY_THRESHOLD = (1024 * 1024) * 200    # 200MB threshold for copy strategy selection into STAGED (rename-based backup)
+COPY_STRATEGY_THRESHOLD = (1024 * 1024) * 200    # 200MB threshold for copy strategy selection into STAGED (see COPY_STAGED_MODE)
+COPY_STAGED_MODE = "atomic_replace"              # STAGED strategy: "atomic_replace" (copy to temp, fsync, verify, os.replace) or "rename_backup" (rename target to .backup, copy, restore on failure) # v002.0016 added
 COPY_VERIFICATION_ENABLED = True                 # Enable post-copy simple verification
 COPY_RETRY_COUNT = 3                             # Number of retries for failed operations
 COPY_RETRY_DELAY = 1.0                           # Delay between retries in seconds
-COPY_CHUNK_SIZE = 64 * 1024                      # 64KB chunks for large file copying
-COPY_NETWORK_TIMEOUT = 30.0                      # Network operation timeout in seconds
+COPY_CHUNK_SIZE = 64 * 1024                      # 64KB chunks for pipelined copies on drive types without a COPY_PIPELINE_CHUNK_SIZES entry # v002.0011 changed
+COPY_NETWORK_TIMEOUT = 30.0                      # Network operation timeout in seconds (max wait for a pipelined read or write) # v002.0011 changed
+COPY_WORKER_COUNT = 8                            # Files copied concurrently by the copy scheduler (1 = sequential) # v002.0009 added
+COPY_MAX_WORKERS_PER_DEVICE_PAIR = 4             # Max concurrent copies between any one source/target device pair # v002.0009 added
+COPY_ENGINE_KERNEL_CHUNK_SIZE = (1024 * 1024) * 64   # Bytes per os.copy_file_range / os.sendfile call # v002.0010 added
+COPY_ENGINE_BUFFER_SIZE = (1024 * 1024) * 4          # Buffer for the readinto copy loop (used where zero-copy is unavailable, eg Windows) # v002.0010 added
+COPY_PREALLOCATE_THRESHOLD = (1024 * 1024) * 64      # Preallocate local targets of at least this size before copying (fails fast when out of space) # v002.0019 added
+COPY_DURABILITY_POLICY = "group"                     # When copies are fsynced: "none", "per_file" (each target and its folder) or "group" (batches, see below) # v002.0020 added
+COPY_DURABILITY_GROUP_FILES = 64                     # "group": fsync the pending files and their folders every this many files ...
+COPY_DURABILITY_GROUP_BYTES = (1024 * 1024) * 256    # ... or this many bytes, whichever comes first (and at the end of the operation)
+COPY_SCHEDULE_POLICY = "balanced"                    # Copy start order: "plan_order", "largest_first", "smallest_first" or "balanced" (largest and smallest alternately) # v002.0023 added
+COPY_SMALL_FILE_THRESHOLD = 1024 * 64                # DIRECT files up to this size are copied in batches per target folder (one read, one write, one timestamp call each) # v002.0022 added
+COPY_SMALL_FILE_BATCH_FILES = 256                    # Files per small-file batch (one pool task, one log line, one progress update); 1 disables batching # v002.0022 added
+COPY_PRESERVE_HARDLINKS = True                       # Copy each source hardlink group once and recreate its other selected members as hardlinks on the target # v002.0021 added
+# Copy bandwidth and IOPS throttling for shared storage (CopyRateLimiter_class), adjustable while copying from the progress dialog # v002.0024 added
+COPY_RATE_LIMIT_BYTES_PER_SECOND = 0                 # Bandwidth limit over all copy workers, 0 = unlimited (eg (1024 * 1024) * 50 for 50 MB/s)
+COPY_RATE_LIMIT_FILES_PER_SECOND = 0                 # Files started per second over all copy workers, 0 = unlimited
+COPY_RATE_LIMIT_BURST_SECONDS = 0.5                  # Token bucket size: up to this many seconds of unused allowance may be used at once
+COPY_RATE_LIMIT_RECHECK_SECONDS = 0.1                # Throttled workers recheck the limits at least this often (live changes apply within this)
+COPY_RATE_LIMIT_MIN_CHUNK_SIZE = 1024 * 64           # Smallest chunk the copy engine is cut to while bandwidth is limited (chunks are 0.1s of the limit)
+# Dry runs # v002.0026 added
+COPY_DRY_RUN_MODE = "plan"                           # "plan": report the copy plan from the comparison metadata (no file system access); "simulate": every file through the copy manager's dry run
+COPY_PLAN_FILE_ENABLED = True                        # "plan" dry runs also write the plan as JSON (foldercomparesync_plan_*.json beside the logs)
+COPY_PLAN_ESTIMATE_BYTES_PER_SECOND = (1024 * 1024) * 100   # Assumed bandwidth for the plan's estimated duration, until a copy of >= COPY_PLAN_ESTIMATE_MIN_BYTES has been timed
+COPY_PLAN_ESTIMATE_SECONDS_PER_FILE = 0.005          # Assumed per-file overhead (open, create, timestamps, log) on one worker
+COPY_PLAN_ESTIMATE_MIN_BYTES = (1024 * 1024) * 64    # Copies at least this large set the bandwidth used by later estimates
+# Copy telemetry # v002.0027 added
+COPY_TELEMETRY_ENABLED = True                        # Record per-file throughput and latency; writes foldercomparesync_copy_*_metrics.json beside each copy log
+COPY_TELEMETRY_EWMA_ALPHA = 0.2                      # Weight of each new file in the rolling throughput per device pair and strategy (higher = adapts faster)
+COPY_TELEMETRY_SIZE_BUCKETS = (4 * 1024, 64 * 1024, 1024 * 1024, (1024 * 1024) * 16, (1024 * 1024) * 256, (1024 * 1024 * 1024) * 4)  # File size histogram bucket bounds
+COPY_TELEMETRY_MIN_FIT_TASKS = 3                     # The ETA uses telemetry until this many tasks of the current copy have finished
+# Copy operation log (foldercomparesync_copy_*.log) # v002.0028 added
+COPY_LOG_ASYNC = True                                # Write the operation log from a background thread in batches (False: a plain FileHandler, written per line on the copying thread)
+COPY_LOG_BATCH_LINES = 256                           # Most lines the background writer formats and writes with one write
+COPY_LOG_FLUSH_INTERVAL_SECONDS = 1.0                # Lines reach the log file at most this long after being logged
+COPY_LOG_VERBOSITY = "detailed"                      # "detailed": every step of every file; "summary": one structured line per file (failed files keep their detail lines)
+# Pipelined (reader thread + writer) copy for high-latency drives, keyed by FileCopyManager_class.DriveType value # v002.0011 added
+COPY_PIPELINE_DRIVE_TYPES = ("network_mapped", "network_unc")   # Use the pipeline when the source or target is one of these
+COPY_PIPELINE_CHUNK_SIZES = {"network_mapped": (1024 * 1024) * 4, "network_unc": (1024 * 1024) * 4}  # Per drive type; others use COPY_CHUNK_SIZE
+COPY_PIPELINE_QUEUE_DEPTHS = {"network_mapped": 4, "network_unc": 4}   # Buffers in the ring per drive type; others use COPY_PIPELINE_DEFAULT_QUEUE_DEPTH
+COPY_PIPELINE_DEFAULT_QUEUE_DEPTH = 2                                  # Minimum 2 (one being read, one being written)
+# Delta (changed blocks only) update of large existing targets on local drives # v002.0014 added
+COPY_DELTA_THRESHOLD = (1024 * 1024 * 1024) * 1  # 1GB threshold for the DELTA strategy when the target already exists
+COPY_DELTA_BLOCK_SIZE = 1024 * 1024              # 1MB comparison blocks; a changed block is rewritten (and journaled) whole
+COPY_DELTA_BATCH_BLOCKS = 64                     # Blocks compared per batch; the undo journal is fsynced once per batch with changes
+COPY_DELTA_JOURNAL_SUFFIX = ".fcs_delta_journal" # Undo journal is "<target>.fcs_delta_journal"; one left by an interrupted update is replayed before the target is next copied
+# Resumable (chunk-journaled) copies of very large files # v002.0015 added
+COPY_RESUMABLE_THRESHOLD = (1024 * 1024 * 1024) * 4   # 4GB threshold for the RESUMABLE strategy (a DELTA update is preferred when the target exists locally)
+COPY_RESUMABLE_CHUNK_SIZE = (1024 * 1024) * 64         # Journaled chunk size: at most this much is copied again when resuming
+COPY_RESUMABLE_PARTIAL_SUFFIX = ".fcs_partial"         # Partial target file is "<target>.fcs_partial"
+COPY_RESUMABLE_JOURNAL_SUFFIX = ".journal"             # Its journal (JSON lines) is "<target>.fcs_partial.journal"
 
 # Performance and debug settings
 DEBUG_LOG_FREQUENCY = 100           # Log debug info every N items (avoid spam in large operations)
 TREE_UPDATE_BATCH_SIZE = 200000     # Process tree updates in batches of N items (used in sorting)
 MEMORY_EFFICIENT_THRESHOLD = 10000  # Switch to memory-efficient mode above N items
+DISPLAY_FORMAT_CACHE_SIZE = 262144  # LRU entries for each of the rendered timestamp and size caches used by tree rows # v002.0006 added
 
 # Tree column configuration (default widths)
 LEFT_SIDE_LOWERCASE = 'left'.lower()
@@ -40,7 +40,8 @@ import ctypes
 from ctypes import wintypes, Structure, c_char_p, c_int, c_void_p, POINTER, byref
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field # v002.0006 changed [field for non-compared per-record caches]
+import dataclasses # v002.0021 added [dataclasses.replace for frozen plan operations]
 from typing import Optional, Any, Union
 from typing import Final # If configured, Final can tell type checkers (like mypy, VS Code) that a name is meant to be constant (i.e. not reassigned, not overridden in subclasses). It does nothing at runtime.
 from enum import Enum
@@ -49,6 +50,11 @@ from enum import Enum
 #from tkinter import ttk, filedialog, messagebox
 #import tkinter.font as tkfont
 import threading
+import functools # v002.0006 added [lru_cache for display formatting]
+import queue # v002.0004 added [thread-safe UI event queue]
+import concurrent.futures # v002.0009 added [parallel copy worker pool]
+import contextlib # v002.0009 added [per-file buffered copy logging]
+import errno # v002.0010 added [copy engine fallbacks]
 import logging
 import traceback
 import gc # for python garbage collection of unused structures etc
@@ -57,6 +63,7 @@ import inspect
 import json
 import locale
 import math
+import bisect # v002.0007 added [sorted-index range lookups]
 from types import ModuleType
 
 # ---------- helpers for late/optional imports & exporting ----------
@@ -22,6 +22,15 @@ from FileCopyManager_class import FileCopyManager_class
 from DeleteOrphansManager_class import DeleteOrphansManager_class
 from DebugGlobalEditor_class import DebugGlobalEditor_class
 from FileTimestampManager_class import FileTimestampManager_class
+from UIEventQueue_class import UIEventQueue_class # v002.0004 added [coalescing UI event queue]
+from DisplayFormatter_class import DisplayFormatter_class # v002.0006 added [memoized size/timestamp formatting]
+from FilenameIndex_class import FilenameIndex_class # v002.0007 added [indexed instant filtering]
+from DifferenceIndex_class import DifferenceIndex_class # v002.0008 added [range-based difference selection]
+from CopyScheduler_class import CopyScheduler_class # v002.0009 added [parallel copy worker pool]
+from CopyPlan_class import CopyPlan_class # v002.0017 added [copy plan compiled from comparison results]
+from DriveClassifier_class import DriveClassifier_class # v002.0018 added [cached drive type and volume classification]
+from OperationControl_class import OperationControl_class # v002.0025 added [cancel/pause and checkpoints]
+from CopyRateLimiter_class import CopyRateLimiter_class # v002.0026 added [rate limits in the plan estimate]
 
 class FolderCompareSync_class:
     """
@@ -71,6 +80,8 @@ class FolderCompareSync_class:
         date_modified: Optional[datetime] = None
         sha512: Optional[str] = None
         exists: bool = True
+        display_values: Optional[tuple] = field(default=None, repr=False, compare=False) # v002.0006 added [rendered tree cells, memoized by DisplayFormatter_class]
+        link_key: Optional[tuple[int, int]] = field(default=None, repr=False, compare=False) # v002.0021 added [(st_dev, st_ino) of files with more than one hardlink]
         
         @classmethod
         def from_path(cls, path: str, compute_hash: bool = False):
@@ -84,6 +95,7 @@ class FolderCompareSync_class:
                 size = stat.st_size if p.is_file() else None
                 date_created = datetime.fromtimestamp(stat.st_ctime)
                 date_modified = datetime.fromtimestamp(stat.st_mtime)
+                link_key = (stat.st_dev, stat.st_ino) if size is not None and stat.st_nlink > 1 and stat.st_ino else None # v002.0021 added
                 
                 sha512 = None
                 if compute_hash and p.is_file() and size and size < C.SHA512_MAX_FILE_SIZE:  # Use configurable limit
@@ -105,7 +117,8 @@ class FolderCompareSync_class:
                     date_created=date_created,
                     date_modified=date_modified,
                     sha512=sha512,
-                    exists=True
+                    exists=True,
+                    link_key=link_key, # v002.0021 added
                 )
             except Exception:
                 return cls(path=path, name=p.name, is_folder=False, exists=False)
@@ -267,39 +280,8 @@ class FolderCompareSync_class:
         >>> format_timestamp(dt_with_tz, include_timezone=True)
         "2024-12-08 14:30:22.123456 UTC"
         """
-        if timestamp is None:
-            return ""
-        try:
-            # Convert input to datetime object
-            if isinstance(timestamp, datetime):
-                dt = timestamp
-            elif isinstance(timestamp, (int, float)):
-                # Convert epoch timestamp to datetime in local timezone
-                dt = datetime.fromtimestamp(timestamp)
-            else:
-                # Fallback for unexpected types
-                return str(timestamp)
-            
-            # Build format string based on options
-            if include_microseconds:
-                base_format = "%Y-%m-%d %H:%M:%S.%f"
-            else:
-                base_format = "%Y-%m-%d %H:%M:%S"
-            
-            # Format the datetime
-            formatted = dt.strftime(base_format)
-            
-            # Add timezone if requested and available
-            if include_timezone and dt.tzinfo is not None:
-                tz_name = dt.strftime("%Z")
-                if tz_name:  # Only add if timezone name is available
-                    formatted += f" {tz_name}"
-            
-            return formatted
-        except (ValueError, OSError, OverflowError) as e:
-            # Handle invalid timestamps gracefully
-            log_and_flush(logging.DEBUG, f"Invalid timestamp formatting: {timestamp} - {e}")
-            return f"Invalid timestamp: {timestamp}"
+        # v002.0006 changed [single cached implementation shared with the tree population code]
+        return DisplayFormatter_class.format_timestamp(timestamp, include_timezone=include_timezone, include_microseconds=include_microseconds)
     
     @staticmethod
     def format_size(size_bytes):
@@ -319,13 +301,7 @@ class FolderCompareSync_class:
         --------
         str: Formatted size string
         """
-        if size_bytes is None:
-            return ""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f}TB"
+        return DisplayFormatter_class.format_size(size_bytes) # v002.0006 changed [single cached implementation]
     
     def __init__(self):
         """Initialize the main application with all components and limits."""
@@ -409,12 +385,18 @@ class FolderCompareSync_class:
         self.compare_sha512 = tk.BooleanVar(value=False)
         self.overwrite_mode = tk.BooleanVar(value=True)
         self.dry_run_mode = tk.BooleanVar(value=False)
+        self.compare_criteria: dict[str, bool] = self.snapshot_compare_criteria() # v002.0004 added [plain-value criteria for worker threads]
         
         # Filtering state # v000.0002 changed - removed sorting
         self.filter_wildcard = tk.StringVar()
 
         self.filtered_results = {}  # Store filtered comparison results
         self.is_filtered = False
+        self.filename_index: Optional[FilenameIndex_class] = None  # Built once per comparison # v002.0007 added
+        self.difference_index: Optional[DifferenceIndex_class] = None  # Built once per comparison # v002.0008 added
+        self.filter_view_state: dict[str, tuple] = {}  # side -> (parents whose children were changed, folders opened) # v002.0007 added
+        self.tree_children_left: dict[str, list[str]] = {}  # tree_item_id -> child item ids in insertion order # v002.0007 added
+        self.tree_children_right: dict[str, list[str]] = {}  # v002.0007 added
         
         # Data storage for comparison results and selection state
         self.comparison_results: dict[str, FolderCompareSync_class.ComparisonResult_class] = {}
@@ -426,6 +408,8 @@ class FolderCompareSync_class:
         # Maps relative_path -> tree_item_id for efficient lookups
         self.path_to_item_left: dict[str, str] = {}  # rel_path -> tree_item_id
         self.path_to_item_right: dict[str, str] = {}  # rel_path -> tree_item_id
+        self.item_to_path_left: dict[str, str] = {}  # tree_item_id -> rel_path (reverse of path_to_item_left) # v002.0008 added
+        self.item_to_path_right: dict[str, str] = {}  # tree_item_id -> rel_path # v002.0008 added
         
         # Store root item IDs for special handling in selection logic
         self.root_item_left: Optional[str] = None
@@ -451,13 +435,23 @@ class FolderCompareSync_class:
         self.summary_var = tk.StringVar(value="Summary: No comparison performed")
         self.status_log_text = None  # Will be set in setup_ui
         
+        # Cross-thread UI event queue: worker threads post progress/status/calls, the Tk thread drains them # v002.0004 added [coalescing UI event queue]
+        self.ui_events = UIEventQueue_class(self.root, status_callback=self.add_status_messages) # v002.0004 added [coalescing UI event queue]
+
         # copy system with staged strategy and dry run support
-        self.copy_manager = FileCopyManager_class(status_callback=self.add_status_message)
+        # v002.0004 changed [copy manager status lines arrive from worker threads, so route them through the UI event queue]
+        self.copy_manager = FileCopyManager_class(status_callback=self.ui_events.post_status)
+        self.active_operation_control: Optional[OperationControl_class] = None  # control of the running copy, if any # v002.0025 added
+        self.quit_requested = False  # set when Quit is waiting for a cancelled copy to stop # v002.0025 added
+        self.observed_copy_bytes_per_second: Optional[float] = None  # from the last large copy, for dry run plan estimates # v002.0026 added
         
         if __debug__:
             log_and_flush(logging.DEBUG, "Application state initialized with dual copy system")
         
         self.setup_ui()
+
+        # Start draining worker-thread UI events on the Tk event loop # v002.0004 added [coalescing UI event queue]
+        self.ui_events.start() # v002.0004 added [coalescing UI event queue]
         
         # Add startup warnings about performance and limits
         self.add_status_message("Application initialized - dual copy system ready")
@@ -540,16 +534,34 @@ class FolderCompareSync_class:
         -----
         message: Message to add to status log
         """
+        self.add_status_messages([message]) # v002.0004 changed [single messages now share the batched path]
+
+    def add_status_messages(self, messages: list[str]): # v002.0004 added [batched status messages drained from UIEventQueue_class]
+        """
+        FolderCompareSync_class: Add a batch of timestamped messages to the status log with a single widget refresh.
+
+        Purpose:
+        --------
+        Worker threads post status lines through UIEventQueue_class, which delivers
+        them here in batches on the Tk thread, so a burst of messages costs one
+        text widget rewrite rather than one rewrite per message.
+
+        Args:
+        -----
+        messages: Messages to add to status log, in order
+        """
+        if not messages:
+            return
         timestamp = datetime.now().strftime("%H:%M:%S")
-        status_line = f"{timestamp} - {message}"
-        
+
         # Add to our internal list
-        self.status_log_lines.append(status_line)
-        
+        for message in messages:
+            self.status_log_lines.append(f"{timestamp} - {message}")
+
         # Trim to configurable maximum lines (5000)
         if len(self.status_log_lines) > self.max_status_lines:
             self.status_log_lines = self.status_log_lines[-self.max_status_lines:]
-            
+
         # Update the text widget if it exists
         if self.status_log_text:
             self.status_log_text.config(state=tk.NORMAL)
@@ -557,8 +569,9 @@ class FolderCompareSync_class:
             self.status_log_text.insert('1.0', '\n'.join(self.status_log_lines))
             self.status_log_text.config(state=tk.DISABLED)
             self.status_log_text.see(tk.END)  # Auto-scroll to bottom
-            
-        log_and_flush(logging.INFO, f"FolderCompareSync_class: POSTED STATUS MESSAGE: {message}")
+
+        for message in messages:
+            log_and_flush(logging.INFO, f"FolderCompareSync_class: POSTED STATUS MESSAGE: {message}")
 
     def export_status_log(self):
         """
@@ -925,6 +938,7 @@ class FolderCompareSync_class:
         # Copy buttons pair # v001.0022 added [copy buttons pair comment]
         ttk.Button(copy_frame, text="Copy LEFT to Right", command=self.copy_left_to_right, style="RedBold.TButton").pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(copy_frame, text="Copy RIGHT to Left", command=self.copy_right_to_left, style="LimeGreenBold.TButton").pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(copy_frame, text="Resume Copy...", command=self.resume_copy_from_checkpoint, style="DefaultNormal.TButton").pack(side=tk.LEFT, padx=(0, 10)) # v002.0025 added
         
         # Moderate gap between button pairs # v001.0022 added [moderate gap between copy and delete button pairs]
         separator_frame = ttk.Frame(copy_frame, width=20)
@@ -937,7 +951,8 @@ class FolderCompareSync_class:
                       command=self.delete_right_orphans_onclick, style="DarkGreenBold.TButton").pack(side=tk.LEFT, padx=(0, 10))
 
         # Quit button on far right
-        ttk.Button(copy_frame, text="Quit", command=self.root.quit, style="BlueBold.TButton").pack(side=tk.RIGHT)
+        ttk.Button(copy_frame, text="Quit", command=self.quit_application, style="BlueBold.TButton").pack(side=tk.RIGHT) # v002.0025 changed [cancel a running copy first]
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_application) # v002.0025 added
     
         # status log frame at bottom with export functionality
         status_log_frame = ttk.LabelFrame(main_frame, text="Status Log", padding=5)
@@ -1089,10 +1104,17 @@ class FolderCompareSync_class:
         # Clear data structures
         self.comparison_results.clear()
         self.filtered_results.clear()
+        self.filename_index = None # v002.0007 added
+        self.difference_index = None # v002.0008 added
+        self.filter_view_state.clear() # v002.0007 added
+        self.tree_children_left = {} # v002.0007 added
+        self.tree_children_right = {} # v002.0007 added
         self.selected_left.clear()
         self.selected_right.clear()
         self.path_to_item_left.clear()
         self.path_to_item_right.clear()
+        self.item_to_path_left.clear() # v002.0008 added
+        self.item_to_path_right.clear() # v002.0008 added
         
         # Reset state variables
         self.root_item_left = None
@@ -1102,7 +1124,7 @@ class FolderCompareSync_class:
         self.file_count_right = 0
         self.total_file_count = 0
 
-    def apply_filter(self):
+    def apply_filter(self): # v002.0007 changed [indexed matching and detach/reattach view, no worker thread or rebuild]
         """Apply wildcard filter to display only matching files with limit checking."""
         if self.limit_exceeded:
             messagebox.showwarning("Operation Disabled", "Filtering is disabled when file limits are exceeded.")
@@ -1121,74 +1143,56 @@ class FolderCompareSync_class:
         log_and_flush(logging.DEBUG, f"Applying wildcard filter: {wildcard}")
         self.add_status_message(f"Applying filter: {wildcard}")
         
-        # Create progress dialog for filtering
-        progress = ProgressDialog_class(self.root, "Filtering Files", f"Applying filter: {wildcard}...", max_value=100)
-        
         try:
-            # Use thread for filtering to keep UI responsive
-            def filter_thread():
-                try:
-                    self.perform_filtering(wildcard, progress)
-                except Exception as e:
-                    log_and_flush(logging.ERROR, f"Filter operation failed: {e}")
-                    self.root.after(0, lambda: self.add_status_message(f"Filter failed: {str(e)}"))
-                finally:
-                    self.root.after(0, progress.close)
-            
-            threading.Thread(target=filter_thread, daemon=True).start()
-            
+            self.perform_filtering(wildcard)
         except Exception as e:
-            progress.close()
-            log_and_flush(logging.ERROR, f"Failed to start filter operation: {e}")
+            log_and_flush(logging.ERROR, f"Filter operation failed: {e}")
             self.add_status_message(f"Filter failed: {str(e)}")
 
-    def perform_filtering(self, wildcard, progress):
-        """Perform the actual filtering operation with performance tracking."""
-        log_and_flush(logging.DEBUG, f"Performing filtering with pattern: {wildcard}")
+    def perform_filtering(self, wildcard): # v002.0007 changed [runs on the UI thread using FilenameIndex_class]
+        """
+        Perform the actual filtering operation with performance tracking.
         
-        progress.update_progress(10, "Preparing filter...")
+        Purpose:
+        --------
+        Matches the wildcard against the filename index built after comparison
+        (milliseconds, even for large trees), then switches both trees to the
+        filtered view by detaching non-matching rows rather than rebuilding.
+        """
+        log_and_flush(logging.DEBUG, f"Performing filtering with pattern: {wildcard}")
+        start_time = time.time()
         
         # Filter comparison results based on wildcard (files only, not folders)
-        self.filtered_results = {}
-        matched_count = 0
-        total_items = len(self.comparison_results)
-        
-        progress.update_progress(30, "Filtering files...")
-        
-        for rel_path, result in self.comparison_results.items():
-            if rel_path:  # Skip empty paths
-                filename = rel_path.split('/')[-1]  # Get just the filename
-                
-                # Only filter files, not folders
-                is_file = ((result.left_item and not result.left_item.is_folder) or 
-                          (result.right_item and not result.right_item.is_folder))
-                
-                if is_file and fnmatch.fnmatch(filename.lower(), wildcard.lower()):
-                    self.filtered_results[rel_path] = result
-                    matched_count += 1
-                    
-                    # Limit results for performance using configurable threshold
-                    if matched_count >= C.MAX_FILTER_RESULTS:
-                        log_and_flush(logging.WARNING, f"Filter results limited to {C.MAX_FILTER_RESULTS} items for performance")
-                        break
-        
-        progress.update_progress(70, f"Found {matched_count} matches, updating display...")
+        matched_paths = self.get_filename_index().match(wildcard, limit=C.MAX_FILTER_RESULTS)
+        self.filtered_results = {rel_path: self.comparison_results[rel_path] for rel_path in matched_paths}
+        matched_count = len(matched_paths)
+        if matched_count >= C.MAX_FILTER_RESULTS:
+            log_and_flush(logging.WARNING, f"Filter results limited to {C.MAX_FILTER_RESULTS} items for performance")
         
         # Update tree display with filtered results
         self.is_filtered = True
-        
-        # Rebuild trees with filtered results
-        self.root.after(0, lambda: self.update_comparison_ui_filtered())
+        self.update_comparison_ui_filtered()
         
         # Update status
-        filter_summary = f"Filter applied: {matched_count:,} files match '{wildcard}'"
+        elapsed_ms = (time.time() - start_time) * 1000
+        filter_summary = f"Filter applied: {matched_count:,} files match '{wildcard}' ({elapsed_ms:.0f} ms)"
         if matched_count >= C.MAX_FILTER_RESULTS:
             filter_summary += f" (limited to {C.MAX_FILTER_RESULTS:,} for performance)"
-        
-        progress.update_progress(100, "Filter complete")
-        self.root.after(0, lambda: self.add_status_message(filter_summary))
+        self.add_status_message(filter_summary)
+
+    def get_filename_index(self) -> FilenameIndex_class: # v002.0007 added [filename index built once per comparison]
+        """Return the filename index for the current comparison results, building it if needed."""
+        if self.filename_index is None:
+            self.filename_index = FilenameIndex_class(self.comparison_results)
+        return self.filename_index
 
-    def clear_filter(self):
+    def get_difference_index(self) -> DifferenceIndex_class: # v002.0008 added [difference index built once per comparison]
+        """Return the per-side difference index for the current comparison results, building it if needed."""
+        if self.difference_index is None:
+            self.difference_index = DifferenceIndex_class(self.comparison_results)
+        return self.difference_index
+
+    def clear_filter(self): # v002.0007 changed [reattach detached rows instead of rebuilding the trees]
         """Clear the wildcard filter and show all results with limit checking."""
         if self.limit_exceeded:
             messagebox.showwarning("Operation Disabled", "Filter operations are disabled when file limits are exceeded.")
@@ -1202,9 +1206,78 @@ class FolderCompareSync_class:
         
         self.add_status_message("Filter cleared - showing all results")
         
-        # Rebuild trees with all results
+        # Reattach all rows hidden by the filter
         if self.comparison_results:
-            self.update_comparison_ui()
+            self.restore_full_tree_view(C.LEFT_SIDE_LOWERCASE)
+            self.restore_full_tree_view(C.RIGHT_SIDE_LOWERCASE)
+            self.status_var.set("Ready")
+            self.update_summary()
+
+    def apply_filtered_tree_view(self, side: str, visible_paths: set[str]): # v002.0007 added [filtered view by detaching rows]
+        """
+        Show only the rows for visible_paths (and the root) in one tree, by detaching the others.
+        
+        Purpose:
+        --------
+        Uses the per-parent child lists recorded by populate_tree, so rows are detached and
+        later reattached in their original order; nothing is deleted or re-inserted. Only
+        visible folders are visited: a hidden folder is detached as a whole. Visible folders
+        are opened so the matches can be seen, and are closed again when the filter is cleared.
+        
+        Args:
+        -----
+        side: Which tree side (LEFT_SIDE_LOWERCASE or RIGHT_SIDE_LOWERCASE)
+        visible_paths: rel_paths to keep visible, including all their ancestor folders
+        """
+        self.restore_full_tree_view(side)
+        
+        is_left = side.lower() == C.LEFT_SIDE_LOWERCASE
+        tree = self.left_tree if is_left else self.right_tree
+        path_map = self.path_to_item_left if is_left else self.path_to_item_right
+        children_map = self.tree_children_left if is_left else self.tree_children_right
+        root_item = self.root_item_left if is_left else self.root_item_right
+        if root_item is None:
+            return
+        
+        visible_items = {path_map[rel_path] for rel_path in visible_paths if rel_path in path_map}
+        modified_parents = []
+        opened_items = []
+        
+        stack = [root_item]
+        while stack:
+            parent = stack.pop()
+            children = children_map.get(parent, ())
+            visible_children = [child for child in children if child in visible_items]
+            if len(visible_children) != len(children):
+                tree.set_children(parent, *visible_children)
+                modified_parents.append(parent)
+            for child in visible_children:
+                if children_map.get(child):
+                    if not tree.item(child, 'open'):
+                        tree.item(child, open=True)
+                        opened_items.append(child)
+                    stack.append(child)
+        
+        self.filter_view_state[side.lower()] = (modified_parents, opened_items)
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"Filtered {side} tree view: {len(visible_items):,} rows visible, {len(modified_parents):,} parents changed")
+
+    def restore_full_tree_view(self, side: str): # v002.0007 added [undo apply_filtered_tree_view]
+        """Reattach all rows detached by apply_filtered_tree_view and re-close folders it opened."""
+        modified_parents, opened_items = self.filter_view_state.pop(side.lower(), ((), ()))
+        if not modified_parents and not opened_items:
+            return
+        is_left = side.lower() == C.LEFT_SIDE_LOWERCASE
+        tree = self.left_tree if is_left else self.right_tree
+        children_map = self.tree_children_left if is_left else self.tree_children_right
+        try:
+            for parent in modified_parents:
+                tree.set_children(parent, *children_map.get(parent, ()))
+            for item in opened_items:
+                tree.item(item, open=False)
+        except tk.TclError as e:
+            # Tree was rebuilt since the filter was applied - nothing to restore
+            log_and_flush(logging.DEBUG, f"restore_full_tree_view({side}): {e}")
 
     def expand_all_trees(self):
         """Expand all items in both trees with limit checking."""
@@ -1404,7 +1477,7 @@ class FolderCompareSync_class:
         Purpose:
         --------
         More efficient than reconstructing from tree hierarchy,
-        provides fast lookup for tree item paths.
+        provides O(1) lookup for tree item paths via the reverse mapping.
         
         Args:
         -----
@@ -1415,14 +1488,9 @@ class FolderCompareSync_class:
         --------
         str: Relative path or None if not found
         """
-        path_map = self.path_to_item_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.path_to_item_right
-        
-        # Find the relative path by searching the mapping
-        for rel_path, mapped_item_id in path_map.items():
-            if mapped_item_id == item_id:
-                return rel_path
-                
-        return None
+        # v002.0008 changed [reverse mapping lookup instead of scanning path_to_item]
+        item_map = self.item_to_path_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.item_to_path_right
+        return item_map.get(item_id)
                 
     def handle_tree_click(self, tree, side, event):
         """
@@ -1500,42 +1568,53 @@ class FolderCompareSync_class:
         child items that have actual differences requiring synchronization.
         """
         selected_set = self.selected_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.selected_right
-        tree = self.left_tree if side.lower() == C.LEFT_SIDE_LOWERCASE else self.right_tree
         
         if __debug__:
             log_and_flush(logging.DEBUG, f"Smart ticking children for {item_id} - only selecting different items")
         
-        different_count = 0
-        total_count = 0
-        
-        def tick_recursive(item):
-            nonlocal different_count, total_count
-            total_count += 1
-            
-            # Only tick if item is not missing AND is different
-            if not self.is_missing_item(tree, item) and self.is_different_item(item, side):
-                selected_set.add(item)
-                different_count += 1
-                if __debug__:
-                    rel_path = self.get_item_relative_path(item, side)
-                    log_and_flush(logging.DEBUG, f"Smart-selected different item: {item} ({rel_path})")
-                    
-            # Recursively process children
-            for child in tree.get_children(item):
-                tick_recursive(child)
-                
-        # Process all children of the ticked item
-        for child in tree.get_children(item_id):
-            tick_recursive(child)
+        # v002.0008 changed [range lookup in the difference index instead of walking and testing every descendant]
+        folder_rel_path = self.get_item_relative_path(item_id, side)
+        if folder_rel_path is None:
+            return
+        different_items = self.get_difference_items(side, folder_rel_path)
+        selected_set.update(different_items)
+        different_count = len(different_items)
             
         if __debug__:
-            log_and_flush(logging.DEBUG, f"Smart selection complete: {different_count}/{total_count} children selected (only different items)")
+            log_and_flush(logging.DEBUG, f"Smart selection complete: {different_count} children selected (only different items)")
             
         # Log smart selection results
         if different_count > 0:
-            folder_path = self.get_item_relative_path(item_id, side) or "folder"
+            folder_path = folder_rel_path or "folder"
             self.add_status_message(f"Smart-selected {different_count} different items in {folder_path} ({side})")
             
+    def get_difference_items(self, side, folder_rel_path=''): # v002.0008 added
+        """
+        Tree item IDs of the different items existing on a side, below a folder.
+        
+        Purpose:
+        --------
+        Range lookup in the difference index used by smart ticking and "Select All
+        Differences". When a filter is active only filter matches are returned, the
+        same items that are visible (and tickable) in the filtered view.
+        
+        Args:
+        -----
+        side: Which tree side (LEFT_SIDE_LOWERCASE or RIGHT_SIDE_LOWERCASE)
+        folder_rel_path: Folder relative path, '' for everything
+        
+        Returns:
+        --------
+        list[str]: Tree item IDs
+        """
+        path_map = self.path_to_item_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.path_to_item_right
+        rel_paths = self.get_difference_index().paths_under(side, folder_rel_path)
+        if self.is_filtered:
+            filtered = self.filtered_results
+            rel_paths = [rel_path for rel_path in rel_paths if rel_path in filtered]
+        item_ids = map(path_map.get, rel_paths)
+        return [item_id for item_id in item_ids if item_id]
+            
     def untick_children(self, item_id, side):
         """Untick all children of an item recursively."""
         selected_set = self.selected_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.selected_right
@@ -1718,44 +1797,106 @@ class FolderCompareSync_class:
         self.status_var.set("Comparing folders...")
         self.add_status_message("Starting fresh folder comparison...") # v000.0002 changed - removed sorting
         log_and_flush(logging.INFO, "Starting background comparison thread with reset state")
-        threading.Thread(target=self.perform_comparison, daemon=True).start()
+        self.start_comparison_thread() # v002.0004 changed [progress dialog is now created on the UI thread]
 
-    def perform_comparison(self):
+    def snapshot_compare_criteria(self) -> dict[str, bool]: # v002.0004 added [read Tk variables once on the UI thread]
         """
-        Perform the actual folder comparison with progress tracking and limit checking.
-        
+        Capture the comparison criteria checkboxes as plain values on the UI thread.
+
         Purpose:
         --------
-        Orchestrates the complete comparison process including scanning, comparison,
-        and UI updates while enforcing file count limits for performance management.
+        Tk variables must only be read on the Tk thread, so the comparison worker
+        uses this snapshot instead of calling BooleanVar.get() for every item.
+
+        Returns:
+        --------
+        dict[str, bool]: criteria name -> enabled
+        """
+        return {
+            'existence': self.compare_existence.get(),
+            'size': self.compare_size.get(),
+            'date_created': self.compare_date_created.get(),
+            'date_modified': self.compare_date_modified.get(),
+            'sha512': self.compare_sha512.get(),
+        }
+
+    def start_comparison_thread(self): # v002.0004 added [create progress dialog on UI thread, then start the worker]
         """
-        log_and_flush(logging.DEBUG, f"Entered FolderCompareSync_class: perform_comparison")
+        Create the comparison progress dialog on the UI thread and start perform_comparison in a worker thread.
 
+        Purpose:
+        --------
+        Tk widgets must be created and updated on the Tk thread. The worker only
+        posts progress, status lines and completion calls through self.ui_events.
+        """
         # v001.0021 added [check if UI is being recreated to prevent threading issues]
-        if hasattr(self, '_ui_recreating') and self._ui_recreating:
+        if getattr(self, '_ui_recreating', False):
             log_and_flush(logging.WARNING, "Comparison aborted - UI is being recreated")
             return
-            
-        start_time = time.time()
-        log_and_flush(logging.INFO, "Beginning folder comparison operation")
-        
+
+        self.compare_criteria = self.snapshot_compare_criteria()
+        left_folder = self.left_folder.get()    # Tk variables are only read here, on the UI thread # v002.0004 changed
+        right_folder = self.right_folder.get()
+
         # Create progress dialog for the overall comparison process
         progress = ProgressDialog_class(
             self.root, 
             "Comparing Folders", 
             "Preparing comparison...",
-            max_value=100  # We'll estimate progress as percentage
+            max_value=100,  # We'll estimate progress as percentage
+            rate_units=None # v002.0005 added [value is a percentage, so show ETA only]
         )
+        threading.Thread(target=self.perform_comparison, args=(progress, left_folder, right_folder), daemon=True).start()
+
+    def check_file_limit_exceeded_from_worker(self, file_count: int, operation_name: str) -> bool: # v002.0004 added [worker-safe limit check]
+        """
+        Worker-thread variant of check_file_limit_exceeded which defers all UI work to the Tk thread.
+
+        Returns:
+        --------
+        bool: True if limit exceeded, False if within limits
+        """
+        if file_count > C.MAX_FILES_FOLDERS:
+            self.limit_exceeded = True
+            self.ui_events.post_call(lambda: self.check_file_limit_exceeded(file_count, operation_name))
+            return True
+        return False
+
+    def perform_comparison(self, progress: ProgressDialog_class, left_folder: str, right_folder: str): # v002.0004 changed [progress dialog and folder paths come from start_comparison_thread on the UI thread]
+        """
+        Perform the actual folder comparison with progress tracking and limit checking.
+        
+        Purpose:
+        --------
+        Orchestrates the complete comparison process including scanning, comparison,
+        and UI updates while enforcing file count limits for performance management.
+        Runs in a worker thread: all UI interaction goes through self.ui_events. # v002.0004 added
+
+        Args:
+        -----
+        progress: Progress dialog created on the UI thread by start_comparison_thread
+        left_folder: Left folder path, read from its Tk variable by start_comparison_thread
+        right_folder: Right folder path, read from its Tk variable by start_comparison_thread
+        """
+        log_and_flush(logging.DEBUG, f"Entered FolderCompareSync_class: perform_comparison")
+            
+        start_time = time.time()
+        log_and_flush(logging.INFO, "Beginning folder comparison operation")
+        ui = self.ui_events # v002.0004 added [coalescing UI event queue]
         
         try:
             # Clear previous results and reset state
             self.comparison_results.clear()
             self.filtered_results.clear()
+            self.filename_index = None # v002.0007 added
+            self.difference_index = None # v002.0008 added
             self.is_filtered = False
             self.selected_left.clear()
             self.selected_right.clear()
             self.path_to_item_left.clear()
             self.path_to_item_right.clear()
+            self.item_to_path_left.clear() # v002.0008 added
+            self.item_to_path_right.clear() # v002.0008 added
             self.root_item_left = None
             self.root_item_right = None
             self.file_count_left = 0
@@ -1765,11 +1906,19 @@ class FolderCompareSync_class:
             if __debug__:
                 log_and_flush(logging.DEBUG, "Cleared previous comparison results and reset root items")
             
+            # Classify both folders' volumes afresh; the cache is shared with the copy planner and scheduler # v002.0018 added
+            drive_classifier = DriveClassifier_class.shared()
+            drive_classifier.clear()
+            for side_name, folder in ((C.LEFT_SIDE_UPPERCASE, left_folder), (C.RIGHT_SIDE_UPPERCASE, right_folder)):
+                volume_info = drive_classifier.classify(folder)
+                fs_text = f", {volume_info.fs_type}" if volume_info.fs_type else ""
+                log_and_flush(logging.INFO, f"{side_name} folder is on volume {volume_info.volume or '?'} ({volume_info.drive_type}{fs_text})")
+            
             # Step 1: Build file lists for both folders (40% of total work) with early limit checking
-            progress.update_progress(5, "Scanning left folder...")
-            self.root.after(0, lambda: self.add_status_message("Scanning left folder for files and folders..."))
+            ui.post_progress(progress, 5, "Scanning left folder...") # v002.0004 changed [post via UI event queue]
+            ui.post_status("Scanning left folder for files and folders...")
             
-            left_files = self.build_file_list_with_progress(self.left_folder.get(), progress, 5, 25)
+            left_files = self.build_file_list_with_progress(left_folder, progress, 5, 25)
             
             if left_files is None:  # Limit exceeded during left scan
                 return
@@ -1777,13 +1926,13 @@ class FolderCompareSync_class:
             file_count_left = len(left_files)
             self.file_count_left = file_count_left
             
-            self.root.after(0, lambda: self.add_status_message(f"Left folder scan complete: {file_count_left:,} items found"))
+            ui.post_status(f"Left folder scan complete: {file_count_left:,} items found")
             log_and_flush(logging.INFO, f"Found {file_count_left} items in left folder")
             
-            progress.update_progress(30, "Scanning right folder...")
-            self.root.after(0, lambda: self.add_status_message("Scanning right folder for files and folders..."))
+            ui.post_progress(progress, 30, "Scanning right folder...")
+            ui.post_status("Scanning right folder for files and folders...")
             
-            right_files = self.build_file_list_with_progress(self.right_folder.get(), progress, 30, 50)
+            right_files = self.build_file_list_with_progress(right_folder, progress, 30, 50)
             
             if right_files is None:  # Limit exceeded during right scan
                 return
@@ -1793,15 +1942,15 @@ class FolderCompareSync_class:
             
             # Check combined file count limit
             self.total_file_count = file_count_left + file_count_right
-            if self.check_file_limit_exceeded(self.total_file_count, "combined folders"):
+            if self.check_file_limit_exceeded_from_worker(self.total_file_count, "combined folders"): # v002.0004 changed [worker-safe limit check]
                 return
             
-            self.root.after(0, lambda: self.add_status_message(f"Right folder scan complete: {file_count_right:,} items found"))
+            ui.post_status(f"Right folder scan complete: {file_count_right:,} items found")
             log_and_flush(logging.INFO, f"Found {file_count_right} items in right folder")
             
             # Step 2: Compare files (50% of total work)
-            progress.update_progress(50, "Comparing files and folders...")
-            self.root.after(0, lambda: self.add_status_message("Comparing files and folders for differences..."))
+            ui.post_progress(progress, 50, "Comparing files and folders...")
+            ui.post_status("Comparing files and folders for differences...")
             
             # Get all unique relative paths
             all_paths = set(left_files.keys()) | set(right_files.keys())
@@ -1819,7 +1968,7 @@ class FolderCompareSync_class:
                 # Update progress using configurable frequency settings
                 if i % max(1, total_paths // C.PROGRESS_PERCENTAGE_FREQUENCY) == 0 or i % C.COMPARISON_PROGRESS_BATCH == 0:
                     comparison_progress = 50 + int((i / total_paths) * 40)  # 40% of work for comparison
-                    progress.update_progress(comparison_progress, f"Comparing... {i+1:,} of {total_paths:,}")
+                    ui.post_progress(progress, comparison_progress, f"Comparing... {i+1:,} of {total_paths:,}")
                 
                 left_item = left_files.get(rel_path)
                 right_item = right_files.get(rel_path)
@@ -1837,25 +1986,26 @@ class FolderCompareSync_class:
                     if __debug__:
                         log_and_flush(logging.DEBUG, f"Difference found in '{rel_path}': {differences}")
             
+            # Build the filename index once, here in the worker, so filtering is instant # v002.0007 added
+            self.filename_index = FilenameIndex_class(self.comparison_results)
+            # Likewise the per-side difference index, so selecting differences and ticking folders are range lookups # v002.0008 added
+            self.difference_index = DifferenceIndex_class(self.comparison_results)
+            
             # Step 3: Update UI (10% of total work)
-            progress.update_progress(90, "Building comparison trees...")
-            self.root.after(0, lambda: self.add_status_message("Building comparison tree views..."))
+            ui.post_progress(progress, 90, "Building comparison trees...")
+            ui.post_status("Building comparison tree views...")
             
             elapsed_time = time.time() - start_time
             log_and_flush(logging.INFO, f"Comparison completed in {elapsed_time:.2f} seconds")
             log_and_flush(logging.INFO, f"Found {differences_found} items with differences")
             
             # Update UI in main thread
-            progress.update_progress(100, "Finalizing...")
-            self.root.after(0, self.update_comparison_ui)
+            ui.post_progress(progress, 100, "Finalizing...")
+            ui.post_call(self.update_comparison_ui)
             
             # Add completion status message with file counts
-            self.root.after(0, lambda: self.add_status_message(
-                f"Comparison complete: {differences_found:,} differences found in {elapsed_time:.1f} seconds"
-            ))
-            self.root.after(0, lambda: self.add_status_message(
-                f"Total files processed: {self.total_file_count:,} (Left: {self.file_count_left:,}, Right: {self.file_count_right:,})"
-            ))
+            ui.post_status(f"Comparison complete: {differences_found:,} differences found in {elapsed_time:.1f} seconds")
+            ui.post_status(f"Total files processed: {self.total_file_count:,} (Left: {self.file_count_left:,}, Right: {self.file_count_right:,})")
             
         except Exception as e:
             log_and_flush(logging.ERROR, f"Comparison failed with exception: {type(e).__name__}: {str(e)}")
@@ -1864,11 +2014,11 @@ class FolderCompareSync_class:
                 log_and_flush(logging.DEBUG, traceback.format_exc())
             
             error_msg = f"Comparison failed: {str(e)}"
-            self.root.after(0, lambda: self.add_status_message(f"Error: {error_msg}"))
-            self.root.after(0, lambda: self.show_error(error_msg))
+            ui.post_status(f"Error: {error_msg}")
+            ui.post_call(lambda: self.show_error(error_msg))
         finally:
-            # Always close the progress dialog
-            progress.close()
+            # Always close the progress dialog (on the UI thread) # v002.0004 changed
+            ui.post_close(progress)
         log_and_flush(logging.DEBUG, f"Exiting FolderCompareSync_class: perform_comparison")
             
     def build_file_list_with_progress(self, root_path: str, progress: ProgressDialog_class, 
@@ -1899,6 +2049,7 @@ class FolderCompareSync_class:
         
         files = {}
         root = Path(root_path)
+        compare_sha512 = self.compare_criteria['sha512'] # v002.0004 added [criteria snapshot taken on the UI thread]
         file_count = 0
         dir_count = 0
         error_count = 0
@@ -1926,13 +2077,13 @@ class FolderCompareSync_class:
                     # Early limit checking during scanning
                     if items_processed > C.MAX_FILES_FOLDERS:
                         folder_name = os.path.basename(root_path)
-                        if self.check_file_limit_exceeded(items_processed, f"'{folder_name}' folder"):
+                        if self.check_file_limit_exceeded_from_worker(items_processed, f"'{folder_name}' folder"): # v002.0004 changed [worker-safe limit check]
                             return None  # Return None to indicate limit exceeded
                     
                     # Update progress using configurable intervals for optimal performance
                     if items_processed % max(1, min(C.SCAN_PROGRESS_UPDATE_INTERVAL, total_items // 20)) == 0:
                         current_percent = start_percent + int(((items_processed / total_items) * (end_percent - start_percent)))
-                        progress.update_progress(current_percent, f"Scanning... {items_processed:,} items found")
+                        self.ui_events.post_progress(progress, current_percent, f"Scanning... {items_processed:,} items found") # v002.0004 changed [post via UI event queue]
                     
                     rel_path = path.relative_to(root).as_posix()
                     
@@ -1946,7 +2097,7 @@ class FolderCompareSync_class:
 					#                   Put compute_sha512_with_progress() underneath this def at the same level
 					#                   
                     sha512_hash = None
-                    if self.compare_sha512.get() and path.is_file():
+                    if compare_sha512 and path.is_file(): # v002.0004 changed [criteria snapshot taken on the UI thread]
                         try:
                             size = path.stat().st_size
                             if size > C.SHA512_STATUS_MESSAGE_THRESHOLD:
@@ -1998,7 +2149,7 @@ class FolderCompareSync_class:
                             # Check limit for directories too
                             if len(files) > C.MAX_FILES_FOLDERS:
                                 folder_name = os.path.basename(root_path)
-                                if self.check_file_limit_exceeded(len(files), f"'{folder_name}' folder"):
+                                if self.check_file_limit_exceeded_from_worker(len(files), f"'{folder_name}' folder"): # v002.0004 changed [worker-safe limit check]
                                     return None
                                     
                 except Exception as e:
@@ -2061,7 +2212,7 @@ class FolderCompareSync_class:
             # v000.0004 Show initial progress message for large files
             if size > C.SHA512_STATUS_MESSAGE_THRESHOLD:
                 size_mb = size / (1024 * 1024)
-                progress_dialog.update_message(f"Computing SHA512 for {path.name} ({size_mb} MB)...\n(computed 0 MB of {size_mb} MB)")
+                self.ui_events.post_progress(progress_dialog, message=f"Computing SHA512 for {path.name} ({size_mb} MB)...\n(computed 0 MB of {size_mb} MB)") # v002.0004 changed [post via UI event queue]
             
             with open(file_path, 'rb') as f:
                 for chunk in iter(lambda: f.read(8 * 1024 * 1024), b''):  # v000.0004 8MB chunks
@@ -2074,7 +2225,7 @@ class FolderCompareSync_class:
                         if chunk_count % 6 == 0 or bytes_processed >= size:  # Update every ~50MB
                             processed_mb = bytes_processed / (1024 * 1024)
                             total_mb = size / (1024 * 1024)
-                            progress_dialog.update_message(f"Computing SHA512 for {path.name} ({total_mb:.1f} MB)...\n(computed {processed_mb} MB of {total_mb} MB)")
+                            self.ui_events.post_progress(progress_dialog, message=f"Computing SHA512 for {path.name} ({total_mb:.1f} MB)...\n(computed {processed_mb} MB of {total_mb} MB)") # v002.0004 changed [post via UI event queue]
             
             return hasher.hexdigest() # v000.0004
             
@@ -2105,9 +2256,10 @@ class FolderCompareSync_class:
         set[str]: Set of difference types found
         """
         differences = set()
+        criteria = self.compare_criteria # v002.0004 added [criteria snapshot taken on the UI thread]
         
         # Check existence
-        if self.compare_existence.get():
+        if criteria['existence']:
             if (left_item is None) != (right_item is None):
                 differences.add('existence')
             elif left_item and right_item and (not left_item.exists or not right_item.exists):
@@ -2116,21 +2268,21 @@ class FolderCompareSync_class:
         # If both items exist, compare other attributes
         if left_item and right_item and left_item.exists and right_item.exists:
             # size comparison
-            if self.compare_size.get() and left_item.size != right_item.size:
+            if criteria['size'] and left_item.size != right_item.size:
                 differences.add('size')
                 
             # v002.0002 enhanced date_created timestamp comparison with configurable tolerance
-            if self.compare_date_created.get(): # if the optional date_created tickbox is ticked
+            if criteria['date_created']: # if the optional date_created tickbox is ticked
                 if self._timestamps_differ(left_item.date_created, right_item.date_created, C.TIMESTAMP_TOLERANCE, 'date_created'):
                     differences.add('date_created')
                     
             # v002.0002 enhanced date_modified timestamp comparison with configurable tolerance
-            if self.compare_date_modified.get(): # if the optional date_modified tickbox is ticked
+            if criteria['date_modified']: # if the optional date_modified tickbox is ticked
                 if self._timestamps_differ(left_item.date_modified, right_item.date_modified, C.TIMESTAMP_TOLERANCE, 'date_modified'):
                     differences.add('date_modified')
 
             # content sha512 comparison
-            if (self.compare_sha512.get() and left_item.sha512 and right_item.sha512 
+            if (criteria['sha512'] and left_item.sha512 and right_item.sha512 
                 and left_item.sha512 != right_item.sha512):
                 differences.add('sha512')
                 
@@ -2213,6 +2365,9 @@ class FolderCompareSync_class:
             
         log_and_flush(logging.INFO, "Updating UI with comparison results")
         
+        # Any filtered view refers to the rows about to be deleted # v002.0007 added
+        self.filter_view_state.clear()
+        
         # Clear existing tree content
         left_items = len(self.left_tree.get_children())
         right_items = len(self.right_tree.get_children())
@@ -2231,12 +2386,15 @@ class FolderCompareSync_class:
                                               
          
         
+        if __debug__:
+            log_and_flush(logging.DEBUG, f"Display formatting: {DisplayFormatter_class.cache_info()}") # v002.0006 added
+
         # Update status
         self.status_var.set("Ready")
         self.update_summary()
         log_and_flush(logging.INFO, "UI update completed")
 
-    def update_comparison_ui_filtered(self): # v000.0002 changed - removed sorting parameters
+    def update_comparison_ui_filtered(self): # v002.0007 changed [detach non-matching rows instead of rebuilding the trees]
         """Update UI with filtered comparison results and limit checking (no sorting)."""
         if self.limit_exceeded:
             log_and_flush(logging.WARNING, "Skipping filtered UI update due to file limit exceeded")
@@ -2244,124 +2402,32 @@ class FolderCompareSync_class:
             
         log_and_flush(logging.INFO, "Updating UI with filtered comparison results")
         
-        # Clear existing tree content
-        for item in self.left_tree.get_children():
-            self.left_tree.delete(item)
-        for item in self.right_tree.get_children():
-            self.right_tree.delete(item)
-            
-        # Build tree structure with filtered results # v000.0002 changed - removed sorting
-        self.build_trees_with_filtered_results() # v000.0002 changed - removed sorting
+        # The filtered view is a view over the full trees, so make sure they are built
+        # (eg after the UI is recreated by the debug global editor)
+        if self.root_item_left is None or not self.left_tree.exists(self.root_item_left):
+            self.update_comparison_ui()
+        
+        # Visible rows: the matching files plus all their ancestor folders, using the
+        # same rel_paths on both sides so left/right rows stay in correspondence
+        visible_paths = {''}
+        for rel_path in self.filtered_results:
+            visible_paths.add(rel_path)
+            slash = rel_path.rfind('/')
+            while slash > 0:
+                ancestor = rel_path[:slash]
+                if ancestor in visible_paths:
+                    break
+                visible_paths.add(ancestor)
+                slash = rel_path.rfind('/', 0, slash)
+        
+        self.apply_filtered_tree_view(C.LEFT_SIDE_LOWERCASE, visible_paths)
+        self.apply_filtered_tree_view(C.RIGHT_SIDE_LOWERCASE, visible_paths)
         
         # Update status
         self.status_var.set("Ready (Filtered)")
         self.update_summary()
         log_and_flush(logging.INFO, "Filtered UI update completed")
 
-    def build_trees_with_filtered_results(self):
-        """Build tree structures from filtered comparison results with limit checking (no sorting)."""
-        if self.limit_exceeded:
-            return
-            
-        if __debug__:
-            log_and_flush(logging.DEBUG, f"Building trees from {len(self.filtered_results)} filtered results")
-        
-        # Use filtered results instead of full results
-        results_to_use = self.filtered_results
-        
-        # Create root items with fully qualified paths and functional checkboxes
-        left_root_path = self.left_folder.get()
-        right_root_path = self.right_folder.get()
-        
-        # Insert root items as top-level entries with checkboxes
-        left_root_text = f"☐ {left_root_path}"
-        right_root_text = f"☐ {right_root_path}"
-        
-        self.root_item_left = self.left_tree.insert('', tk.END, text=left_root_text, open=True,
-                                                   values=("", "", "", "", "Root"))
-        self.root_item_right = self.right_tree.insert('', tk.END, text=right_root_text, open=True,
-                                                     values=("", "", "", "", "Root"))
-        
-        # Store root path mappings for selection system
-        self.path_to_item_left[''] = self.root_item_left  # Empty path represents root
-        self.path_to_item_right[''] = self.root_item_right
-        
-        # For filtered results, show a flattened view under each root # v000.0002 changed - removed sorting
-        for rel_path, result in results_to_use.items(): # v000.0002 changed - removed sorting
-            if not rel_path:
-                continue
-                
-            # Add left item if it exists
-            if result.left_item and result.left_item.exists:
-                # v000.0006 ---------- START CODE BLOCK - facilitate folder timestamp and smart status display
-                # v000.0006 added - Handle folder vs file display with timestamps
-                if result.left_item.is_folder:
-                    # This is a folder - show timestamps and smart status
-                    date_created_str = self.format_timestamp(result.left_item.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    date_modified_str = self.format_timestamp(result.left_item.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    sha512_str = ""  # Folders never have SHA512
-                    
-                    # Determine smart status for folders
-                    if result.is_different and result.differences:
-                        # Check if folder is different ONLY due to timestamps
-                        timestamp_only_differences = {'date_created', 'date_modified'}
-                        if result.differences.issubset(timestamp_only_differences):
-                            status = "Folder (timestamp)"
-                        else:
-                            status = "Folder"
-                    else:
-                        status = "Folder"
-                    item_text = f"☐ {rel_path}/"  # Add folder indicator
-                else:
-                    # v000.0006 ---------- END CODE BLOCK - facilitate folder timestamp and smart status display
-                    # This is a file - show all metadata as before
-                    date_created_str = self.format_timestamp(result.left_item.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    date_modified_str = self.format_timestamp(result.left_item.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    sha512_str = result.left_item.sha512[:16] + "..." if result.left_item.sha512 else ""
-                    status = "Different" if result.is_different else "Same"
-                    item_text = f"☐ {rel_path}"
-                
-                # v000.0004 changed - Use folder-aware display values
-                size_str = self.format_size(result.left_item.size) if result.left_item.size else ""
-                item_id = self.left_tree.insert(self.root_item_left, tk.END, text=item_text,
-                                              values=(size_str, date_created_str, date_modified_str, sha512_str, status))
-                self.path_to_item_left[rel_path] = item_id
-                
-            # Add right item if it exists
-            if result.right_item and result.right_item.exists:
-                # v000.0006 added - Handle folder vs file display with timestamps
-                if result.right_item.is_folder:
-                    # This is a folder - show timestamps and smart status
-                    date_created_str = self.format_timestamp(result.right_item.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    date_modified_str = self.format_timestamp(result.right_item.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    sha512_str = ""  # Folders never have SHA512
-                    
-                    # Determine smart status for folders
-                    if result.is_different and result.differences:
-                        # Check if folder is different ONLY due to timestamps
-                        timestamp_only_differences = {'date_created', 'date_modified'}
-                        if result.differences.issubset(timestamp_only_differences):
-                            status = "Folder (timestamp)"
-                        else:
-                            status = "Folder"
-                    else:
-                        status = "Folder"
-                    item_text = f"☐ {rel_path}/"  # Add folder indicator
-                else:
-                    # This is a file - show all metadata as before
-                    # v000.0006 ---------- END CODE BLOCK - facilitate folder timestamp and smart status display
-                    date_created_str = self.format_timestamp(result.right_item.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    date_modified_str = self.format_timestamp(result.right_item.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    sha512_str = result.right_item.sha512[:16] + "..." if result.right_item.sha512 else ""
-                    status = "Different" if result.is_different else "Same"
-                    item_text = f"☐ {rel_path}"
-                
-                # v000.0006 changed - Use folder-aware display values
-                size_str = self.format_size(result.right_item.size) if result.right_item.size else ""
-                item_id = self.right_tree.insert(self.root_item_right, tk.END, text=item_text,
-                                               values=(size_str, date_created_str, date_modified_str, sha512_str, status))
-                self.path_to_item_right[rel_path] = item_id
-
     def build_trees_with_root_paths(self): # v000.0003 changed - fixed false conflict detection bug
         """
         Build tree structures from comparison results with fully qualified root paths # v000.0002 changed - removed sorting
@@ -2396,6 +2462,12 @@ class FolderCompareSync_class:
         # Store root path mappings for selection system
         self.path_to_item_left[''] = self.root_item_left  # Empty path represents root
         self.path_to_item_right[''] = self.root_item_right
+        self.item_to_path_left = {self.root_item_left: ''}  # reverse mapping, rebuilt with the tree # v002.0008 added
+        self.item_to_path_right = {self.root_item_right: ''}  # v002.0008 added
+        
+        # Per-parent child lists in insertion order, filled by populate_tree, used to detach/reattach rows for filtering # v002.0007 added
+        self.tree_children_left = {'': [self.root_item_left]}
+        self.tree_children_right = {'': [self.root_item_right]}
         
         if __debug__:
             log_and_flush(logging.DEBUG, f"Created root items: left={self.root_item_left}, right={self.root_item_right}")
@@ -2570,6 +2642,11 @@ class FolderCompareSync_class:
         # Use simple alphabetical sorting for stable, predictable ordering  # v000.0002 changed - removed sorting
         sorted_items = sorted(structure.items()) # v000.0002 changed - removed sorting
         
+        # Record this parent's children in insertion order for filtering by detach/reattach # v002.0007 added
+        children_map = self.tree_children_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.tree_children_right
+        child_list = children_map.setdefault(parent_id, [])
+        item_map = self.item_to_path_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.item_to_path_right # v002.0008 added
+        
         # Import the MissingFolder class (defined in build_trees_with_root_paths)
         for name, content in sorted_items:
             # Build the full relative path for this item
@@ -2608,8 +2685,7 @@ class FolderCompareSync_class:
                         
                         # v000.0006 added - Format folder timestamps if available
                         if folder_metadata and folder_metadata.is_folder:
-                            date_created_str = self.format_timestamp(folder_metadata.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                            date_modified_str = self.format_timestamp(folder_metadata.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
+                            date_created_str, date_modified_str = DisplayFormatter_class.folder_date_values(folder_metadata) # v002.0006 changed [memoized row formatting]
                         
                         # v000.0006 added - Determine smart status for folders
                         if result.is_different and result.differences:
@@ -2631,6 +2707,8 @@ class FolderCompareSync_class:
                 # Store path mapping for both real and missing folders
                 path_map = self.path_to_item_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.path_to_item_right
                 path_map[item_rel_path] = item_id
+                item_map[item_id] = item_rel_path # v002.0008 added
+                child_list.append(item_id) # v002.0007 added
                 
             else:
                 # This is a file
@@ -2641,10 +2719,8 @@ class FolderCompareSync_class:
                                         values=("", "", "", "", "Missing"), tags=('missing',))
                 else:
                     # Existing file - has checkbox and shows ALL metadata
-                    size_str = self.format_size(content.size) if content.size else ""
-                    date_created_str = self.format_timestamp(content.date_created, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    date_modified_str = self.format_timestamp(content.date_modified, include_timezone=False) # v001.0011 changed [use centralized format_timestamp method]
-                    sha512_str = content.sha512[:16] + "..." if content.sha512 else ""
+                    # v002.0006 changed [cells rendered once per metadata record and reused on every rebuild]
+                    size_str, date_created_str, date_modified_str, sha512_str = DisplayFormatter_class.file_row_values(content)
                     
                     # Determine status using proper path lookup
                     result = self.comparison_results.get(item_rel_path)
@@ -2657,6 +2733,8 @@ class FolderCompareSync_class:
                 # Store path mapping for both missing and existing files
                 path_map = self.path_to_item_left if side.lower() == C.LEFT_SIDE_LOWERCASE else self.path_to_item_right
                 path_map[item_rel_path] = item_id
+                item_map[item_id] = item_rel_path # v002.0008 added
+                child_list.append(item_id) # v002.0007 added
                                         
         # Configure missing item styling using configurable color
         tree.tag_configure('missing', foreground=C.MISSING_ITEM_COLOR)
@@ -2744,16 +2822,10 @@ class FolderCompareSync_class:
         # First clear all selections for clean state
         self.clear_all_left()
         
-        # Use appropriate results set (filtered or full)
-        results_to_use = self.filtered_results if self.is_filtered else self.comparison_results
-        
-        count = 0
-        for rel_path, result in results_to_use.items():
-            if result.is_different and result.left_item and result.left_item.exists:
-                item_id = self.find_tree_item_by_path(rel_path, 'left')
-                if item_id:
-                    self.selected_left.add(item_id)
-                    count += 1
+        # Difference index range (respects the filter when active) # v002.0008 changed
+        different_items = self.get_difference_items(C.LEFT_SIDE_LOWERCASE)
+        self.selected_left.update(different_items)
+        count = len(different_items)
                     
         if __debug__:
             log_and_flush(logging.DEBUG, f"Selected {count} different items in left pane (after auto-clear)")
@@ -2782,16 +2854,10 @@ class FolderCompareSync_class:
         # First clear all selections for clean state
         self.clear_all_right()
         
-        # Use appropriate results set (filtered or full)
-        results_to_use = self.filtered_results if self.is_filtered else self.comparison_results
-        
-        count = 0
-        for rel_path, result in results_to_use.items():
-            if result.is_different and result.right_item and result.right_item.exists:
-                item_id = self.find_tree_item_by_path(rel_path, C.RIGHT_SIDE_LOWERCASE)
-                if item_id:
-                    self.selected_right.add(item_id)
-                    count += 1
+        # Difference index range (respects the filter when active) # v002.0008 changed
+        different_items = self.get_difference_items(C.RIGHT_SIDE_LOWERCASE)
+        self.selected_right.update(different_items)
+        count = len(different_items)
                     
         if __debug__:
             log_and_flush(logging.DEBUG, f"Selected {count} different items in right pane (after auto-clear)")
@@ -2888,7 +2954,7 @@ class FolderCompareSync_class:
         # Start copy operation in background thread
         status_text = "Simulating copy..." if self.dry_run_mode.get() else "Copying files..."
         self.status_var.set(status_text)
-        threading.Thread(target=self.perform_enhanced_copy_operation, args=('left_to_right'.lower(), selected_paths), daemon=True).start()
+        self.start_copy_operation_thread('left_to_right'.lower(), selected_paths) # v002.0004 changed [progress dialog is now created on the UI thread]
         
     def copy_right_to_left(self):
         """Copy selected items from right to left with dry run support and limit checking."""
@@ -2931,28 +2997,24 @@ class FolderCompareSync_class:
         # Start copy operation in background thread
         status_text = "Simulating copy..." if self.dry_run_mode.get() else "Copying files..."
         self.status_var.set(status_text)
-        threading.Thread(target=self.perform_enhanced_copy_operation, args=('right_to_left'.lower(), selected_paths), daemon=True).start()
+        self.start_copy_operation_thread('right_to_left'.lower(), selected_paths) # v002.0004 changed [progress dialog is now created on the UI thread]
 
-    def perform_enhanced_copy_operation(self, direction, selected_paths): # changed for v000.0005
+    def start_copy_operation_thread(self, direction, selected_paths): # v002.0004 added [create progress dialog on UI thread, then start the worker]
         """
-        Perform file copy operations with comprehensive logging, dry run support, and tracking.
-        
+        Snapshot the copy settings, create the copy progress dialog on the UI thread and start the copy worker.
+
         Purpose:
         --------
-        Orchestrates file copy operations using Strategy A/B with comprehensive logging,
-        dry run simulation capability, sequential numbering, and automatic refresh after completion.
-        
+        Tk widgets and variables must only be touched on the Tk thread, so everything
+        the worker needs from the UI is captured here and passed in as plain values.
+
         Args:
         -----
         direction: Copy direction ('left_to_right'.lower() or 'right_to_left'.lower())
         selected_paths: List of relative paths to copy
         """
-        start_time = time.time()
         is_dry_run = self.dry_run_mode.get()
-        dry_run_text = " (DRY RUN)" if is_dry_run else ""
-        
-        log_and_flush(logging.INFO, f"Starting copy operation{dry_run_text}: {direction} with {len(selected_paths)} items")
-        
+
         # Determine source and destination folders
         if direction.lower() == 'left_to_right'.lower():
             source_folder = self.left_folder.get()
@@ -2962,11 +3024,47 @@ class FolderCompareSync_class:
             source_folder = self.right_folder.get()
             dest_folder = self.left_folder.get()
             direction_text = f"{C.RIGHT_SIDE_UPPERCASE} to {C.LEFT_SIDE_UPPERCASE}"
-        
-        # Start copy operation session with dedicated logging and dry run support
-        operation_name = f"Copy {len(selected_paths)} items from {direction_text}{dry_run_text}"
-        operation_id = self.copy_manager.start_copy_operation(operation_name, dry_run=is_dry_run)
-        
+
+        # Compile the copy plan from the comparison metadata (no per-file stats), which also gives the # v002.0017 changed
+        # total bytes to copy for the bytes/s and ETA display # v002.0005 added
+        source_side = 'left' if direction.lower() == 'left_to_right'.lower() else 'right'
+        copy_plan = CopyPlan_class.from_comparison(self.comparison_results, selected_paths, source_side, source_folder, dest_folder)
+        bytes_total = copy_plan.total_bytes
+
+        # Disk space precheck over the whole plan, before any time is spent copying # v002.0019 added
+        space_shortfalls = copy_plan.check_free_space()
+        if space_shortfalls:
+            shortfall_text = "\n".join(f"{shortfall.volume}: needs {DisplayFormatter_class.format_size(shortfall.required_bytes)}, "
+                                       f"{DisplayFormatter_class.format_size(shortfall.free_bytes)} free" for shortfall in space_shortfalls)
+            for line in shortfall_text.splitlines():
+                self.add_status_message(f"WARNING: Not enough free space on {line}")
+            if not is_dry_run and not messagebox.askyesno(
+                    "Not Enough Free Space",
+                    f"The target does not have enough free space for this copy:\n\n{shortfall_text}\n\nCopy anyway?"):
+                self.add_status_message("Copy operation cancelled: not enough free space on target")
+                self.status_var.set("Ready")
+                return
+
+        copy_settings = {
+            'dry_run': is_dry_run,
+            'overwrite': self.overwrite_mode.get(),
+            'source_folder': source_folder,
+            'dest_folder': dest_folder,
+            'direction_text': direction_text,
+            'copy_plan': copy_plan, # v002.0017 added
+            'space_shortfalls': space_shortfalls, # v002.0026 added [for the dry run plan report]
+        }
+
+        self._start_copy_worker(direction, selected_paths, copy_settings, bytes_total) # v002.0025 changed [split out for resume]
+
+    def _start_copy_worker(self, direction, selected_paths, copy_settings: dict[str, Any], bytes_total: int): # v002.0025 added [split out of start_copy_operation_thread]
+        """Create the copy progress dialog (with its pause/cancel control) on the UI thread and start the copy worker."""
+        is_dry_run = copy_settings['dry_run']
+        direction_text = copy_settings['direction_text']
+        operation_control = OperationControl_class()
+        copy_settings['operation_control'] = operation_control
+        self.active_operation_control = operation_control
+
         # Create progress dialog for copy operation with dry run indication
         progress_title = f"{'Simulating' if is_dry_run else 'Copying'} Files"
         progress_message = f"{'Simulating' if is_dry_run else 'Copying'} files from {direction_text}..."
@@ -2974,154 +3072,249 @@ class FolderCompareSync_class:
             self.root,
             progress_title,
             progress_message,
-            max_value=len(selected_paths)
+            max_value=len(selected_paths),
+            bytes_total=bytes_total, # v002.0005 added [byte-based ETA]
+            rate_limits=None if is_dry_run else self.copy_manager.rate_limiter.limits, # v002.0024 added [live rate limit controls]
+            on_rate_limits_changed=self.copy_manager.set_rate_limits,
+            operation_control=operation_control # v002.0025 added [Pause/Resume and Cancel]
         )
+        threading.Thread(target=self.perform_enhanced_copy_operation, args=(direction, selected_paths, progress, copy_settings), daemon=True).start()
+
+    def resume_copy_from_checkpoint(self): # v002.0025 added
+        """
+        Continue a cancelled copy from its checkpoint, without comparing the folders again.
+
+        Purpose:
+        --------
+        A cancelled copy saves a checkpoint beside its operation log: the items done and
+        the rest of its copy plan. The rest of the plan is copied as planned (each file
+        is still checked for changes since it was planned, as usual), with the current
+        dry run setting. The checkpoint is removed once superseded.
+        """
+        if self.active_operation_control is not None:
+            messagebox.showinfo("Copy In Progress", "Wait for the running copy to finish (or cancel it) first.")
+            return
+        checkpoint_path = filedialog.askopenfilename(
+            title="Resume Copy From Checkpoint",
+            initialdir=OperationControl_class.checkpoint_folder(),
+            filetypes=[("Copy checkpoints", "foldercomparesync_copy_*_checkpoint.json"), ("All files", "*.*")])
+        if not checkpoint_path:
+            return
+        try:
+            checkpoint = OperationControl_class.read_checkpoint(checkpoint_path)
+            if checkpoint.get('kind') != "copy":
+                raise ValueError(f"not a copy checkpoint ({checkpoint.get('kind')})")
+            copy_plan = CopyPlan_class.from_dict(checkpoint['plan'])
+            source_folder = checkpoint['source_folder']
+            dest_folder = checkpoint['dest_folder']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.show_error(f"Cannot resume from checkpoint {checkpoint_path}:\n{e}")
+            return
+
+        is_dry_run = self.dry_run_mode.get()
+        selected_paths = copy_plan.rel_paths()
+        completed_before = set(checkpoint.get('completed', []))
+        direction_text = checkpoint.get('direction_text', f"{source_folder} to {dest_folder}")
+        dry_run_notice = "\n\n*** DRY RUN MODE - No files will be modified ***" if is_dry_run else ""
+        if not messagebox.askyesno("Resume Copy Operation",
+                                   f"Resume the copy from {direction_text}?\n\n"
+                                   f"Done: {len(completed_before):,} items\n"
+                                   f"Remaining: {len(selected_paths):,} items ({DisplayFormatter_class.format_size(copy_plan.total_bytes)})\n\n"
+                                   f"From: {source_folder}\nTo: {dest_folder}{dry_run_notice}"):
+            self.add_status_message("Resume copy cancelled by user")
+            return
+
+        self.add_status_message(f"Resuming copy{' (DRY RUN)' if is_dry_run else ''} from checkpoint {checkpoint_path}: {len(selected_paths):,} items remaining")
+        copy_settings = {
+            'dry_run': is_dry_run,
+            'overwrite': checkpoint.get('overwrite', self.overwrite_mode.get()),
+            'source_folder': source_folder,
+            'dest_folder': dest_folder,
+            'direction_text': direction_text,
+            'copy_plan': copy_plan,
+            'checkpoint_path': checkpoint_path,
+            'completed_before': completed_before,
+        }
+        self.status_var.set("Simulating copy..." if is_dry_run else "Copying files...")
+        self._start_copy_worker(checkpoint.get('direction', "resume"), selected_paths, copy_settings, copy_plan.total_bytes)
+
+    def quit_application(self): # v002.0025 added
+        """Quit, first cancelling a running copy: its files in progress finish and a checkpoint is saved for Resume Copy."""
+        operation_control = self.active_operation_control
+        if operation_control is None:
+            self.root.quit()
+            return
+        if not messagebox.askyesno("Copy In Progress",
+                                   "A copy is still running.\n\nCancel it and quit? Files being copied are finished first, "
+                                   "and a checkpoint is saved so the copy can be resumed later (Resume Copy...)."):
+            return
+        self.quit_requested = True
+        operation_control.cancel()
+        self._quit_when_idle()
+
+    def _quit_when_idle(self): # v002.0025 added
+        """Quit once the cancelled copy has stopped (polled on the UI thread)."""
+        if self.active_operation_control is None:
+            self.root.quit()
+        else:
+            self.root.after(200, self._quit_when_idle)
+
+    def perform_enhanced_copy_operation(self, direction, selected_paths, progress: ProgressDialog_class, copy_settings: dict[str, Any]): # v002.0004 changed [UI-thread progress dialog and settings snapshot]
+        """
+        Perform file copy operations with comprehensive logging, dry run support, and tracking.
         
-        copied_count = 0
-        error_count = 0
-        skipped_count = 0
-        total_bytes_copied = 0
-        critical_errors = []  # Track critical errors that require user attention
+        Purpose:
+        --------
+        Orchestrates file copy operations using Strategy A/B with comprehensive logging,
+        dry run simulation capability, sequential numbering, and automatic refresh after completion.
+        Files are copied concurrently by CopyScheduler_class. # v002.0009 added
+        Runs in a worker thread: all UI interaction goes through self.ui_events. # v002.0004 added
         
-        # Track copy strategies used for summary
-        direct_strategy_count = 0
-        staged_strategy_count = 0
+        Args:
+        -----
+        direction: Copy direction ('left_to_right'.lower() or 'right_to_left'.lower())
+        selected_paths: List of relative paths to copy
+        progress: Progress dialog created on the UI thread by start_copy_operation_thread
+        copy_settings: Settings snapshot taken on the UI thread by start_copy_operation_thread
+        """
+        start_time = time.time()
+        ui = self.ui_events # v002.0004 added [coalescing UI event queue]
+        is_dry_run = copy_settings['dry_run']
+        dry_run_text = " (DRY RUN)" if is_dry_run else ""
+        
+        log_and_flush(logging.INFO, f"Starting copy operation{dry_run_text}: {direction} with {len(selected_paths)} items")
+        
+        # Source and destination folders were determined on the UI thread # v002.0004 changed
+        source_folder = copy_settings['source_folder']
+        dest_folder = copy_settings['dest_folder']
+        direction_text = copy_settings['direction_text']
+        
+        # Dry runs in "plan" mode report the plan from the comparison metadata, touching no files # v002.0026 added
+        if is_dry_run and C.COPY_DRY_RUN_MODE == "plan":
+            try:
+                self.report_copy_plan(copy_settings, time.time() - start_time)
+            except Exception as e:
+                log_and_flush(logging.ERROR, f"Copy plan report failed: {e}")
+                ui.post_status(f"ERROR: Copy plan report failed: {e}")
+            finally:
+                ui.post_close(progress)
+                ui.post_call(lambda: self.status_var.set("Ready"))
+                self.active_operation_control = None
+            return
+        
+        # Start copy operation session with dedicated logging and dry run support
+        operation_name = f"Copy {len(selected_paths)} items from {direction_text}{dry_run_text}"
+        operation_id = self.copy_manager.start_copy_operation(operation_name, dry_run=is_dry_run)
         
         try:
-            for i, rel_path in enumerate(selected_paths):
-                try:
-                    # Update progress with dry run indication if required
-                    source_path = str(Path(source_folder) / rel_path)
-                    # Check if this file will use staged strategy for large file indication
-                    base_progress_text = f"{'Simulating' if is_dry_run else 'Copying'} {i+1} of {len(selected_paths)}: {os.path.basename(rel_path)}"
-                    if Path(source_path).exists() and Path(source_path).is_file():
-                        file_size = Path(source_path).stat().st_size
-                        strategy = FileCopyManager_class.determine_copy_strategy(source_path, str(Path(dest_folder) / rel_path), file_size)
-                        if strategy == FileCopyManager_class.CopyStrategy.STAGED and file_size >= C.COPY_STRATEGY_THRESHOLD:
-                            size_str = self.format_size(file_size)
-                            progress_text = f"{base_progress_text}\n({size_str} file copy in progress ...not frozen, just busy)"
-                        else:
-                            progress_text = base_progress_text
-                    else:
-                        progress_text = base_progress_text
-                    progress.update_progress(i+1, progress_text)
-                                                       
-                    dest_path = str(Path(dest_folder) / rel_path)
-                    
-                    # Skip if source doesn't exist
-                    if not Path(source_path).exists():
-                        skipped_count += 1
-                        self.copy_manager._log_status(f"Source file not found, skipping: {source_path}")
-                        continue
-                    
-                    # Handle directories separately (create them, don't copy as files) # v000.0005 changed - added folder timestamp copying
-                    if Path(source_path).is_dir():
-                        # Create destination directory if needed (or simulate in dry run)
-                        if not Path(dest_path).exists():
-                            if not is_dry_run:
-                                Path(dest_path).mkdir(parents=True, exist_ok=True)
-                                copied_count += 1
-                                self.copy_manager._log_status(f"Created directory: {dest_path}")
-                                
-                                # v000.0005 added - Copy timestamps for newly created directories
-                                try:                                                                                                     # v000.0005 added - Copy timestamps for newly created directories
-                                    self.copy_manager.timestamp_manager.copy_timestamps(source_path, dest_path)                          # v000.0005 added - Copy timestamps for newly created directories
-                                    self.copy_manager._log_status(f"Copied directory timestamps: {dest_path}")                           # v000.0005 added - Copy timestamps for newly created directories
-                                except Exception as e:                                                                                   # v000.0005 added - Copy timestamps for newly created directories
-                                    # Non-critical error - directory was created successfully                                            # v000.0005 added - Copy timestamps for newly created directories
-                                    self.copy_manager._log_status(f"Warning: Could not copy directory timestamps for {dest_path}: {e}")  # v000.0005 added - Copy timestamps for newly created directories
-                            else:
-                                copied_count += 1
-                                self.copy_manager._log_status(f"DRY RUN: Would create directory: {dest_path}")
-                                self.copy_manager._log_status(f"DRY RUN: Would copy directory timestamps: {dest_path}")  # v000.0005 added
-                        else:
-                            # v000.0005 added - Directory already exists - still copy timestamps to sync metadata  
-                            if not is_dry_run:                                                                                             # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                try:                                                                                                       # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    self.copy_manager.timestamp_manager.copy_timestamps(source_path, dest_path)                            # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    copied_count += 1  # Count as a successful operation                                                   # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    self.copy_manager._log_status(f"Updated directory timestamps: {dest_path}")                            # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                except Exception as e:                                                                                     # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    # Non-critical error - directory exists                                                                # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    self.copy_manager._log_status(f"Warning: Could not update directory timestamps for {dest_path}: {e}")  # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                    skipped_count += 1                                                                                     # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                            else:                                                                                                          # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                copied_count += 1                                                                                          # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                                self.copy_manager._log_status(f"DRY RUN: Would update directory timestamps: {dest_path}")                  # v000.0005 added - Directory already exists - still copy timestamps to sync metadata 
-                        continue
-                    
-                    # Copy individual file using copy manager with dry run support
-                    result = self.copy_manager.copy_file(source_path, dest_path, self.overwrite_mode.get())
-                    
-                    # Track strategy usage for summary
-                    if result.strategy_used == FileCopyManager_class.CopyStrategy.DIRECT:
-                        direct_strategy_count += 1
-                    elif result.strategy_used == FileCopyManager_class.CopyStrategy.STAGED:
-                        staged_strategy_count += 1
-                    
-                    if result.success:
-                        copied_count += 1
-                        total_bytes_copied += result.bytes_copied
-                        success_msg = f"Successfully {'simulated' if is_dry_run else 'copied'}: {rel_path} ({result.strategy_used.value} strategy)"
-                        self.copy_manager._log_status(success_msg)
-                    else:
-                        error_count += 1
-                        error_msg = f"Failed to {'simulate' if is_dry_run else 'copy'} {rel_path}: {result.error_message}"
-                        self.copy_manager._log_status(error_msg)
-                        self.root.after(0, lambda msg=error_msg: self.add_status_message(f"ERROR: {msg}"))
-                        
-                        # Check for critical errors that require immediate user attention (only in non-dry-run)
-                        if not is_dry_run and ("CRITICAL" in result.error_message or "Rename operation failed" in result.error_message):
-                            critical_errors.append((rel_path, result.error_message))
-                    
-                    # Update progress every few items using configurable frequency
-                    if i % max(1, len(selected_paths) // 20) == 0:
-                        status_msg = f"Progress: {copied_count} {'simulated' if is_dry_run else 'copied'}, {error_count} errors, {skipped_count} skipped"
-                        self.root.after(0, lambda msg=status_msg: self.add_status_message(msg))
-                        
-                except Exception as e:
-                    error_count += 1
-                    error_msg = f"Error processing {rel_path}: {str(e)}"
-                    log_and_flush(logging.ERROR, error_msg)
-                    self.copy_manager._log_status(error_msg)
-                    self.root.after(0, lambda msg=error_msg: self.add_status_message(f"ERROR: {msg}"))
-                    continue
+            # Directories first, then files on the copy worker pool # v002.0009 changed [CopyScheduler_class replaces the sequential loop]
+            scheduler = CopyScheduler_class(
+                self.copy_manager,
+                source_folder,
+                dest_folder,
+                overwrite=copy_settings['overwrite'],
+                dry_run=is_dry_run,
+                progress_callback=lambda completed, message, bytes_done: ui.post_progress(progress, completed, message, bytes_done=bytes_done,
+                                                                                          eta_seconds=scheduler.estimate_remaining_seconds()), # v002.0023 changed [scheduler's ETA]
+                status_callback=ui.post_status,
+                operation_control=copy_settings['operation_control'], # v002.0025 added [Pause/Resume and Cancel]
+            )
+            copy_summary = scheduler.run_plan(copy_settings['copy_plan']) # v002.0017 changed [plan compiled from comparison results]
+            copied_count = copy_summary.copied_count
+            error_count = copy_summary.error_count
+            skipped_count = copy_summary.skipped_count
+            total_bytes_copied = copy_summary.total_bytes_copied
+            critical_errors = copy_summary.critical_errors  # Critical errors that require user attention
+            
+            # Track copy strategies used for summary, in CopyStrategy order # v002.0012 changed [all strategies, including clone]
+            strategy_counts = [(strategy.value, copy_summary.strategy_counts[strategy.value])
+                               for strategy in FileCopyManager_class.CopyStrategy if copy_summary.strategy_counts.get(strategy.value)]
+            
+            # Cancelled: save a checkpoint of the items done and the rest of the plan, for Resume Copy # v002.0025 added
+            outcome_text = "cancelled" if copy_summary.cancelled else "complete"
+            checkpoint_text = ""
+            checkpoint_failed = False
+            if copy_summary.cancelled:
+                checkpoint_text = f"Cancelled: {copy_summary.cancelled_count} items not started"
+                if not is_dry_run:
+                    try:
+                        checkpoint_path = OperationControl_class.write_checkpoint("copy", operation_id, {
+                            'direction': direction,
+                            'direction_text': direction_text,
+                            'source_folder': source_folder,
+                            'dest_folder': dest_folder,
+                            'overwrite': copy_settings['overwrite'],
+                            'completed': sorted(copy_settings.get('completed_before', set()) | copy_summary.done_paths),
+                            'plan': copy_settings['copy_plan'].remaining(copy_summary.done_paths).to_dict(),
+                        })
+                        checkpoint_text += f", checkpoint saved (Resume Copy... to continue): {checkpoint_path}"
+                    except OSError as e:
+                        checkpoint_failed = True
+                        checkpoint_text += f", checkpoint could not be saved: {e}"
+                self.copy_manager._log_status(checkpoint_text)
+                ui.post_status(checkpoint_text)
+            resumed_checkpoint = copy_settings.get('checkpoint_path')
+            if resumed_checkpoint and not is_dry_run and os.path.exists(resumed_checkpoint) and not checkpoint_failed:
+                os.remove(resumed_checkpoint)  # completed, or superseded by the checkpoint just saved
+                self.copy_manager._log_status(f"Removed resumed checkpoint: {resumed_checkpoint}")
             
             # Final progress update
-            final_progress_text = f"{'Simulation' if is_dry_run else 'Copy'} operation complete"
-            progress.update_progress(len(selected_paths), final_progress_text)
+            final_progress_text = f"{'Simulation' if is_dry_run else 'Copy'} operation {outcome_text}" # v002.0025 changed
+            ui.post_progress(progress, len(selected_paths), final_progress_text, bytes_done=total_bytes_copied) # v002.0005 changed [bytes/s and ETA]
             
             elapsed_time = time.time() - start_time
             
             # End copy operation session
-            self.copy_manager.end_copy_operation(copied_count, error_count, total_bytes_copied)
+            self.copy_manager.end_copy_operation(copied_count, error_count, total_bytes_copied,
+                                                 None if is_dry_run else copy_summary.total_allocated_bytes) # v002.0013 changed [allocated vs logical bytes]
+            if not is_dry_run and total_bytes_copied >= C.COPY_PLAN_ESTIMATE_MIN_BYTES and elapsed_time > 0: # v002.0026 added
+                self.observed_copy_bytes_per_second = total_bytes_copied / elapsed_time
             
             # summary message with strategy breakdown
-            summary = f"Copy operation{dry_run_text} complete ({direction_text}): "
+            summary = f"Copy operation{dry_run_text} {outcome_text} ({direction_text}): " # v002.0025 changed
             summary += f"{copied_count} {'simulated' if is_dry_run else 'copied'}, {error_count} errors, "
             summary += f"{skipped_count} skipped, {total_bytes_copied:,} bytes in {elapsed_time:.1f}s"
             log_and_flush(logging.INFO, summary)
-            self.root.after(0, lambda: self.add_status_message(summary))
+            ui.post_status(summary)
+            linked_text = "" # v002.0021 added [hardlinks recreated instead of copied]
+            if copy_summary.linked_count:
+                linked_text = (f"{'Would link' if is_dry_run else 'Linked'}: {copy_summary.linked_count} hardlinked files, "
+                               f"{copy_summary.bytes_saved:,} bytes saved")
+                log_and_flush(logging.INFO, linked_text)
+                ui.post_status(linked_text)
+            allocated_text = "" # v002.0013 added [sparse copies allocate less than their logical size]
+            if not is_dry_run and copy_summary.method_counts.get(FileCopyManager_class.CopyMethod.SPARSE.value):
+                allocated_text = f"Allocated on target: {copy_summary.total_allocated_bytes:,} bytes (logical {total_bytes_copied:,})"
+                log_and_flush(logging.INFO, allocated_text)
+                ui.post_status(allocated_text)
             
             # strategy summary
-            if direct_strategy_count > 0 or staged_strategy_count > 0:
-                strategy_summary = f"Strategy usage: {direct_strategy_count} direct, {staged_strategy_count} staged"
-                self.root.after(0, lambda: self.add_status_message(strategy_summary))
+            if strategy_counts:
+                strategy_summary = "Strategy usage: " + ", ".join(f"{count} {name}" for name, count in strategy_counts)
+                ui.post_status(strategy_summary)
+            if copy_summary.method_counts: # v002.0010 added
+                ui.post_status("Copy methods: " + ", ".join(f"{count} {method}" for method, count in sorted(copy_summary.method_counts.items())))
             
             # Show completion dialog with information including dry run status
-            completion_msg = f"Copy operation{dry_run_text} completed!\n\n"
+            completion_msg = f"Copy operation{dry_run_text} {'cancelled' if copy_summary.cancelled else 'completed'}!\n\n" # v002.0025 changed
             completion_msg += f"Successfully {'simulated' if is_dry_run else 'copied'}: {copied_count} items\n"
             completion_msg += f"Total bytes {'simulated' if is_dry_run else 'copied'}: {total_bytes_copied:,}\n"
+            if allocated_text: # v002.0013 added
+                completion_msg += f"{allocated_text}\n"
+            if linked_text: # v002.0021 added
+                completion_msg += f"{linked_text}\n"
             completion_msg += f"Errors: {error_count}\n"
             completion_msg += f"Skipped: {skipped_count}\n"
             completion_msg += f"Time: {elapsed_time:.1f} seconds\n"
             completion_msg += f"Operation ID: {operation_id}\n"
+            if checkpoint_text: # v002.0025 added
+                completion_msg += f"\n{checkpoint_text}\n"
             
             # Include strategy breakdown
-            if direct_strategy_count > 0 or staged_strategy_count > 0:
+            if strategy_counts:
                 completion_msg += f"\nStrategy Usage:\n"
-                completion_msg += f"• Direct strategy: {direct_strategy_count} files\n"
-                completion_msg += f"• Staged strategy: {staged_strategy_count} files\n"
+                for name, count in strategy_counts:
+                    completion_msg += f"• {name.capitalize()} strategy: {count} files\n"
             
             if is_dry_run:
                 completion_msg += f"\n*** DRY RUN SIMULATION ***\n"
@@ -3141,35 +3334,109 @@ class FolderCompareSync_class:
                 
                 completion_msg += "The folder trees will now be refreshed and selections cleared."
             
+            # Close the progress dialog before the (modal) completion dialog is queued # v002.0004 added
+            ui.post_close(progress)
+
             # Use error dialog if there were critical errors, otherwise info dialog
-            if critical_errors and not is_dry_run:
-                self.root.after(0, lambda: FolderCompareSync_class.ErrorDetailsDialog_class(
+            if self.quit_requested: # v002.0025 added [quitting: no dialogs or refresh]
+                pass
+            elif critical_errors and not is_dry_run:
+                ui.post_call(lambda: FolderCompareSync_class.ErrorDetailsDialog_class(
                     self.root, 
                     f"Copy Complete with Errors", 
                     completion_msg, 
                     error_details
                 ))
             else:
-                self.root.after(0, lambda: messagebox.showinfo(
+                ui.post_call(lambda: messagebox.showinfo(
                     f"{'Simulation' if is_dry_run else 'Copy'} Complete", 
                     completion_msg
                 ))
             
             # IMPORTANT: Only refresh trees and clear selections for actual copy operations (not dry runs)
-            if not is_dry_run:
-                self.root.after(0, self.refresh_after_copy_or_delete_operation)
+            if self.quit_requested: # v002.0025 added
+                pass
+            elif not is_dry_run:
+                ui.post_call(self.refresh_after_copy_or_delete_operation)
             else:
-                self.root.after(0, lambda: self.add_status_message("DRY RUN complete - no file system changes made"))
+                ui.post_status("DRY RUN complete - no file system changes made")
             
         except Exception as e:
             log_and_flush(logging.ERROR, f"Copy operation{dry_run_text} failed: {e}")
             error_msg = f"Copy operation{dry_run_text} failed: {str(e)}"
             self.copy_manager._log_status(error_msg)
-            self.root.after(0, lambda: self.add_status_message(f"ERROR: {error_msg}"))
-            self.root.after(0, lambda: self.show_error(error_msg))
+            ui.post_status(f"ERROR: {error_msg}")
+            ui.post_call(lambda: self.show_error(error_msg))
         finally:
-            progress.close()
-            self.root.after(0, lambda: self.status_var.set("Ready"))
+            ui.post_close(progress) # v002.0004 changed [close on the UI thread]
+            ui.post_call(lambda: self.status_var.set("Ready"))
+            self.active_operation_control = None # v002.0025 added
+
+    def report_copy_plan(self, copy_settings: dict[str, Any], planning_seconds: float): # v002.0026 added
+        """
+        Report a dry run as one summary of its copy plan, without touching the file system.
+
+        Purpose:
+        --------
+        A simulated dry run stats every file and logs several "DRY RUN: Would..." lines
+        per file, taking almost as long as the copy. The plan, compiled from the cached
+        comparison metadata, already holds everything a dry run reports: directories to
+        create, files new and overwritten, bytes per strategy and the items missing. This
+        adds an estimated duration (bandwidth observed in the last large copy, else
+        C.COPY_PLAN_ESTIMATE_BYTES_PER_SECOND, and the current rate limits) and shows the
+        summary in the status window and a dialog. With C.COPY_PLAN_FILE_ENABLED the plan
+        is also written as JSON beside the logs. Runs in the copy worker thread.
+
+        Args:
+        -----
+        copy_settings: Settings snapshot taken on the UI thread by start_copy_operation_thread
+        planning_seconds: Time taken so far, reported with the summary
+        """
+        ui = self.ui_events
+        copy_plan = copy_settings['copy_plan']
+        if self.observed_copy_bytes_per_second:
+            bytes_per_second = self.observed_copy_bytes_per_second
+            estimate_basis = f"at {bytes_per_second / (1024 * 1024):.1f} MB/s as in the last copy"
+        else:
+            bytes_per_second = C.COPY_PLAN_ESTIMATE_BYTES_PER_SECOND
+            estimate_basis = f"at an assumed {bytes_per_second / (1024 * 1024):.0f} MB/s"
+        estimate_basis += f", {C.COPY_PLAN_ESTIMATE_SECONDS_PER_FILE * 1000:g} ms per file over {C.COPY_WORKER_COUNT} workers"
+        bytes_limit, files_limit = self.copy_manager.rate_limiter.limits
+        if bytes_limit or files_limit:
+            estimate_basis += f", rate limit {CopyRateLimiter_class.format_limits(bytes_limit, files_limit)}"
+        estimate_seconds = copy_plan.estimate_seconds(bytes_per_second, C.COPY_PLAN_ESTIMATE_SECONDS_PER_FILE, C.COPY_WORKER_COUNT,
+                                                      bytes_limit, files_limit)
+
+        report = [f"Copy plan (DRY RUN - no files were read or written): {copy_settings['direction_text']}",
+                  f"From: {copy_settings['source_folder']}",
+                  f"To: {copy_settings['dest_folder']}"]
+        report += copy_plan.report_lines(estimate_seconds, estimate_basis)
+        for shortfall in copy_settings.get('space_shortfalls', []):
+            report.append(f"Not enough free space on {shortfall.volume}: needs {DisplayFormatter_class.format_size(shortfall.required_bytes)}, "
+                          f"{DisplayFormatter_class.format_size(shortfall.free_bytes)} free")
+        if C.COPY_PLAN_FILE_ENABLED:
+            plan_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     f"foldercomparesync_plan_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.json")
+            try:
+                copy_plan.write_plan_file(plan_path, {
+                    'created': datetime.now().isoformat(),
+                    'direction_text': copy_settings['direction_text'],
+                    'source_folder': copy_settings['source_folder'],
+                    'dest_folder': copy_settings['dest_folder'],
+                    'overwrite': copy_settings['overwrite'],
+                    'estimated_seconds': round(estimate_seconds, 1),
+                    'estimate_basis': estimate_basis,
+                })
+                report.append(f"Plan file: {plan_path}")
+            except OSError as e:
+                report.append(f"Plan file could not be written: {e}")
+        report.append(f"Planned in {planning_seconds:.2f}s")
+
+        for line in report:
+            log_and_flush(logging.INFO, line)
+            ui.post_status(line)
+        report_text = "\n".join(report)
+        ui.post_call(lambda: messagebox.showinfo("Copy Plan (Dry Run)", report_text))
 
     def refresh_after_copy_or_delete_operation(self):
         """
@@ -3198,7 +3465,7 @@ class FolderCompareSync_class:
         # This will re-scan both folders and rebuild the trees
         if self.left_folder.get() and self.right_folder.get():
             self.add_status_message("Re-scanning folders to show updated state...")
-            threading.Thread(target=self.perform_comparison, daemon=True).start()
+            self.start_comparison_thread() # v002.0004 changed [progress dialog is now created on the UI thread]
         else:
             self.add_status_message("Copy or Delete operation complete - ready for next operation")
         
@@ -3397,7 +3664,7 @@ class FolderCompareSync_class:
                 if auto_compare:
                     self.add_status_message("Auto-comparing folders with new settings...")
                     # Start comparison in background thread
-                    threading.Thread(target=self.perform_comparison, daemon=True).start()
+                    self.start_comparison_thread() # v002.0004 changed [progress dialog is now created on the UI thread]
             
             log_and_flush(logging.INFO, "UI recreation completed successfully")
             
@@ -3551,6 +3818,8 @@ class FolderCompareSync_class:
             if state.get('has_comparison_data', False):
                 if 'comparison_results' in state:
                     self.comparison_results = state['comparison_results']
+                    self.filename_index = None  # rebuilt on demand for the restored results # v002.0007 added
+                    self.difference_index = None  # rebuilt on demand for the restored results # v002.0008 added
                 if 'filtered_results' in state:
                     self.filtered_results = state['filtered_results']
                     
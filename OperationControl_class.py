@@ -0,0 +1,141 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class OperationControl_class:
+    """
+    Cooperative cancel and pause for long running copy and delete operations, and their checkpoints.
+
+    Purpose:
+    --------
+    A copy or delete operation used to run to the end once started. The operation's
+    workers now call wait_while_paused() before starting each item: it returns at once
+    when running, blocks while paused, and returns False once cancelled, so no new work
+    is started. Items already in progress are never interrupted - a file being copied
+    finishes (or its strategy rolls back on failure) - so the target is never left with
+    a half written file. Copy workers also wait between chunks while paused.
+    The controls are set from any thread (eg the progress dialog's buttons on the UI
+    thread).
+
+    When an operation is cancelled it writes a checkpoint (write_checkpoint): a JSON file
+    beside the operation logs recording the completed items and what remains, from which
+    a later run can continue without recomputing the comparison.
+
+    Usage:
+    ------
+    control = OperationControl_class()
+    progress = ProgressDialog_class(parent, "Copying Files", "Copying...", max_value=10, operation_control=control)
+    for item in items:
+        if not control.wait_while_paused():
+            break                              # cancelled: start nothing more
+        process(item)
+    if control.is_cancelled:
+        path = OperationControl_class.write_checkpoint("copy", operation_id, {"completed": done, ...})
+    """
+
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self):
+        """Initialize a running (not paused, not cancelled) control."""
+        self._cancelled = threading.Event()
+        self._running = threading.Event()   # cleared while paused
+        self._running.set()
+
+    def cancel(self) -> None:
+        """Stop starting new items (also releases any paused waiters)."""
+        if not self._cancelled.is_set():
+            log_and_flush(logging.INFO, "Operation cancel requested")
+        self._cancelled.set()
+        self._running.set()
+
+    def pause(self) -> None:
+        """Hold new items (and copy chunks) until resume() or cancel()."""
+        if not self._cancelled.is_set() and self._running.is_set():
+            log_and_flush(logging.INFO, "Operation paused")
+            self._running.clear()
+
+    def resume(self) -> None:
+        """Continue after pause()."""
+        if not self._running.is_set():
+            log_and_flush(logging.INFO, "Operation resumed")
+        self._running.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._running.is_set()
+
+    def wait_while_paused(self) -> bool:
+        """Block while paused; True to carry on, False once cancelled."""
+        self._running.wait()
+        return not self._cancelled.is_set()
+
+    @staticmethod
+    def checkpoint_folder() -> str:
+        """Folder checkpoints are written to (beside the operation logs)."""
+        return os.path.dirname(os.path.abspath(__file__))
+
+    @staticmethod
+    def checkpoint_path(kind: str, operation_id: str) -> str:
+        """Checkpoint file for an operation (kind is eg "copy" or "delete_LEFT")."""
+        return os.path.join(OperationControl_class.checkpoint_folder(), f"foldercomparesync_{kind}_{operation_id}_checkpoint.json")
+
+    @staticmethod
+    def write_checkpoint(kind: str, operation_id: str, data: dict[str, Any]) -> str:
+        """
+        Write an operation checkpoint atomically (temp file then rename), returning its path.
+
+        Args:
+        -----
+        kind: Operation kind, part of the file name and stored as "kind"
+        operation_id: Operation ID, part of the file name and stored as "operation_id"
+        data: JSON serializable checkpoint contents (eg "completed" and "remaining" items)
+
+        Returns:
+        --------
+        str: Path of the checkpoint file
+        """
+        path = OperationControl_class.checkpoint_path(kind, operation_id)
+        checkpoint = {
+            "version": OperationControl_class.CHECKPOINT_VERSION,
+            "kind": kind,
+            "operation_id": operation_id,
+            "created": datetime.now().isoformat(),
+            **data,
+        }
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=1)
+        os.replace(temp_path, path)
+        log_and_flush(logging.INFO, f"Checkpoint written: {path}")
+        return path
+
+    @staticmethod
+    def read_checkpoint(path: str) -> dict[str, Any]:
+        """
+        Read a checkpoint written by write_checkpoint.
+
+        Raises:
+        -------
+        ValueError: The file is not a checkpoint of a version this build can read
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if not isinstance(checkpoint, dict) or checkpoint.get("version") != OperationControl_class.CHECKPOINT_VERSION:
+            raise ValueError(f"Not a FolderCompareSync checkpoint (version {OperationControl_class.CHECKPOINT_VERSION}): {path}")
+        return checkpoint
@@ -23,14 +23,31 @@ class ProgressDialog_class:
     Provides user feedback during lengthy operations like scanning, comparison,
     and copy operations with both determinate and indeterminate progress modes.
     
+    v002.0005 Rate limiting is handled here rather than by callers: update_progress()
+    and update_message() only record the latest state, and the dialog repaints at most
+    PROGRESS_DIALOG_MAX_REPAINTS_PER_SECOND times per second. Each repaint also shows
+    the processing rate (items/s and, if supplied, bytes/s) and an ETA.
+    
     Usage:
     ------
     progress = ProgressDialog_class(parent, "Scanning", "Scanning files...", max_value=1000)
     progress.update_progress(500, "Processing file 500...")
+    progress.update_progress(501, bytes_done=123456789)  # optional byte counts for bytes/s and ETA
     progress.close()
+    
+    v002.0024 Given rate_limits and on_rate_limits_changed, the dialog also shows MB/s and
+    files/s limit spinboxes (0 = unlimited), applied live as they are changed.
+    progress = ProgressDialog_class(parent, "Copying Files", "Copying...", max_value=10,
+                                    rate_limits=(0, 0), on_rate_limits_changed=copy_manager.set_rate_limits)
+    
+    v002.0025 Given an OperationControl_class, the dialog also shows Pause/Resume and Cancel
+    buttons (closing the window also cancels); the operation itself decides how to stop.
+    progress = ProgressDialog_class(parent, "Copying Files", "Copying...", max_value=10, operation_control=control)
     """
     
-    def __init__(self, parent, title, message, max_value=None):
+    def __init__(self, parent, title, message, max_value=None, rate_units: Optional[str] = "items", bytes_total: Optional[int] = None,
+                 rate_limits: Optional[tuple[float, float]] = None, on_rate_limits_changed=None,
+                 operation_control=None): # v002.0005 changed [rate and ETA display], v002.0024 changed [rate limit controls], v002.0025 changed [operation_control]
         """
         Initialize progress dialog with configurable dimensions.
         
@@ -40,6 +57,12 @@ class ProgressDialog_class:
         title: Dialog window title
         message: Initial progress message
         max_value: Maximum value for percentage (None for indeterminate)
+        rate_units: Name of the unit counted by value for the rate display (eg "items"),
+                    or None when value is not a count (eg a percentage) # v002.0005 added
+        bytes_total: Total bytes expected, enables a byte-based ETA when bytes_done is reported # v002.0005 added
+        rate_limits: Initial (bytes_per_second, files_per_second) limits, 0 = unlimited; shows the limit controls # v002.0024 added
+        on_rate_limits_changed: Callable(bytes_per_second, files_per_second), called on the UI thread when a limit is changed
+        operation_control: Optional OperationControl_class; shows Pause/Resume and Cancel buttons # v002.0025 added
         """
         log_and_flush(logging.DEBUG, f"Creating progress dialog: {title}")
         
@@ -47,10 +70,28 @@ class ProgressDialog_class:
         self.max_value = max_value
         self.current_value = 0
         
+        # v002.0005 added [latest requested state, painted at most N times per second]
+        self.rate_units = rate_units
+        self._state_lock = threading.Lock()
+        self._pending_value = None          # latest value not yet painted
+        self._pending_message = None        # latest message not yet painted
+        self._dirty = False
+        self._closed = False
+        self._ui_thread_id = threading.get_ident()   # thread which owns the Tk widgets
+        self._last_repaint_time = 0.0
+        self._repaint_after_id = None
+        self._start_time = time.time()
+        self._bytes_done = None
+        self._bytes_total = bytes_total
+        self._eta_seconds = None            # caller's estimate of the time remaining, and when it was made # v002.0023 added
+        self._eta_time = 0.0
+        
         # Create dialog window using global constants
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry(f"{C.PROGRESS_DIALOG_WIDTH}x{C.PROGRESS_DIALOG_HEIGHT}")
+        self._dialog_height = C.PROGRESS_DIALOG_HEIGHT + (C.PROGRESS_DIALOG_RATE_LIMIT_HEIGHT if rate_limits is not None else 0) # v002.0024 added
+        self._dialog_height += C.PROGRESS_DIALOG_CONTROLS_HEIGHT if operation_control is not None else 0 # v002.0025 added
+        self.dialog.geometry(f"{C.PROGRESS_DIALOG_WIDTH}x{self._dialog_height}") # v002.0024 changed
         self.dialog.resizable(False, False)
         
         # Center the dialog on parent
@@ -90,41 +131,240 @@ class ProgressDialog_class:
             ttk.Label(progress_frame, textvariable=self.count_var, 
                      font=("TkDefaultFont", 9)).pack()
         
+        # Rate and ETA display # v002.0005 added [items/s, bytes/s and ETA]
+        self.rate_var = tk.StringVar(value="")
+        ttk.Label(progress_frame, textvariable=self.rate_var,
+                 font=("TkDefaultFont", 9)).pack()
+        
+        # Live copy rate limits # v002.0024 added
+        self._on_rate_limits_changed = on_rate_limits_changed
+        if rate_limits is not None:
+            self._create_rate_limit_controls(progress_frame, rate_limits)
+        
+        # Pause/Resume and Cancel # v002.0025 added
+        self.operation_control = operation_control
+        if operation_control is not None:
+            self._create_operation_controls(progress_frame)
+        
         # Update the display
         self.dialog.update_idletasks()
         
         # Center on parent window using configurable dialog dimensions
         parent.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() // 2) - (C.PROGRESS_DIALOG_WIDTH // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (C.PROGRESS_DIALOG_HEIGHT // 2)
-        self.dialog.geometry(f"{C.PROGRESS_DIALOG_WIDTH}x{C.PROGRESS_DIALOG_HEIGHT}+{x}+{y}")
+        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self._dialog_height // 2) # v002.0024 changed
+        self.dialog.geometry(f"{C.PROGRESS_DIALOG_WIDTH}x{self._dialog_height}+{x}+{y}")
         
-    def update_message(self, message):
-        """Update the progress message display."""
-        self.message_var.set(message)
-        self.dialog.update_idletasks()
+        # Start the periodic repaint which picks up updates posted between repaints # v002.0005 added
+        self._schedule_repaint()
+        
+    def _create_rate_limit_controls(self, parent_frame, rate_limits: tuple[float, float]): # v002.0024 added
+        """Add the MB/s and files/s limit spinboxes (0 = unlimited), applied on change, Return or leaving the field."""
+        bytes_per_second, files_per_second = rate_limits
+        limit_frame = ttk.Frame(parent_frame)
+        limit_frame.pack(pady=(8, 0))
+        self.limit_mb_var = tk.StringVar(value=f"{bytes_per_second / (1024 * 1024):g}")
+        self.limit_files_var = tk.StringVar(value=f"{files_per_second:g}")
+        ttk.Label(limit_frame, text="Limit:").pack(side=tk.LEFT)
+        for variable, label, increment in ((self.limit_mb_var, "MB/s", 10), (self.limit_files_var, "files/s  (0 = unlimited)", 50)):
+            spinbox = ttk.Spinbox(limit_frame, textvariable=variable, from_=0, to=100000, increment=increment,
+                                  width=7, command=self._apply_rate_limits)
+            spinbox.pack(side=tk.LEFT, padx=(5, 2))
+            spinbox.bind('<Return>', lambda event: self._apply_rate_limits())
+            spinbox.bind('<FocusOut>', lambda event: self._apply_rate_limits())
+            ttk.Label(limit_frame, text=label).pack(side=tk.LEFT)
+    
+    def _apply_rate_limits(self): # v002.0024 added
+        """Pass the limits in the spinboxes to on_rate_limits_changed (a field which is not a number >= 0 is left unchanged)."""
+        if not self._on_rate_limits_changed:
+            return
+        limits = []
+        for variable in (self.limit_mb_var, self.limit_files_var):
+            try:
+                value = float(variable.get())
+            except (ValueError, tk.TclError):
+                value = None
+            limits.append(value if value is not None and value >= 0 else None)
+        mb_per_second, files_per_second = limits
+        self._on_rate_limits_changed(None if mb_per_second is None else mb_per_second * 1024 * 1024, files_per_second)
         
-    def update_progress(self, value, message=None):
-        """Update progress value and optionally message."""
-        if self.max_value is not None:
-            # Determinate progress
-            self.current_value = value
-            self.progress_bar['value'] = value
-            percentage = int((value / self.max_value) * 100) if self.max_value > 0 else 0
-            self.percent_var.set(f"{percentage}%")
+    def _create_operation_controls(self, parent_frame): # v002.0025 added
+        """Add the Pause/Resume and Cancel buttons; closing the window cancels too."""
+        button_frame = ttk.Frame(parent_frame)
+        button_frame.pack(pady=(8, 0))
+        self.pause_button = ttk.Button(button_frame, text="Pause", command=self._toggle_pause)
+        self.pause_button.pack(side=tk.LEFT, padx=(0, 10))
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self._cancel_operation)
+        self.cancel_button.pack(side=tk.LEFT)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel_operation)
+    
+    def _toggle_pause(self): # v002.0025 added
+        """Pause or resume the operation (UI thread)."""
+        if self.operation_control.is_paused:
+            self.operation_control.resume()
+            self.pause_button.config(text="Pause")
         else:
-            # Indeterminate progress - update counter
-            self.count_var.set(f"{value:,} items")
-            
-        if message:
-            self.message_var.set(message)
+            self.operation_control.pause()
+            self.pause_button.config(text="Resume")
+            self.update_message("Paused - items in progress hold until resumed")
+    
+    def _cancel_operation(self): # v002.0025 added
+        """Cancel the operation (UI thread): nothing new starts, items in progress finish."""
+        if self.operation_control.is_cancelled:
+            return
+        self.operation_control.cancel()
+        self.pause_button.config(state=tk.DISABLED, text="Pause")
+        self.cancel_button.config(state=tk.DISABLED)
+        self.update_message("Cancelling - finishing the items in progress ...")
+        
+    def update_message(self, message):
+        """Record a new progress message; it is painted on the next throttled repaint.""" # v002.0005 changed [throttled]
+        with self._state_lock:
+            self._pending_message = message
+            self._dirty = True
+        self._repaint_if_due()
+        
+    def update_progress(self, value, message=None, bytes_done: Optional[int] = None, bytes_total: Optional[int] = None,
+                        eta_seconds: Optional[float] = None): # v002.0005 changed [throttled, optional byte counts], v002.0023 changed [eta_seconds]
+        """
+        Record progress value and optionally message; painted on the next throttled repaint.
+        
+        Args:
+        -----
+        value: New progress value (items done, or percentage for percentage-style dialogs)
+        message: Optional new progress message
+        bytes_done: Optional bytes processed so far, enables the bytes/s display
+        bytes_total: Optional total bytes expected, enables a byte-based ETA
+        eta_seconds: Optional estimate of the time remaining from the caller (eg the copy scheduler's, # v002.0023 added
+                     which knows the sizes still to copy), shown instead of the dialog's own ETA
+        """
+        with self._state_lock:
+            self._pending_value = value
+            if message:
+                self._pending_message = message
+            if bytes_done is not None:
+                self._bytes_done = bytes_done
+            if bytes_total is not None:
+                self._bytes_total = bytes_total
+            if eta_seconds is not None: # v002.0023 added
+                self._eta_seconds = eta_seconds
+                self._eta_time = time.time()
+            self._dirty = True
+        self._repaint_if_due()
+        
+    def _repaint_interval(self) -> float:
+        """Minimum seconds between repaints.""" # v002.0005 added
+        return 1.0 / max(1, C.PROGRESS_DIALOG_MAX_REPAINTS_PER_SECOND)
+        
+    def _repaint_if_due(self):
+        """Repaint immediately when called on the Tk thread and the repaint interval has elapsed.""" # v002.0005 added
+        # Updates from other threads, or inside the interval, are left for the periodic repaint
+        if threading.get_ident() != self._ui_thread_id:
+            return
+        if time.time() - self._last_repaint_time >= self._repaint_interval():
+            self._repaint()
+        
+    def _schedule_repaint(self):
+        """Schedule the next periodic repaint on the Tk event loop.""" # v002.0005 added
+        if self._closed:
+            return
+        try:
+            self._repaint_after_id = self.dialog.after(int(self._repaint_interval() * 1000), self._repaint_tick)
+        except tk.TclError:
+            self._repaint_after_id = None  # Dialog already destroyed
             
-        self.dialog.update_idletasks()
+    def _repaint_tick(self):
+        """Periodic repaint callback.""" # v002.0005 added
+        self._repaint_after_id = None
+        self._repaint()
+        self._schedule_repaint()
+        
+    def _repaint(self):
+        """Paint the latest recorded state, if anything changed since the last repaint.""" # v002.0005 added
+        with self._state_lock:
+            if not self._dirty or self._closed:
+                return
+            value = self._pending_value
+            message = self._pending_message
+            bytes_done = self._bytes_done
+            bytes_total = self._bytes_total
+            self._pending_value = None
+            self._pending_message = None
+            self._dirty = False
+        self._last_repaint_time = time.time()
+        
+        try:
+            if value is not None:
+                if self.max_value is not None:
+                    # Determinate progress
+                    self.current_value = value
+                    self.progress_bar['value'] = value
+                    percentage = int((value / self.max_value) * 100) if self.max_value > 0 else 0
+                    self.percent_var.set(f"{percentage}%")
+                else:
+                    # Indeterminate progress - update counter
+                    self.current_value = value
+                    self.count_var.set(f"{value:,} items")
+                    
+            if message:
+                self.message_var.set(message)
+                
+            self.rate_var.set(self._format_rate_and_eta(bytes_done, bytes_total))
+            self.dialog.update_idletasks()
+        except tk.TclError:
+            pass  # Dialog already destroyed
+        
+    def _format_rate_and_eta(self, bytes_done: Optional[int], bytes_total: Optional[int]) -> str:
+        """
+        Build the rate/ETA line from the average rate since the dialog was opened. # v002.0005 added
+        
+        Returns:
+        --------
+        str: eg "125 items/s  |  48.2 MB/s  |  ETA 0:01:23", or "" until enough time has elapsed
+        """
+        elapsed = time.time() - self._start_time
+        if elapsed < C.PROGRESS_RATE_MIN_ELAPSED_SECONDS or self.current_value <= 0:
+            return ""
+        parts = []
+        value_rate = self.current_value / elapsed
+        if self.rate_units:
+            parts.append(f"{value_rate:,.0f} {self.rate_units}/s" if value_rate >= 10 else f"{value_rate:,.1f} {self.rate_units}/s")
+        bytes_rate = None
+        if bytes_done:
+            bytes_rate = bytes_done / elapsed
+            parts.append(f"{ProgressDialog_class._format_bytes(bytes_rate)}/s")
+        
+        # ETA: prefer the caller's estimate (aged by the time since it was made), then bytes when the total # v002.0023 changed
+        # is known (file sizes vary), otherwise use the value
+        eta_seconds = None
+        if self._eta_seconds is not None:
+            eta_seconds = max(0.0, self._eta_seconds - (time.time() - self._eta_time))
+        elif bytes_rate and bytes_total:
+            eta_seconds = max(0.0, (bytes_total - bytes_done) / bytes_rate)
+        elif self.max_value and value_rate > 0:
+            eta_seconds = max(0.0, (self.max_value - self.current_value) / value_rate)
+        if eta_seconds is not None:
+            parts.append(f"ETA {str(timedelta(seconds=int(eta_seconds)))}")
+        return "  |  ".join(parts)
+        
+    @staticmethod
+    def _format_bytes(num_bytes: float) -> str:
+        """Format a byte count with binary units for the rate display.""" # v002.0005 added
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if num_bytes < 1024.0:
+                return f"{num_bytes:.1f} {unit}"
+            num_bytes /= 1024.0
+        return f"{num_bytes:.1f} TB"
         
     def close(self):
         """Close the progress dialog and clean up resources."""
         log_and_flush(logging.DEBUG, "Closing progress dialog")
+        with self._state_lock: # v002.0005 added [stop periodic repaints]
+            self._closed = True
         try:
+            if self._repaint_after_id is not None: # v002.0005 added [stop periodic repaints]
+                self.dialog.after_cancel(self._repaint_after_id)
+                self._repaint_after_id = None
             if hasattr(self, 'progress_bar'):
                 self.progress_bar.stop()  # Stop any animation
             self.dialog.grab_release()
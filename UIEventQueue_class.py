@@ -0,0 +1,211 @@
+# from __future__ imports MUST occur at the beginning of the file, annotations become strings resolved lazily
+from __future__ import annotations
+
+# import out global imports
+from FolderCompareSync_Global_Imports import *
+
+# import out global constants first
+import FolderCompareSync_Global_Constants as C
+
+# import our flushed_logging before other modules
+#from flushed_logging import *   # includes LoggerManager
+from flushed_logging import log_and_flush, get_log_level, LoggerManager
+
+# Import the things this class references
+# nil
+
+class UIEventQueue_class:
+    """
+    Thread-safe UI event bus which marshals worker-thread updates onto the Tk thread.
+
+    Purpose:
+    --------
+    Worker threads (comparison, copy, filtering) must never touch Tk widgets directly.
+    Instead they push typed events into this queue and the Tk thread drains it at a
+    fixed frame rate (UI_EVENT_DRAIN_INTERVAL_MS), applying the events in order.
+    Progress events are coalesced per progress dialog so that only the latest value
+    and message are painted once per frame, no matter how often workers post them.
+
+    Event Types:
+    ------------
+    - PROGRESS : latest (value, message) for a progress dialog, merged per dialog
+    - STATUS   : a status log line, consecutive lines are delivered as one batch
+    - CALL     : any callable to run on the Tk thread (completion, dialogs, UI rebuilds)
+
+    Usage:
+    ------
+    ui_events = UIEventQueue_class(root, status_callback=app.add_status_messages)
+    ui_events.start()
+    # ... from any worker thread:
+    ui_events.post_progress(progress, 50, "Comparing...")
+    ui_events.post_status("Left folder scan complete")
+    ui_events.post_call(app.update_comparison_ui)
+    ui_events.post_close(progress)
+    """
+
+    class UIEventType(Enum):
+        """Types of events which workers may post to the UI thread."""
+        PROGRESS = "progress"   # coalesced, held in the pending progress map rather than the FIFO queue
+        STATUS = "status"
+        CALL = "call"
+
+    def __init__(self, root, status_callback=None, drain_interval_ms: Optional[int] = None):
+        """
+        Initialize the UI event queue.
+
+        Args:
+        -----
+        root: Tk root window whose after() loop drains the queue
+        status_callback: Callable accepting a list of status message strings (run on the Tk thread)
+        drain_interval_ms: Drain interval override, defaults to C.UI_EVENT_DRAIN_INTERVAL_MS
+        """
+        self.root = root
+        self.status_callback = status_callback
+        self.drain_interval_ms = drain_interval_ms
+        self._events: queue.SimpleQueue = queue.SimpleQueue()   # FIFO of (UIEventType, payload) for STATUS and CALL
+        self._pending_progress: dict[int, list] = {}            # id(dialog) -> [dialog, value, message, bytes_done, bytes_total], latest wins
+        self._progress_lock = threading.Lock()
+        self._after_id = None
+        self._running = False
+
+        # Statistics for debugging how much traffic is being merged
+        self._progress_posted = 0
+        self._progress_applied = 0
+
+    def start(self):
+        """Start the periodic drain loop on the Tk thread (call from the Tk thread)."""
+        if self._running:
+            return
+        self._running = True
+        self._schedule_next_drain()
+        log_and_flush(logging.DEBUG, f"UIEventQueue_class started, drain interval {self._get_drain_interval_ms()} ms")
+
+    def stop(self):
+        """Stop the periodic drain loop, draining anything still queued first."""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # Root already destroyed
+            self._after_id = None
+        self.drain()
+        log_and_flush(logging.DEBUG, f"UIEventQueue_class stopped: {self._progress_posted} progress events posted, {self._progress_applied} applied")
+
+    # ---------- producer side (safe to call from any thread) ----------
+
+    def post_progress(self, progress_dialog, value=None, message=None, bytes_done=None, bytes_total=None, eta_seconds=None): # v002.0005 changed [byte counts for rate/ETA], v002.0023 changed [eta_seconds]
+        """
+        Post a progress update for a dialog, merging with any update not yet painted.
+
+        Args:
+        -----
+        progress_dialog: ProgressDialog_class instance to update
+        value: New progress value, or None to leave the value unchanged
+        message: New progress message, or None to leave the message unchanged
+        bytes_done: Bytes processed so far, or None to leave unchanged
+        bytes_total: Total bytes expected, or None to leave unchanged
+        eta_seconds: Caller's estimate of the time remaining, or None to leave unchanged # v002.0023 added
+        """
+        if progress_dialog is None:
+            return
+        with self._progress_lock:
+            self._progress_posted += 1
+            pending = self._pending_progress.get(id(progress_dialog))
+            if pending is None:
+                self._pending_progress[id(progress_dialog)] = [progress_dialog, value, message, bytes_done, bytes_total, eta_seconds]
+            else:
+                for index, new_value in ((1, value), (2, message), (3, bytes_done), (4, bytes_total), (5, eta_seconds)):
+                    if new_value is not None:
+                        pending[index] = new_value
+
+    def post_status(self, message: str):
+        """Post a status log line to be added on the Tk thread."""
+        self._events.put((UIEventQueue_class.UIEventType.STATUS, message))
+
+    def post_call(self, func):
+        """Post a callable (taking no arguments) to be run on the Tk thread."""
+        self._events.put((UIEventQueue_class.UIEventType.CALL, func))
+
+    def post_close(self, progress_dialog):
+        """Discard any unpainted progress for a dialog and close it on the Tk thread."""
+        if progress_dialog is None:
+            return
+        with self._progress_lock:
+            self._pending_progress.pop(id(progress_dialog), None)
+        self.post_call(progress_dialog.close)
+
+    # ---------- consumer side (Tk thread only) ----------
+
+    def drain(self):
+        """
+        Apply all pending events on the Tk thread.
+
+        Coalesced progress updates are applied first (latest state per dialog),
+        then STATUS and CALL events in the order they were posted, with runs of
+        consecutive STATUS lines delivered to status_callback as a single batch.
+        """
+        with self._progress_lock:
+            pending_progress = list(self._pending_progress.values())
+            self._pending_progress.clear()
+
+        for progress_dialog, value, message, bytes_done, bytes_total, eta_seconds in pending_progress:
+            try:
+                if value is not None:
+                    progress_dialog.update_progress(value, message, bytes_done=bytes_done, bytes_total=bytes_total, eta_seconds=eta_seconds)
+                elif message is not None:
+                    progress_dialog.update_message(message)
+                self._progress_applied += 1
+            except tk.TclError:
+                pass  # Dialog already destroyed
+            except Exception as e:
+                log_and_flush(logging.WARNING, f"UIEventQueue_class: progress update failed: {type(e).__name__}: {e}")
+
+        status_batch: list[str] = []
+        while True:
+            try:
+                event_type, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if event_type == UIEventQueue_class.UIEventType.STATUS:
+                status_batch.append(payload)
+                continue
+            # Preserve ordering: flush any status lines posted before this call
+            self._deliver_status_batch(status_batch)
+            status_batch = []
+            try:
+                payload()
+            except Exception as e:
+                log_and_flush(logging.ERROR, f"UIEventQueue_class: posted call failed: {type(e).__name__}: {e}")
+                if __debug__:
+                    log_and_flush(logging.DEBUG, traceback.format_exc())
+        self._deliver_status_batch(status_batch)
+
+    def _deliver_status_batch(self, messages: list[str]):
+        """Deliver a batch of status lines to the status callback."""
+        if not messages or not self.status_callback:
+            return
+        try:
+            self.status_callback(messages)
+        except Exception as e:
+            log_and_flush(logging.ERROR, f"UIEventQueue_class: status callback failed: {type(e).__name__}: {e}")
+
+    def _drain_tick(self):
+        """Periodic after() callback: drain then reschedule."""
+        self._after_id = None
+        try:
+            self.drain()
+        finally:
+            if self._running:
+                self._schedule_next_drain()
+
+    def _schedule_next_drain(self):
+        """Schedule the next drain on the Tk event loop."""
+        try:
+            self._after_id = self.root.after(self._get_drain_interval_ms(), self._drain_tick)
+        except tk.TclError:
+            self._running = False  # Root destroyed - nothing left to update
+
+    def _get_drain_interval_ms(self) -> int:
+        """Drain interval, read live from the global constants unless overridden."""
+        return int(self.drain_interval_ms if self.drain_interval_ms is not None else C.UI_EVENT_DRAIN_INTERVAL_MS)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+FolderCompareSync Copy Logging Benchmark
+Measures what the copy operation log costs when copying many small files.
+
+For each combination of COPY_LOG_ASYNC (a plain FileHandler written per line, or
+BatchedLogHandler_class writing from a background thread) and COPY_LOG_VERBOSITY
+("detailed" or "summary"), reports:
+- total wall-clock time of the copy and files per second
+- lines in the operation log
+- writes and flushes of the log file (background writer only)
+
+Every combination copies the same tree of small files into an empty target, through
+CopyPlan_class and CopyScheduler_class exactly as the application does, with small-file
+batching off (COPY_SMALL_FILE_BATCH_FILES = 1) so each file goes through copy_file and
+logs its own lines.
+
+Run from the repository root or the utility folder:
+    python utility/benchmark_copy_logging.py
+    python utility/benchmark_copy_logging.py --folder D:\\temp --file-count 20000
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Make the application modules importable when run from the utility folder
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import FolderCompareSync_Global_Constants as C
+from FileCopyManager_class import FileCopyManager_class
+from CopyPlan_class import CopyPlan_class
+from CopyScheduler_class import CopyScheduler_class
+
+# Configuration
+FILE_SIZE = 4 * 1024
+FILES_PER_FOLDER = 500
+
+
+def make_source_tree(root: str, file_count: int) -> list[str]:
+    """Create file_count small files, returning their relative paths (with their folders) in plan order."""
+    data = os.urandom(FILE_SIZE)
+    rel_paths = []
+    for index in range(file_count):
+        rel_folder = f"folder_{index // FILES_PER_FOLDER:03d}"
+        if index % FILES_PER_FOLDER == 0:
+            os.makedirs(os.path.join(root, rel_folder))
+            rel_paths.append(rel_folder)
+        rel_path = f"{rel_folder}/file_{index:06d}.bin"
+        with open(os.path.join(root, rel_path), 'wb') as f:
+            f.write(data)
+        rel_paths.append(rel_path)
+    return rel_paths
+
+
+def time_logging(source: str, target: str, rel_paths: list[str], log_async: bool, verbosity: str) -> tuple[float, int, int, int, int]:
+    """Copy the tree with one log configuration, returning (seconds, files copied, log lines, writes, flushes)."""
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    os.makedirs(target)
+    C.COPY_LOG_ASYNC = log_async
+    C.COPY_LOG_VERBOSITY = verbosity
+    copy_manager = FileCopyManager_class()
+    copy_manager.start_copy_operation(f"Logging benchmark (async {log_async}, {verbosity})")
+    handler = copy_manager.operation_logger.handlers[0]
+    log_path = copy_manager.operation_log_path
+    start = time.perf_counter()
+    plan = CopyPlan_class.from_paths(rel_paths, source, target)
+    summary = CopyScheduler_class(copy_manager, source, target).run_plan(plan)
+    elapsed = time.perf_counter() - start
+    copy_manager.end_copy_operation(summary.copied_count, summary.error_count, summary.total_bytes_copied)
+    if summary.error_count:
+        raise RuntimeError(f"{summary.error_count} errors copying with async {log_async}, {verbosity} verbosity")
+    with open(log_path, 'r', encoding='utf-8') as f:
+        line_count = sum(1 for _ in f)
+    return elapsed, summary.copied_count, line_count, getattr(handler, 'write_count', 0), getattr(handler, 'flush_count', 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the copy operation log configurations")
+    parser.add_argument("--folder", help="Folder to create the test trees in (default: system temp folder)")
+    parser.add_argument("--file-count", type=int, default=5000, help=f"Files of {FILE_SIZE // 1024} KB to generate (default 5000)")
+    args = parser.parse_args()
+
+    C.COPY_SMALL_FILE_BATCH_FILES = 1
+    print("=" * 80)
+    print("FolderCompareSync copy logging benchmark")
+    print(f"Python {sys.version.split()[0]} on {sys.platform}, {C.COPY_WORKER_COUNT} workers, "
+          f"batch {C.COPY_LOG_BATCH_LINES} lines, flush within {C.COPY_LOG_FLUSH_INTERVAL_SECONDS}s")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory(prefix="fcs_logging_bench_", dir=args.folder) as work:
+        source = os.path.join(work, "source")
+        target = os.path.join(work, "target")
+        print(f"Generating {args.file_count:,} files of {FILE_SIZE // 1024} KB in {source} ...\n")
+        rel_paths = make_source_tree(source, args.file_count)
+
+        header = f"{'log':>12} {'verbosity':>10} {'seconds':>10} {'files/s':>10} {'log lines':>10} {'writes':>8} {'flushes':>8}"
+        print(header)
+        print("-" * len(header))
+        for log_async in (False, True):
+            for verbosity in ("detailed", "summary"):
+                elapsed, copied, line_count, writes, flushes = time_logging(source, target, rel_paths, log_async, verbosity)
+                log_text = "background" if log_async else "per line"
+                print(f"{log_text:>12} {verbosity:>10} {elapsed:>10.2f} {copied / elapsed:>10.0f} {line_count:>10,} {writes:>8,} {flushes:>8,}")
+
+
+if __name__ == "__main__":
+    main()
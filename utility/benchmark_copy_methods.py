@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+FolderCompareSync Copy Method Benchmark
+Measures the throughput (MB/s) of each FileCopyManager_class copy engine method.
+
+Compares, per file size:
+- os.copy_file_range (in-kernel copy, Linux / recent Python only)
+- os.sendfile        (in-kernel copy between files, Linux only)
+- readinto loop      (large-buffer user-space copy, always available)
+- shutil.copyfile    (the standard library, as used by shutil.copy2 before v002.0010)
+
+File sizes match the performance test files made by utility/test_kit_generator.py
+(1MB to 1GB). Files are created in a temporary folder on the filesystem being
+measured; source files are read once beforehand so every method sees a warm cache.
+
+Run from the repository root or the utility folder:
+    python utility/benchmark_copy_methods.py
+    python utility/benchmark_copy_methods.py --folder D:\\temp --max-size-mb 100
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Make the application modules importable when run from the utility folder
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from FileCopyManager_class import FileCopyManager_class
+
+# Configuration - the performance test sizes from test_kit_generator.py
+FILE_SIZES = {
+    "1MB": 1024 * 1024,
+    "2MB": 2 * 1024 * 1024,
+    "10MB": 10 * 1024 * 1024,
+    "100MB": 100 * 1024 * 1024,
+    "500MB": 500 * 1024 * 1024,
+    "1GB": 1024 * 1024 * 1024,
+}
+REPEATS = 3
+WRITE_BLOCK = 4 * 1024 * 1024
+
+
+def make_source_file(path: str, size: int) -> None:
+    """Create a file of random-ish data (one random block repeated, so creation is fast)."""
+    block = os.urandom(min(WRITE_BLOCK, size))
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block)
+    with open(path, 'rb') as f:  # warm the page cache
+        while f.read(WRITE_BLOCK):
+            pass
+
+
+def copy_with_method(source: str, target: str, method) -> None:
+    """Copy using a single copy engine method."""
+    with open(source, 'rb', buffering=0) as s, open(target, 'wb', buffering=0) as d:
+        FileCopyManager_class.copy_file_data(s.fileno(), d.fileno(), os.fstat(s.fileno()).st_size, [method])
+
+
+def copy_with_shutil(source: str, target: str) -> None:
+    """Copy using shutil.copyfile."""
+    shutil.copyfile(source, target)
+
+
+def time_copy(func, source: str, target: str, size: int) -> float:
+    """Best MB/s over REPEATS runs (target removed before each run)."""
+    best = 0.0
+    for _ in range(REPEATS):
+        if os.path.exists(target):
+            os.remove(target)
+        start = time.perf_counter()
+        func(source, target)
+        elapsed = time.perf_counter() - start
+        if os.path.getsize(target) != size:
+            raise RuntimeError(f"size mismatch copying {source}")
+        best = max(best, size / (1024 * 1024) / max(elapsed, 1e-9))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FileCopyManager_class copy engine methods")
+    parser.add_argument("--folder", help="Folder to create the test files in (default: system temp folder)")
+    parser.add_argument("--max-size-mb", type=int, default=1024, help="Skip file sizes larger than this many MB (default 1024)")
+    args = parser.parse_args()
+
+    methods = FileCopyManager_class.available_copy_methods()
+    candidates = [(m.value, (lambda s, t, m=m: copy_with_method(s, t, m))) for m in methods]
+    candidates.append(("shutil.copyfile", copy_with_shutil))
+
+    print("=" * 80)
+    print("FolderCompareSync copy method benchmark")
+    print(f"Python {sys.version.split()[0]} on {sys.platform}, best of {REPEATS} runs, warm cache")
+    print(f"Available engine methods: {', '.join(m.value for m in methods)}")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory(prefix="fcs_copy_bench_", dir=args.folder) as work:
+        print(f"Working folder: {work}\n")
+        header = f"{'size':>8} " + " ".join(f"{name:>16}" for name, _ in candidates)
+        print(header)
+        print("-" * len(header))
+        for label, size in FILE_SIZES.items():
+            if size > args.max_size_mb * 1024 * 1024:
+                continue
+            source = os.path.join(work, f"source_{label}.bin")
+            target = os.path.join(work, f"target_{label}.bin")
+            make_source_file(source, size)
+            row = f"{label:>8} "
+            for name, func in candidates:
+                try:
+                    row += f"{time_copy(func, source, target, size):>11.1f} MB/s"
+                except OSError as e:
+                    row += f"{'n/a (' + str(e.errno) + ')':>16}"
+            print(row)
+            os.remove(source)
+            if os.path.exists(target):
+                os.remove(target)
+
+
+if __name__ == "__main__":
+    main()
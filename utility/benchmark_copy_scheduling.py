@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+FolderCompareSync Copy Scheduling Benchmark
+Measures the effect of each CopyScheduler_class schedule policy on a generated tree.
+
+For each policy (plan_order, largest_first, smallest_first, balanced), reports:
+- total wall-clock time of the copy
+- time until half of the items were done (how soon progress visibly moves)
+- the error of the time remaining estimate made half way through the copy
+  (estimate_remaining_seconds, against the actual time the copy then took)
+
+The generated tree mixes many small files with a few large ones, with the large files
+last in plan (selection) order - the case where plan order leaves a long tail. Every
+policy copies the same tree into an empty target, through CopyPlan_class and
+CopyScheduler_class exactly as the application does. Each run writes its own copy
+operation log, as the application would.
+
+Run from the repository root or the utility folder:
+    python utility/benchmark_copy_scheduling.py
+    python utility/benchmark_copy_scheduling.py --folder D:\\temp --large-count 4 --large-mb 500
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+# Make the application modules importable when run from the utility folder
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import FolderCompareSync_Global_Constants as C
+from FileCopyManager_class import FileCopyManager_class
+from CopyPlan_class import CopyPlan_class
+from CopyScheduler_class import CopyScheduler_class
+
+# Configuration
+RANDOM_SEED = 12345
+SMALL_FILE_SIZES = (4 * 1024, 64 * 1024, 512 * 1024, 2 * 1024 * 1024)
+WRITE_BLOCK = 4 * 1024 * 1024
+
+
+def make_source_tree(root: str, small_count: int, large_count: int, large_size: int) -> list[str]:
+    """Create the tree, returning its relative paths in plan order (small files first, large files last)."""
+    rng = random.Random(RANDOM_SEED)
+    block = os.urandom(WRITE_BLOCK)
+    rel_paths = []
+    for index in range(small_count):
+        rel_folder = f"small_{index // 200:03d}"
+        if index % 200 == 0:
+            os.makedirs(os.path.join(root, rel_folder))
+            rel_paths.append(rel_folder)
+        rel_path = f"{rel_folder}/file_{index:05d}.bin"
+        with open(os.path.join(root, rel_path), 'wb') as f:
+            f.write(block[:rng.choice(SMALL_FILE_SIZES)])
+        rel_paths.append(rel_path)
+    os.makedirs(os.path.join(root, "large"))
+    rel_paths.append("large")
+    for index in range(large_count):
+        rel_path = f"large/large_{index:02d}.bin"
+        with open(os.path.join(root, rel_path), 'wb') as f:
+            remaining = large_size
+            while remaining > 0:
+                f.write(block[:remaining])
+                remaining -= len(block)
+        rel_paths.append(rel_path)
+    return rel_paths
+
+
+def time_policy(source: str, target: str, rel_paths: list[str], policy: str) -> tuple[float, float, float]:
+    """Copy the tree with one policy, returning (seconds, seconds to half the items, ETA error % half way through)."""
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    os.makedirs(target)
+    copy_manager = FileCopyManager_class()
+    copy_manager.start_copy_operation(f"Scheduling benchmark ({policy})")
+    start = time.perf_counter()
+    plan = CopyPlan_class.from_paths(rel_paths, source, target)
+    half_items = []
+    estimates = []   # (time, estimated seconds remaining), sampled at most every 50 ms
+
+    def on_progress(completed, message, bytes_done):
+        now = time.perf_counter()
+        if not half_items and completed * 2 >= plan.item_count:
+            half_items.append(now)
+        if not estimates or now - estimates[-1][0] >= 0.05:
+            estimate = scheduler.estimate_remaining_seconds()
+            if estimate is not None:
+                estimates.append((now, estimate))
+
+    scheduler = CopyScheduler_class(copy_manager, source, target, progress_callback=on_progress, schedule_policy=policy)
+    summary = scheduler.run_plan(plan)
+    end = time.perf_counter()
+    copy_manager.end_copy_operation(summary.copied_count, summary.error_count, summary.total_bytes_copied)
+    if summary.error_count:
+        raise RuntimeError(f"{summary.error_count} errors copying with the {policy} policy")
+    eta_error = float('nan')
+    half_way = [(mark_time, estimate) for mark_time, estimate in estimates if mark_time >= start + (end - start) / 2]
+    if half_way:
+        mark_time, estimate = half_way[0]
+        actual = end - mark_time
+        eta_error = (estimate - actual) / max(actual, 1e-9) * 100
+    return end - start, (half_items[0] if half_items else end) - start, eta_error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CopyScheduler_class schedule policies")
+    parser.add_argument("--folder", help="Folder to create the test trees in (default: system temp folder)")
+    parser.add_argument("--small-count", type=int, default=5000, help="Small files (4 KB to 2 MB) to generate (default 5000)")
+    parser.add_argument("--large-count", type=int, default=3, help="Large files to generate (default 3)")
+    parser.add_argument("--large-mb", type=int, default=256, help="Size of each large file in MB (default 256)")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("FolderCompareSync copy scheduling benchmark")
+    print(f"Python {sys.version.split()[0]} on {sys.platform}, {C.COPY_WORKER_COUNT} workers "
+          f"(max {C.COPY_MAX_WORKERS_PER_DEVICE_PAIR} per device pair), durability policy {C.COPY_DURABILITY_POLICY}")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory(prefix="fcs_schedule_bench_", dir=args.folder) as work:
+        source = os.path.join(work, "source")
+        target = os.path.join(work, "target")
+        print(f"Generating {args.small_count:,} small files and {args.large_count} files of {args.large_mb} MB in {source} ...\n")
+        rel_paths = make_source_tree(source, args.small_count, args.large_count, args.large_mb * 1024 * 1024)
+
+        header = f"{'policy':>16} {'seconds':>10} {'half items':>12} {'ETA error half way':>20}"
+        print(header)
+        print("-" * len(header))
+        for policy in CopyScheduler_class.SchedulePolicy:
+            elapsed, half_items, eta_error = time_policy(source, target, rel_paths, policy.value)
+            print(f"{policy.value:>16} {elapsed:>10.2f} {half_items:>11.2f}s {eta_error:>+19.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+FolderCompareSync Small File Copy Benchmark
+Measures copy throughput (files/s) for a tree of many tiny files, with and without small-file batching.
+
+Compares, for the same tree:
+- per file: every file through FileCopyManager_class.copy_file (COPY_SMALL_FILE_BATCH_FILES = 1,
+  as before v002.0022)
+- batched:  small files copied by copy_small_file_batch in batches per target folder
+  (COPY_SMALL_FILE_BATCH_FILES from FolderCompareSync_Global_Constants)
+
+Both runs go through CopyPlan_class and CopyScheduler_class exactly as the application
+does, with the configured worker count and durability policy. By default a tree of
+50,000 files of 4 KB (the test kit's small file size) is generated in a temporary folder;
+--source copies an existing tree instead, eg a folder made by utility/test_kit_generator.py.
+Each run writes its own copy operation log, as the application would.
+
+Run from the repository root or the utility folder:
+    python utility/benchmark_small_file_copy.py
+    python utility/benchmark_small_file_copy.py --folder D:\\temp --files 20000
+    python utility/benchmark_small_file_copy.py --source D:\\FolderCompareSync_TestKit\\left
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Make the application modules importable when run from the utility folder
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import FolderCompareSync_Global_Constants as C
+from FileCopyManager_class import FileCopyManager_class
+from CopyPlan_class import CopyPlan_class
+from CopyScheduler_class import CopyScheduler_class
+
+# Configuration
+DEFAULT_FILE_COUNT = 50_000
+DEFAULT_FILE_SIZE = 4096
+DEFAULT_FILES_PER_FOLDER = 500
+
+
+def make_source_tree(root: str, file_count: int, file_size: int, files_per_folder: int) -> None:
+    """Create file_count files of file_size bytes, files_per_folder to a folder."""
+    content = os.urandom(file_size)
+    for index in range(file_count):
+        folder = os.path.join(root, f"folder_{index // files_per_folder:04d}")
+        if index % files_per_folder == 0:
+            os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"file_{index:06d}.bin"), 'wb') as f:
+            f.write(content)
+
+
+def list_tree(root: str) -> list[str]:
+    """Relative paths of every folder and file under root (folders before their contents), '/' separated."""
+    rel_paths = []
+    for folder, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        rel_folder = os.path.relpath(folder, root)
+        for name in dir_names + sorted(file_names):
+            rel_paths.append(name if rel_folder == '.' else f"{rel_folder}/{name}".replace(os.sep, '/'))
+    return rel_paths
+
+
+def time_copy(source: str, target: str, rel_paths: list[str], batch_files: int) -> tuple[float, CopyScheduler_class.CopySummary]:
+    """Copy the tree with the given batch size into an empty target, returning (seconds, summary)."""
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    os.makedirs(target)
+    C.COPY_SMALL_FILE_BATCH_FILES = batch_files
+    copy_manager = FileCopyManager_class()
+    copy_manager.start_copy_operation(f"Small file benchmark (batch of {batch_files})")
+    start = time.perf_counter()
+    plan = CopyPlan_class.from_paths(rel_paths, source, target)
+    summary = CopyScheduler_class(copy_manager, source, target).run_plan(plan)
+    copy_manager.end_copy_operation(summary.copied_count, summary.error_count, summary.total_bytes_copied)
+    elapsed = time.perf_counter() - start
+    if summary.error_count:
+        raise RuntimeError(f"{summary.error_count} errors copying with a batch of {batch_files}")
+    return elapsed, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark small-file copying with and without batching")
+    parser.add_argument("--folder", help="Folder to create the test trees in (default: system temp folder)")
+    parser.add_argument("--source", help="Existing tree to copy (default: generate one)")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILE_COUNT, help=f"Files to generate (default {DEFAULT_FILE_COUNT:,})")
+    parser.add_argument("--size", type=int, default=DEFAULT_FILE_SIZE, help=f"Bytes per generated file (default {DEFAULT_FILE_SIZE})")
+    parser.add_argument("--files-per-folder", type=int, default=DEFAULT_FILES_PER_FOLDER,
+                        help=f"Generated files per folder (default {DEFAULT_FILES_PER_FOLDER})")
+    args = parser.parse_args()
+
+    configured_batch = max(2, C.COPY_SMALL_FILE_BATCH_FILES)
+    print("=" * 80)
+    print("FolderCompareSync small file copy benchmark")
+    print(f"Python {sys.version.split()[0]} on {sys.platform}, {C.COPY_WORKER_COUNT} workers, "
+          f"durability policy {C.COPY_DURABILITY_POLICY}, small file threshold {C.COPY_SMALL_FILE_THRESHOLD:,} bytes")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory(prefix="fcs_small_bench_", dir=args.folder) as work:
+        source = args.source
+        if not source:
+            source = os.path.join(work, "source")
+            print(f"Generating {args.files:,} files of {args.size:,} bytes in {source} ...")
+            make_source_tree(source, args.files, args.size, args.files_per_folder)
+        rel_paths = list_tree(source)
+        target = os.path.join(work, "target")
+        print(f"Copying {len(rel_paths):,} items from {source}\n")
+
+        header = f"{'mode':>24} {'seconds':>10} {'files/s':>12} {'MB/s':>10} {'copied':>10}"
+        print(header)
+        print("-" * len(header))
+        for label, batch_files in (("per file", 1), (f"batched ({configured_batch})", configured_batch)):
+            elapsed, summary = time_copy(source, target, rel_paths, batch_files)
+            megabytes = summary.total_bytes_copied / (1024 * 1024)
+            print(f"{label:>24} {elapsed:>10.2f} {summary.copied_count / max(elapsed, 1e-9):>12,.0f} "
+                  f"{megabytes / max(elapsed, 1e-9):>10.1f} {summary.copied_count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+FolderCompareSync Tree Formatting Benchmark
+Measures the cost of rendering the size/date_created/date_modified/sha512 cells of tree rows.
+
+Compares, per 100k rows:
+- Uncached rendering (strftime with microseconds + size formatting for every cell, as before v002.0006)
+- DisplayFormatter_class LRU caches, cold (first tree build) and warm (values seen before)
+- DisplayFormatter_class per-record memo (a rebuild after filter / clear filter / refresh)
+
+Rows are synthetic file metadata records with realistic distributions: many distinct
+modification timestamps, created timestamps shared by files copied together, and
+sizes clustered around common values.
+
+Run from the repository root or the utility folder:
+    python utility/benchmark_tree_formatting.py
+"""
+
+import os
+import sys
+import time
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Make the application modules importable when run from the utility folder
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from DisplayFormatter_class import DisplayFormatter_class
+
+# Configuration
+ROW_COUNTS = [10_000, 100_000]
+REPEATS = 3
+RANDOM_SEED = 12345
+
+
+@dataclass
+class BenchmarkMetadata:
+    """Minimal stand-in for FolderCompareSync_class.FileMetadata_class (display fields only)."""
+    size: Optional[int]
+    date_created: Optional[datetime]
+    date_modified: Optional[datetime]
+    sha512: Optional[str]
+    display_values: Optional[tuple] = field(default=None, repr=False, compare=False)
+
+
+def make_rows(count: int) -> list[BenchmarkMetadata]:
+    """Create synthetic metadata rows."""
+    rng = random.Random(RANDOM_SEED)
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    created_batches = [base + timedelta(seconds=rng.randint(0, 86400 * 365), microseconds=rng.randint(0, 999999))
+                       for _ in range(max(1, count // 50))]
+    common_sizes = [0, 1024, 4096, 65536, 1024 * 1024]
+    rows = []
+    for i in range(count):
+        size = rng.choice(common_sizes) if rng.random() < 0.3 else rng.randint(1, 4 * 1024 * 1024 * 1024)
+        rows.append(BenchmarkMetadata(
+            size=size,
+            date_created=rng.choice(created_batches),
+            date_modified=base + timedelta(seconds=rng.randint(0, 86400 * 365), microseconds=rng.randint(0, 999999)),
+            sha512=f"{rng.getrandbits(512):0128x}" if rng.random() < 0.5 else None,
+        ))
+    return rows
+
+
+def render_uncached(rows: list[BenchmarkMetadata]) -> None:
+    """Render every cell from scratch, as populate_tree did before memoization."""
+    for m in rows:
+        size_str = DisplayFormatter_class._format_size_cached.__wrapped__(m.size) if m.size else ""
+        created_str = DisplayFormatter_class._render_timestamp(m.date_created, False, True)
+        modified_str = DisplayFormatter_class._render_timestamp(m.date_modified, False, True)
+        sha512_str = m.sha512[:16] + "..." if m.sha512 else ""
+
+
+def render_lru(rows: list[BenchmarkMetadata]) -> None:
+    """Render every cell through the shared LRU caches (no per-record memo)."""
+    for m in rows:
+        size_str = DisplayFormatter_class.format_size(m.size) if m.size else ""
+        created_str = DisplayFormatter_class.format_timestamp(m.date_created, include_timezone=False)
+        modified_str = DisplayFormatter_class.format_timestamp(m.date_modified, include_timezone=False)
+        sha512_str = m.sha512[:16] + "..." if m.sha512 else ""
+
+
+def render_memo(rows: list[BenchmarkMetadata]) -> None:
+    """Render rows through the per-record memo, as populate_tree does."""
+    for m in rows:
+        DisplayFormatter_class.file_row_values(m)
+
+
+def time_it(func, rows) -> float:
+    """Return elapsed seconds for one pass."""
+    start = time.perf_counter()
+    func(rows)
+    return time.perf_counter() - start
+
+
+def per_100k(seconds: float, count: int) -> str:
+    """Format a timing normalised to 100k rows."""
+    return f"{(seconds * 100_000 / count) * 1000:9.1f} ms / 100k rows"
+
+
+def main():
+    print("=" * 80)
+    print("FolderCompareSync tree row formatting benchmark")
+    print(f"Python {sys.version.split()[0]} on {sys.platform}, best of {REPEATS} runs")
+    print("=" * 80)
+    for count in ROW_COUNTS:
+        print(f"\n{count:,} rows:")
+
+        # Uncached baseline
+        rows = make_rows(count)
+        best = min(time_it(render_uncached, rows) for _ in range(REPEATS))
+        print(f"  uncached rendering            : {per_100k(best, count)}")
+
+        # LRU, cold: caches cleared before every run
+        cold = []
+        for _ in range(REPEATS):
+            DisplayFormatter_class.clear_caches()
+            cold.append(time_it(render_lru, rows))
+        print(f"  LRU caches, cold (first build): {per_100k(min(cold), count)}")
+
+        # LRU, warm: values already cached by the previous pass
+        best = min(time_it(render_lru, rows) for _ in range(REPEATS))
+        print(f"  LRU caches, warm              : {per_100k(best, count)}")
+
+        # Per-record memo: first build then rebuilds
+        DisplayFormatter_class.clear_caches()
+        rows = make_rows(count)
+        first = time_it(render_memo, rows)
+        best = min(time_it(render_memo, rows) for _ in range(REPEATS))
+        print(f"  per-record memo, first build  : {per_100k(first, count)}")
+        print(f"  per-record memo, rebuild      : {per_100k(best, count)}")
+        print(f"  {DisplayFormatter_class.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()